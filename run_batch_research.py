@@ -0,0 +1,118 @@
+"""Script to run deep research on every prompt of a JSONL file or stdin.
+
+Usage:
+    python run_batch_research.py prompts.jsonl --output results.jsonl
+    cat prompts.jsonl | python run_batch_research.py - -o results.jsonl --rate 5
+"""
+
+import argparse
+import logging
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from src.ai.batch import BatchResearch, ProviderLimits, completed_lines, read_prompts
+from src.ai.clients import ClientConfig, close_clients, configure_clients
+from src.ai.research import DEFAULT_DEADLINE_SECONDS, QUERIES
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run deep research on a stream of prompts"
+    )
+    parser.add_argument(
+        "input",
+        help='JSONL file of {"prompt": ..., "id": ...} objects or strings; - for stdin',
+    )
+    parser.add_argument(
+        "--output", "-o", required=True, help="JSONL file results are appended to"
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Overwrite the output instead of resuming after its completed lines",
+    )
+    parser.add_argument(
+        "--providers",
+        nargs="+",
+        choices=list(QUERIES),
+        help="Providers to query (default: all)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=ProviderLimits.concurrency,
+        help="Requests in flight per provider (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=ProviderLimits.rate,
+        help="Starting requests per second per provider (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        default=ProviderLimits.max_rate,
+        help="Requests per second the rate may grow to (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=DEFAULT_DEADLINE_SECONDS,
+        help="Seconds each provider request may take (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Query every provider even if the prompt was answered before",
+    )
+    args = parser.parse_args()
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    limits = ProviderLimits(
+        concurrency=args.concurrency,
+        rate=args.rate,
+        max_rate=max(args.rate, args.max_rate),
+        burst=args.concurrency,
+    )
+    providers = args.providers or list(QUERIES)
+    runner = BatchResearch(
+        {name: limits for name in providers},
+        providers=providers,
+        deadline=args.deadline,
+        use_cache=not args.no_cache,
+    )
+    configure_clients(ClientConfig(pool_size=max(10, args.concurrency)))
+
+    output = Path(args.output)
+    skip = set() if args.restart else completed_lines(output)
+    try:
+        with ExitStack() as stack:
+            if args.input == "-":
+                source = sys.stdin
+            else:
+                source = stack.enter_context(open(args.input, "r", encoding="utf-8"))
+            sink = stack.enter_context(
+                open(output, "w" if args.restart else "a", encoding="utf-8")
+            )
+            report = runner.run(read_prompts(source), sink, skip)
+    except KeyboardInterrupt:
+        logging.warning(f"Interrupted; rerun to resume after the lines in {output}")
+        sys.exit(130)
+    except (OSError, ValueError) as e:
+        logging.error(str(e))
+        sys.exit(1)
+    finally:
+        close_clients()
+
+    logging.info(report.summary())
+    if report.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,50 @@
 """Script to run deep research analysis on a given topic."""
 
+import argparse
+
 from dotenv import load_dotenv
 
-from src.ai.research import deep_research
+from src.ai.cache import get_cache
+from src.ai.clients import close_clients
+from src.ai.research import deep_research, deep_research_stream
+
+
+def print_results(results: dict) -> None:
+    """Print each provider's complete answer."""
+    print("\nResearch Results:")
+    print("=" * 50)
+    for key, value in results.items():
+        print(f"\n{key}:")
+        print("-" * 30)
+        print(value)
+
+
+def print_stream(prompt: str, use_cache: bool) -> None:
+    """Print answers chunk by chunk, labelling each switch of provider."""
+    current = None
+    for provider, chunk in deep_research_stream(prompt, use_cache=use_cache):
+        if provider != current:
+            print(f"\n\n[{provider}] ", end="")
+            current = provider
+        print(chunk, end="", flush=True)
+    print()
 
 
 def main() -> None:
     """Run the deep research analysis."""
+    parser = argparse.ArgumentParser(description="Run deep research on a topic")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Query every provider even if the prompt was answered before",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print answers as they are generated, interleaved across providers",
+    )
+    args = parser.parse_args()
+
     load_dotenv()
     prompt = (
         "The Cursor Development System is a modern, open-source project scaffolding tool for Python, JavaScript, and "
@@ -15,13 +53,21 @@ def main() -> None:
         "templates or scaffolding tools like Create React App, Yeoman, Cookiecutter, or Nx? What are its strengths and "
         "weaknesses for professional developers?"
     )
-    results = deep_research(prompt)
-    print("\nResearch Results:")
-    print("=" * 50)
-    for key, value in results.items():
-        print(f"\n{key}:")
-        print("-" * 30)
-        print(value)
+    try:
+        if args.stream:
+            print_stream(prompt, use_cache=not args.no_cache)
+        else:
+            print_results(deep_research(prompt, use_cache=not args.no_cache))
+    finally:
+        close_clients()
+
+    cache = get_cache()
+    if cache is not None and not args.no_cache:
+        stats = cache.stats()
+        print(
+            f"\nCache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({cache.path})"
+        )
 
 
 if __name__ == "__main__":
@@ -98,7 +98,7 @@ def run_dev_server() -> None:
     env_manager.load_global_env()
 
     # Start the server
-    subprocess.run(["python", "src/main.py", "run-dev"])
+    subprocess.run([sys.executable, "-m", "src.web", "--reload"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,228 @@
+"""Local mock of an AI provider API for client benchmarks.
+
+Answers every POST with a small JSON completion over HTTP/1.1 keep-alive,
+optionally behind TLS with a throwaway self-signed certificate, so the cost
+of connection setup can be measured without calling a real provider. It can
+also add latency and answer the first requests with 503 + Retry-After, to
+exercise retries and hedging, and generate answers token by token, streamed
+as server-sent events when the request body sets "stream": true.
+"""
+
+import json
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Type
+
+TOKEN = "mock "
+
+
+def response_body(text: str) -> bytes:
+    """Return a completion in every provider's response shape."""
+    return json.dumps(
+        {
+            "content": [{"text": text}],
+            "choices": [{"text": text}],
+            "candidates": [{"output": text}],
+        }
+    ).encode()
+
+
+def stream_event(event: str, text: Optional[str] = None) -> bytes:
+    """Return a server-sent event in the Anthropic and OpenAI-style shapes."""
+    data: Dict[str, Any] = {"type": event}
+    if text is not None:
+        data["delta"] = {"type": "text_delta", "text": text}
+        data["choices"] = [{"delta": {"content": text}}]
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Replies to every POST with a completion of the configured tokens."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle's algorithm on,
+    # every keep-alive response would wait for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        """Read the request body and send the canned completion."""
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        mock: "MockProviderServer" = self.server.mock  # type: ignore[attr-defined]
+        if mock.latency is not None:
+            time.sleep(mock.latency())
+        if mock._count_request() <= mock.fail_first:
+            self.send_response(503)
+            self.send_header("Retry-After", mock.retry_after)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if json.loads(body or b"{}").get("stream"):
+            self._stream(mock)
+            return
+
+        time.sleep(mock.tokens * mock.token_interval)
+        payload = response_body(TOKEN * mock.tokens)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _stream(self, mock: "MockProviderServer") -> None:
+        """Send the tokens as server-sent events with chunked encoding."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        events = [stream_event("message_start")]
+        events += [stream_event("content_block_delta", TOKEN)] * mock.tokens
+        events.append(stream_event("message_stop"))
+        for index, event in enumerate(events):
+            if 0 < index <= mock.tokens:
+                time.sleep(mock.token_interval)
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(event), event))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Keep request logs out of benchmark output."""
+
+
+class _Server(ThreadingHTTPServer):
+    """Threaded server that ignores clients hanging up mid-response."""
+
+    daemon_threads = True
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        """Ignore disconnects, e.g. the losing copy of a hedged request."""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)  # type: ignore[arg-type]
+
+
+def tls_available() -> bool:
+    """Return whether a self-signed certificate can be generated."""
+    return shutil.which("openssl") is not None
+
+
+class MockProviderServer:
+    """Threaded mock provider listening on a free localhost port."""
+
+    def __init__(
+        self,
+        tls: bool = False,
+        latency: Optional[Callable[[], float]] = None,
+        fail_first: int = 0,
+        retry_after: str = "0",
+        tokens: int = 2,
+        token_interval: float = 0.0,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            tls: Serve HTTPS with a self-signed certificate (needs openssl)
+            latency: Returns the seconds to wait before each answer
+            fail_first: Requests answered with 503 before the first success
+            retry_after: Retry-After header sent with the 503 answers
+            tokens: Tokens in every answer
+            token_interval: Seconds spent generating each token
+        """
+        self.tls = tls
+        self.latency = latency
+        self.fail_first = fail_first
+        self.retry_after = retry_after
+        self.tokens = tokens
+        self.token_interval = token_interval
+        self.requests = 0
+        self._count_lock = threading.Lock()
+        self.cert_file: Optional[str] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._cert_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the running server."""
+        assert self._server is not None, "server is not running"
+        scheme = "https" if self.tls else "http"
+        return f"{scheme}://localhost:{self._server.server_address[1]}"
+
+    def _count_request(self) -> int:
+        """Count a request and return its number, starting at 1."""
+        with self._count_lock:
+            self.requests += 1
+            return self.requests
+
+    def _make_certificate(self) -> ssl.SSLContext:
+        """Generate a self-signed localhost certificate."""
+        self._cert_dir = tempfile.TemporaryDirectory(prefix="mock-provider-")
+        cert = Path(self._cert_dir.name) / "cert.pem"
+        key = Path(self._cert_dir.name) / "key.pem"
+        subprocess.run(
+            [
+                "openssl",
+                "req",
+                "-x509",
+                "-newkey",
+                "rsa:2048",
+                "-nodes",
+                "-days",
+                "1",
+                "-subj",
+                "/CN=localhost",
+                "-addext",
+                "subjectAltName=DNS:localhost",
+                "-keyout",
+                str(key),
+                "-out",
+                str(cert),
+            ],
+            check=True,
+            capture_output=True,
+        )
+        self.cert_file = str(cert)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        return context
+
+    def start(self) -> "MockProviderServer":
+        """Start serving on a background thread."""
+        server = _Server(("localhost", 0), _Handler)
+        server.mock = self  # type: ignore[attr-defined]
+        if self.tls:
+            server.socket = self._make_certificate().wrap_socket(
+                server.socket, server_side=True
+            )
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and remove its certificate."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._cert_dir is not None:
+            self._cert_dir.cleanup()
+            self._cert_dir = None
+
+    def __enter__(self) -> "MockProviderServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop the server."""
+        self.stop()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Push global .env changes to generated projects.
+
+Diffs each project's .env and .env.example against the global .env and
+rewrites only the files that differ, on a thread pool.
+
+Usage:
+    python scripts/sync_env.py ./projects [--workers 16] [--dry-run]
+    python scripts/sync_env.py --index projects.toml
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.env_manager import EnvManager  # noqa: E402
+from src.core.env_sync import EnvSync, find_projects, load_project_index  # noqa: E402
+
+
+def main() -> None:
+    """Run the sync command."""
+    parser = argparse.ArgumentParser(
+        description="Push global .env changes to generated projects"
+    )
+    parser.add_argument(
+        "root", nargs="?", help="Directory holding generated projects, or a project"
+    )
+    parser.add_argument(
+        "--index",
+        type=str,
+        help="Scaffolding manifest or file listing one project directory per line",
+    )
+    parser.add_argument(
+        "--workers", "-w", type=int, help="Worker threads (default: CPU count + 4)"
+    )
+    parser.add_argument(
+        "--env-dir",
+        type=str,
+        help="Directory of the global .env (default: ~/.cursor/env)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report changes without writing"
+    )
+    args = parser.parse_args()
+    if bool(args.root) == bool(args.index):
+        parser.error("pass either a root directory or --index")
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    try:
+        if args.index:
+            projects = load_project_index(Path(args.index))
+        else:
+            projects = find_projects(Path(args.root))
+        env_manager = EnvManager(Path(args.env_dir) if args.env_dir else None)
+        report = EnvSync(env_manager, dry_run=args.dry_run).run(projects, args.workers)
+    except (OSError, ValueError) as e:
+        logging.error(str(e))
+        sys.exit(1)
+
+    for project in report.projects:
+        if project.error:
+            logging.error(f"{project.project_dir}: {project.error}")
+        for name, keys in project.changed.items():
+            action = "created" if name in project.created else f"{len(keys)} keys"
+            logging.info(f"{project.project_dir / name}: {action}")
+    logging.info(report.summary())
+    if report.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
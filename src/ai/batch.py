@@ -0,0 +1,414 @@
+"""Batch deep research over a stream of prompts with adaptive rate control."""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Mapping, Optional, Set
+
+from .clients import get_client
+from .research import DEFAULT_DEADLINE_SECONDS, QUERIES, cached_answer
+
+logger = logging.getLogger("research_batch")
+
+# Times a provider request is sent while the provider keeps answering 429
+THROTTLED_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """Concurrency and request rate allowed against one provider."""
+
+    # Requests in flight at once
+    concurrency: int = 4
+    # Requests per second to start at, and the bounds AIMD keeps it within
+    rate: float = 2.0
+    min_rate: float = 0.1
+    max_rate: float = 50.0
+    # Requests that may be sent at once after an idle period
+    burst: int = 4
+    # Requests per second added for each second of throttle-free traffic
+    increase: float = 0.5
+    # Factor the rate is multiplied by when the provider answers 429
+    decrease: float = 0.5
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose rate adapts to provider throttling (AIMD).
+
+    Every request that completes without a 429 raises the rate additively,
+    by ``increase / rate``, so it grows by about ``increase`` requests per
+    second for each second of traffic. A 429 multiplies it by ``decrease``
+    and empties the bucket. Like TCP congestion control, only requests sent
+    after the last decrease can cause another one, so a burst of 429s from
+    requests that were already in flight counts once.
+    """
+
+    def __init__(self, limits: Optional[ProviderLimits] = None) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            limits: Starting rate, bounds and AIMD factors (defaults to
+                ProviderLimits())
+        """
+        self.limits = limits or ProviderLimits()
+        self.rate = min(
+            max(self.limits.rate, self.limits.min_rate), self.limits.max_rate
+        )
+        self.burst = max(1, self.limits.burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.decreases = 0
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, waiting for one if the bucket is empty.
+
+        Blocks the calling thread; call it from a worker thread.
+
+        Returns:
+            Monotonic time the token was taken, to pass to ``record()``
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return now
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def record(self, sent: float, throttled: bool) -> None:
+        """Adapt the rate to the outcome of a request.
+
+        Args:
+            sent: Time the request's token was taken
+            throttled: Whether the provider answered 429
+        """
+        limits = self.limits
+        with self._lock:
+            if not throttled:
+                self.rate = min(
+                    limits.max_rate, self.rate + limits.increase / self.rate
+                )
+            elif sent >= self._last_decrease:
+                self.rate = max(limits.min_rate, self.rate * limits.decrease)
+                self.tokens = 0.0
+                self._last_decrease = time.monotonic()
+                self.decreases += 1
+                logger.info(f"Throttled, lowering rate to {self.rate:.2f}/s")
+
+
+@dataclass
+class PromptJob:
+    """One input line being researched."""
+
+    line: int
+    prompt: str
+    id: Any = None
+    results: Dict[str, Optional[str]] = field(default_factory=dict)
+    started: float = field(default_factory=time.perf_counter)
+    pending: int = 0
+
+
+@dataclass
+class BatchResearchReport:
+    """Aggregated outcome of a batch research run."""
+
+    completed: int = 0
+    # Lines with at least one provider error
+    failed: int = 0
+    # Lines skipped because an earlier run already completed them
+    resumed: int = 0
+    wall_time: float = 0.0
+    # Provider name to the 429 answers seen and the final request rate
+    throttled: Dict[str, int] = field(default_factory=dict)
+    rates: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Return prompts completed per second of wall time."""
+        if self.wall_time <= 0:
+            return 0.0
+        return self.completed / self.wall_time
+
+    def summary(self) -> str:
+        """Return a one-line summary."""
+        providers = ", ".join(
+            f"{name} {self.rates[name]:.2f}/s ({self.throttled.get(name, 0)} throttled)"
+            for name in self.rates
+        )
+        return (
+            f"{self.completed} prompts ({self.failed} with errors, {self.resumed} "
+            f"resumed) in {self.wall_time:.2f}s: {self.throughput:.2f} prompts/sec; "
+            f"{providers}"
+        )
+
+
+def read_prompts(stream: IO[str]) -> Iterator[PromptJob]:
+    """Parse prompts from JSON lines as they are read.
+
+    A line holds an object with a "prompt" and an optional "id", or a JSON
+    string. Blank lines are skipped but still counted, so line numbers
+    match the input file.
+
+    Args:
+        stream: Text stream of JSON lines, e.g. a file or stdin
+
+    Yields:
+        A job per prompt, numbered by input line starting at 1
+
+    Raises:
+        ValueError: If a line is not a prompt
+    """
+    for line, text in enumerate(stream, 1):
+        if not text.strip():
+            continue
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line}: invalid JSON: {e}") from None
+        if isinstance(item, str):
+            yield PromptJob(line, item)
+        elif isinstance(item, dict) and isinstance(item.get("prompt"), str):
+            yield PromptJob(line, item["prompt"], item.get("id"))
+        else:
+            raise ValueError(f'Line {line}: expected a string or {{"prompt": ...}}')
+
+
+def has_errors(results: Mapping[str, Any]) -> bool:
+    """Return whether any provider reported an error in a record's results."""
+    return any(key.endswith("_error") for key in results)
+
+
+def completed_lines(path: Path) -> Set[int]:
+    """Return the input lines an output file already holds results for.
+
+    Lines whose record holds a provider error do not count as completed,
+    so a resumed run researches them again and appends a new record; the
+    last record of a line supersedes earlier ones. A partly written last
+    record, left by an interrupted run, is cut off so that new records
+    start on a fresh line.
+
+    Args:
+        path: JSONL output of an earlier run
+
+    Returns:
+        Line numbers of the prompts every provider answered
+    """
+    done: Set[int] = set()
+    if not path.exists():
+        return done
+    valid = 0
+    with open(path, "rb") as f:
+        for text in f:
+            if not text.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(text)
+                line = int(record["line"])
+                if not has_errors(record.get("results") or {}):
+                    done.add(line)
+            except (ValueError, KeyError, TypeError, AttributeError):
+                break
+            valid += len(text)
+    if valid < path.stat().st_size:
+        logger.warning(f"Discarding partial record at the end of {path}")
+        os.truncate(path, valid)
+    return done
+
+
+class BatchResearch:
+    """Researches many prompts with every provider, within per-provider limits.
+
+    Each provider gets its own worker threads, as many as its concurrency
+    limit, and an adaptive rate limiter, so a slow or throttled provider
+    holds back only its own requests. A prompt's record is written as soon
+    as all providers have answered it, so records appear in completion
+    order and carry their input line number. At most ``max_pending``
+    prompts are read ahead of the slowest provider, so arbitrarily long
+    input streams run in bounded memory.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, ProviderLimits]] = None,
+        providers: Optional[Iterable[str]] = None,
+        deadline: float = DEFAULT_DEADLINE_SECONDS,
+        use_cache: bool = True,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            limits: Limits per provider name; providers not listed get
+                ProviderLimits()
+            providers: Providers to query (defaults to all of QUERIES)
+            deadline: Timeout of each provider request, in seconds
+            use_cache: Serve and store answers through the response cache
+            max_pending: Prompts in flight at once (defaults to twice the
+                largest provider concurrency)
+
+        Raises:
+            ValueError: If a provider is unknown
+        """
+        self.providers = list(providers or QUERIES)
+        unknown = [name for name in self.providers if name not in QUERIES]
+        if unknown:
+            raise ValueError(f"Unknown providers: {', '.join(unknown)}")
+        limits = limits or {}
+        self.limits = {
+            name: limits.get(name, ProviderLimits()) for name in self.providers
+        }
+        self.limiters = {
+            name: AdaptiveRateLimiter(self.limits[name]) for name in self.providers
+        }
+        self.deadline = deadline
+        self.use_cache = use_cache
+        self.max_pending = max_pending or 2 * max(
+            limit.concurrency for limit in self.limits.values()
+        )
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        jobs: Iterable[PromptJob],
+        output: IO[str],
+        skip: Optional[Set[int]] = None,
+    ) -> BatchResearchReport:
+        """Research every prompt and write one JSON record per prompt.
+
+        Records hold the input "line", the prompt's "id" (if any), the
+        "prompt" and the providers' "results" in the shape ``deep_research``
+        returns. Each is flushed as soon as it is written.
+
+        Args:
+            jobs: Prompts to research, e.g. from ``read_prompts()``
+            output: Text stream the records are written to
+            skip: Input lines to skip, e.g. from ``completed_lines()``
+
+        Returns:
+            Report of the run
+        """
+        skip = skip or set()
+        report = BatchResearchReport()
+        throttled_before = {name: get_client(name).throttled for name in self.providers}
+        slots = threading.BoundedSemaphore(self.max_pending)
+        executors = {
+            name: ThreadPoolExecutor(
+                max_workers=max(1, self.limits[name].concurrency),
+                thread_name_prefix=f"batch-{name}",
+            )
+            for name in self.providers
+        }
+
+        def finish(job: PromptJob) -> None:
+            record: Dict[str, Any] = {"line": job.line}
+            if job.id is not None:
+                record["id"] = job.id
+            # Report providers in a fixed order, not the order they answered
+            results = {
+                key: job.results[key]
+                for name in self.providers
+                for key in (name, f"{name}_error")
+                if key in job.results
+            }
+            record.update(prompt=job.prompt, results=results)
+            record["elapsed"] = round(time.perf_counter() - job.started, 3)
+            with self._lock:
+                output.write(json.dumps(record) + "\n")
+                output.flush()
+                report.completed += 1
+                if has_errors(job.results):
+                    report.failed += 1
+            slots.release()
+
+        def query(job: PromptJob, name: str) -> None:
+            try:
+                job.results.update(self._query(name, job.prompt))
+            except Exception as e:
+                job.results[f"{name}_error"] = str(e)
+            finally:
+                with self._lock:
+                    job.pending -= 1
+                    done = job.pending == 0
+                if done:
+                    finish(job)
+
+        started = time.perf_counter()
+        interrupted = True
+        try:
+            for job in jobs:
+                if job.line in skip:
+                    report.resumed += 1
+                    continue
+                slots.acquire()
+                job.started = time.perf_counter()
+                job.pending = len(self.providers)
+                for name in self.providers:
+                    executors[name].submit(query, job, name)
+            interrupted = False
+        finally:
+            # On interruption, requests in flight still finish; prompts with
+            # queued requests are dropped and left for a resumed run
+            for executor in executors.values():
+                executor.shutdown(wait=True, cancel_futures=interrupted)
+
+        report.wall_time = time.perf_counter() - started
+        for name in self.providers:
+            report.throttled[name] = get_client(name).throttled - throttled_before[name]
+            report.rates[name] = self.limiters[name].rate
+        return report
+
+    def _query(self, name: str, prompt: str) -> Dict[str, Optional[str]]:
+        """Query one provider under its rate limiter.
+
+        Cached answers are returned without taking a token, so they neither
+        wait for the limiter nor count as throttle-free traffic that raises
+        its rate. A request still rate limited after the client's own
+        retries is sent again, up to THROTTLED_ATTEMPTS times in total, once
+        the limiter has slowed down and lets it through.
+
+        Returns:
+            The answer under the provider's name, or the error under
+            ``<provider>_error``
+        """
+        if self.use_cache:
+            cached = cached_answer(name, prompt)
+            if cached is not None:
+                return {name: cached}
+        # On a miss the query looks the cache up again, which also serves
+        # answers another worker stored in the meantime, and stores its own
+        limiter = self.limiters[name]
+        client = get_client(name)
+        attempt = 0
+        while True:
+            attempt += 1
+            sent = limiter.acquire()
+            # The counter is shared by concurrent requests, so a 429 answered
+            # to any of them while this one was in flight also counts here
+            before = client.throttled
+            try:
+                answer = QUERIES[name](
+                    prompt, timeout=self.deadline, use_cache=self.use_cache
+                )
+            except Exception as e:
+                response = getattr(e, "response", None)
+                rate_limited = getattr(response, "status_code", None) == 429
+                if rate_limited or client.throttled > before:
+                    # Other failures say nothing about the provider's limits
+                    limiter.record(sent, throttled=True)
+                if rate_limited and attempt < THROTTLED_ATTEMPTS:
+                    continue
+                return {f"{name}_error": str(e)}
+            limiter.record(sent, client.throttled > before)
+            return {name: answer}
@@ -0,0 +1,263 @@
+"""Disk-backed cache of research provider responses."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger("research_cache")
+
+# Seconds a cached response is served before the provider is asked again
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+# Responses kept on disk; the least recently used go first
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Responses kept in memory in front of the database
+DEFAULT_MEMORY_ENTRIES = 256
+
+# Seconds memory hits are collected before their access times are written
+# to the database, so hot keys stay recent there without a write per hit
+_TOUCH_INTERVAL_SECONDS = 1.0
+
+# Share of max_entries removed when the database overflows, so eviction
+# runs once per batch of inserts rather than on every insert
+_EVICTION_SLACK = 0.1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Return a prompt with surrounding and repeated whitespace collapsed."""
+    return " ".join(prompt.split())
+
+
+def cache_key(provider: str, model: str, max_tokens: int, prompt: str) -> str:
+    """Return the cache key of a provider query.
+
+    Args:
+        provider: Provider name
+        model: Model queried
+        max_tokens: Response token limit
+        prompt: Prompt text; whitespace differences map to the same key
+
+    Returns:
+        Hex digest identifying the query
+    """
+    identity = json.dumps([provider, model, max_tokens, normalize_prompt(prompt)])
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Provider responses in SQLite with an in-memory LRU in front.
+
+    Entries expire after a TTL, and the database is bounded to
+    ``max_entries`` by evicting the least recently used responses. Access
+    times of memory hits reach the database in batches, at least every
+    _TOUCH_INTERVAL_SECONDS and before every eviction. The database runs in
+    WAL mode, so several processes can share it. Safe to share between
+    threads.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ) -> None:
+        """Open the cache, creating its database if needed.
+
+        Args:
+            path: Database file (defaults to ~/.cursor/cache/research.sqlite3)
+            ttl_seconds: Seconds a response is served after it was stored
+            max_entries: Responses kept on disk
+            memory_entries: Responses kept in memory
+        """
+        self.path = path or Path.home() / ".cursor" / "cache" / "research.sqlite3"
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.memory_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Key to (response, expiry time)
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        # Key to the time of its latest memory hit not yet in the database
+        self._touched: Dict[str, float] = {}
+        self._touches_written = time.time()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._db.commit()
+        (self._entries,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None if it is missing or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[1] > now:
+                self._memory.move_to_end(key)
+                self._touched[key] = now
+                if now - self._touches_written >= _TOUCH_INTERVAL_SECONDS:
+                    self._write_touches(now)
+                    self._db.commit()
+                self.hits += 1
+                self.memory_hits += 1
+                return entry[0]
+
+            row = self._db.execute(
+                "SELECT response, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            self._db.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._db.commit()
+            self._remember(key, row[0], row[1])
+            self.hits += 1
+            return str(row[0])
+
+    def put(self, provider: str, model: str, key: str, response: str) -> None:
+        """Store a response.
+
+        Args:
+            provider: Provider that answered
+            model: Model that answered
+            key: Key from ``cache_key``
+            response: Response text
+        """
+        now = time.time()
+        expires = now + self.ttl_seconds
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, model, response, expires, now),
+            )
+            self._entries += cursor.rowcount
+            self._touched.pop(key, None)
+            if self._entries > self.max_entries:
+                # Eviction must see the latest accesses of keys hit in memory
+                self._write_touches(now)
+                self._evict(now)
+            self._db.commit()
+            self._remember(key, response, expires)
+
+    def _remember(self, key: str, response: str, expires: float) -> None:
+        """Add a response to the in-memory LRU; caller holds the lock."""
+        self._memory[key] = (response, expires)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _write_touches(self, now: float) -> None:
+        """Record the access times of memory hits; caller holds the lock."""
+        if self._touched:
+            self._db.executemany(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+        self._touches_written = now
+
+    def _evict(self, now: float) -> None:
+        """Drop expired and least recently used rows; caller holds the lock."""
+        (count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        removed = self._db.execute(
+            "DELETE FROM responses WHERE expires <= ?", (now,)
+        ).rowcount
+        target = int(self.max_entries * (1 - _EVICTION_SLACK))
+        excess = count - removed - target
+        if excess > 0:
+            removed += self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed LIMIT ?)",
+                (excess,),
+            ).rowcount
+        self._entries = count - removed
+        self.evictions += removed
+        logger.debug(f"Evicted {removed} cached responses")
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self._memory.clear()
+            self._touched.clear()
+            self._entries = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit, miss and eviction counts and the hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": self._entries,
+        }
+
+    def close(self) -> None:
+        """Write pending access times and close the database."""
+        with self._lock:
+            self._write_touches(time.time())
+            self._db.commit()
+            self._db.close()
+
+
+_cache: Optional[ResponseCache] = None
+_cache_enabled = True
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """Return the shared response cache, or None if caching is disabled."""
+    global _cache
+    if not _cache_enabled:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
+
+
+def configure_cache(
+    cache: Optional[ResponseCache] = None, enabled: bool = True
+) -> None:
+    """Replace or disable the shared response cache.
+
+    Args:
+        cache: Cache to use (defaults to one created on first use)
+        enabled: False to bypass caching entirely
+    """
+    global _cache, _cache_enabled
+    with _cache_lock:
+        _cache, _cache_enabled = cache, enabled
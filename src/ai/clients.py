@@ -0,0 +1,554 @@
+"""Pooled, keep-alive HTTP clients shared by the research providers."""
+
+import email.utils
+import importlib.util
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Type
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+logger = logging.getLogger("provider_clients")
+
+# HTTP/2 in httpx needs the h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = httpx is not None and importlib.util.find_spec("h2") is not None
+
+# Base URLs of the providers, one pooled client each
+PROVIDER_URLS = {
+    "anthropic": "https://api.anthropic.com",
+    "perplexity": "https://api.perplexity.ai",
+    "google": "https://generativelanguage.googleapis.com",
+}
+
+# Statuses worth retrying: rate limits, overload and gateway failures
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504, 529})
+
+# Connection failures and timeouts worth retrying, for either backend
+TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (
+    requests.ConnectionError,
+    requests.Timeout,
+) + ((httpx.TransportError,) if httpx is not None else ())
+
+# Recent request latencies kept per client to estimate the hedging delay
+LATENCY_WINDOW = 200
+
+
+@dataclass(frozen=True)
+class ClientConfig:
+    """Connection pooling, deadline, retry and hedging settings of a client."""
+
+    # Connections kept open per provider
+    pool_size: int = 10
+    # Seconds an idle connection is kept open (HTTP/2 clients only; requests
+    # keeps connections until the server closes them)
+    keepalive_seconds: float = 30.0
+    # Use HTTP/2 when httpx and h2 are installed
+    http2: bool = True
+    # CA bundle to verify servers against instead of the default store
+    ca_bundle: Optional[str] = None
+    # Seconds to establish a connection, and to wait between response bytes
+    connect_timeout_seconds: float = 5.0
+    read_timeout_seconds: float = 60.0
+    # Attempts per request on connection errors and RETRY_STATUSES
+    retry_attempts: int = 3
+    backoff_seconds: float = 0.5
+    max_backoff_seconds: float = 20.0
+    # Longer Retry-After waits are not honored; the response is returned
+    max_retry_after_seconds: float = 60.0
+    # Send a duplicate request when the first is slower than the given
+    # quantile of recent latencies, and use whichever answers first.
+    # Off by default: a hedged call may be billed twice.
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_min_delay_seconds: float = 0.05
+
+
+def retry_after_seconds(response: Any) -> Optional[float]:
+    """Return the wait a response asks for in its Retry-After header.
+
+    Args:
+        response: Response from either backend
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class LatencyTracker:
+    """Sliding window of request latencies."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """Initialize an empty window.
+
+        Args:
+            window: Latencies kept; older ones are forgotten
+        """
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of latencies in the window."""
+        return len(self._latencies)
+
+    def record(self, seconds: float) -> None:
+        """Add a latency to the window."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return a quantile of the window, or None if it is empty.
+
+        Args:
+            q: Quantile between 0 and 1, e.g. 0.95
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+
+class ProviderClient:
+    """One provider's pooled HTTP session.
+
+    Connections are opened on first use and reused by every later request,
+    so a research batch pays the TCP and TLS handshakes once per pooled
+    connection instead of once per call. With httpx and h2 installed the
+    client speaks HTTP/2 and multiplexes concurrent requests over a single
+    connection; otherwise it uses a requests session with HTTP/1.1
+    keep-alive. Clients are safe to share between threads.
+
+    Every request gets connect and read deadlines, is retried with
+    jittered exponential backoff on connection errors, rate limits and
+    server errors, and can be hedged against a slow first attempt.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: Optional[ClientConfig] = None,
+        base_url: Optional[str] = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            name: Provider name
+            config: Pooling settings (defaults to ClientConfig())
+            base_url: URL request paths are relative to (defaults to the
+                provider's entry in PROVIDER_URLS)
+        """
+        self.name = name
+        self.base_url = (base_url or PROVIDER_URLS.get(name, "")).rstrip("/")
+        self.config = config or ClientConfig()
+        self.http2 = self.config.http2 and HTTP2_AVAILABLE
+        self.latencies = LatencyTracker()
+        self.hedges = 0
+        # Responses that said the provider is rate limiting us (HTTP 429),
+        # including ones retried away
+        self.throttled = 0
+        self._session: Any = None
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> Any:
+        """Return the session, creating it on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> Any:
+        """Create the pooled session."""
+        pool_size = self.config.pool_size
+        if self.http2:
+            return httpx.Client(
+                http2=True,
+                verify=self.config.ca_bundle or True,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                    keepalive_expiry=self.config.keepalive_seconds,
+                ),
+            )
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before retrying after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that failed, starting at 1
+
+        Returns:
+            Exponential backoff delay with full jitter, in seconds
+        """
+        cap = min(
+            self.config.backoff_seconds * 2 ** (attempt - 1),
+            self.config.max_backoff_seconds,
+        )
+        return random.uniform(0, cap)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Return how long to wait before hedging, or None not to hedge."""
+        config = self.config
+        if not config.hedge or len(self.latencies) < config.hedge_min_samples:
+            return None
+        delay = self.latencies.quantile(config.hedge_quantile)
+        return max(delay or 0.0, config.hedge_min_delay_seconds)
+
+    def post(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Any = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send a POST request over a pooled connection.
+
+        Attempts that fail to connect, time out or return one of
+        RETRY_STATUSES are retried up to ``retry_attempts`` times in total,
+        waiting for the jittered backoff or the server's Retry-After,
+        whichever is longer. When retries run out, or the next wait would
+        pass the deadline, the last response is returned or the last error
+        raised.
+
+        Args:
+            url: Request URL, or a path starting with / relative to base_url
+            headers: Request headers
+            json: JSON-serializable request body
+            timeout: Overall deadline in seconds for all attempts, on top of
+                the configured connect and read timeouts
+
+        Returns:
+            The response; both backends provide ``status_code``, ``json()``,
+            ``headers`` and ``raise_for_status()``
+
+        Raises:
+            TimeoutError: If the deadline passes before an attempt starts
+            Exception: The backend's error for the last failed attempt
+        """
+        return self._request(url, headers, json, timeout, stream=False)
+
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Any = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Any]:
+        """Send a POST request whose response body is read as it arrives.
+
+        Failed attempts are retried like ``post()`` until a response
+        arrives; once its body is being read, nothing is retried. Streamed
+        requests are never hedged.
+
+        Args:
+            url: Request URL, or a path starting with / relative to base_url
+            headers: Request headers
+            json: JSON-serializable request body
+            timeout: Overall deadline in seconds for all attempts; reads
+                are bounded by the configured read timeout
+
+        Yields:
+            The response, with its body unread; pass it to ``iter_sse()``.
+            It is closed when the block exits.
+        """
+        response = self._request(url, headers, json, timeout, stream=True)
+        try:
+            yield response
+        finally:
+            response.close()
+
+    def _request(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        json: Any,
+        timeout: Optional[float],
+        stream: bool,
+    ) -> Any:
+        """Send a request with retries; see ``post()``."""
+        if url.startswith("/"):
+            url = self.base_url + url
+        deadline = None if timeout is None else time.monotonic() + timeout
+        attempts = max(1, self.config.retry_attempts)
+        attempt = 0
+        while True:
+            attempt += 1
+            send = self._sender(url, headers, json, deadline, stream)
+            try:
+                response = send() if stream else self._send_hedged(send)
+            except TRANSIENT_ERRORS as e:
+                if attempt == attempts:
+                    raise
+                error: Any = e
+                delay = self.backoff(attempt)
+            else:
+                if response.status_code == 429:
+                    self.throttled += 1
+                if response.status_code not in RETRY_STATUSES or attempt == attempts:
+                    return response
+                error = f"HTTP {response.status_code}"
+                delay = self.backoff(attempt)
+                retry_after = retry_after_seconds(response)
+                if retry_after is not None:
+                    if retry_after > self.config.max_retry_after_seconds:
+                        return response
+                    delay = max(delay, retry_after)
+
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                if isinstance(error, BaseException):
+                    raise error
+                return response
+            if not isinstance(error, BaseException):
+                response.close()
+            logger.warning(
+                f"{self.name} request failed ({error}), retrying in {delay:.2f}s"
+            )
+            time.sleep(delay)
+
+    def _sender(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        json: Any,
+        deadline: Optional[float],
+        stream: bool = False,
+    ) -> Callable[[], Any]:
+        """Return a function sending one attempt within the deadline."""
+        connect = self.config.connect_timeout_seconds
+        read = self.config.read_timeout_seconds
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"{self.name} request deadline passed")
+            connect, read = min(connect, remaining), min(read, remaining)
+
+        options: Dict[str, Any] = {}
+        if self.http2:
+            options["timeout"] = httpx.Timeout(read, connect=connect)
+        else:
+            options["timeout"] = (connect, read)
+            if self.config.ca_bundle:
+                # requests lets REQUESTS_CA_BUNDLE override session.verify,
+                # so the bundle is passed per request
+                options["verify"] = self.config.ca_bundle
+
+        def send() -> Any:
+            session = self._get_session()
+            if stream:
+                if self.http2:
+                    request = session.build_request(
+                        "POST", url, headers=headers, json=json, **options
+                    )
+                    return session.send(request, stream=True)
+                return session.post(
+                    url, headers=headers, json=json, stream=True, **options
+                )
+
+            started = time.perf_counter()
+            response = session.post(url, headers=headers, json=json, **options)
+            if response.status_code < 400:
+                self.latencies.record(time.perf_counter() - started)
+            return response
+
+        return send
+
+    def _send_hedged(self, send: Callable[[], Any]) -> Any:
+        """Send an attempt, hedging it with a duplicate if it is slow.
+
+        Returns:
+            The first successful response, else the primary's outcome
+        """
+        delay = self.hedge_delay()
+        if delay is None:
+            return send()
+
+        executor = self._get_hedge_executor()
+        primary = executor.submit(send)
+        if wait([primary], timeout=delay).done:
+            return primary.result()
+
+        self.hedges += 1
+        hedge = executor.submit(send)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if _succeeded(future):
+                    # The slower request finishes in the background
+                    return future.result()
+        return primary.result()
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool hedged attempts run on."""
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=2 * self.config.pool_size,
+                    thread_name_prefix=f"{self.name}-hedge",
+                )
+            return self._hedge_executor
+
+    def close(self) -> None:
+        """Close the pooled connections; the next request reopens them."""
+        with self._lock:
+            session, self._session = self._session, None
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if session is not None:
+            session.close()
+
+
+def iter_sse(response: Any) -> Iterator[Tuple[str, str]]:
+    """Parse a streamed response body as server-sent events.
+
+    Args:
+        response: Response from ``ProviderClient.stream()``
+
+    Yields:
+        (event name, data) pairs; the name is "message" when the event
+        does not set one, and multi-line data is joined with newlines
+    """
+    event = "message"
+    data: List[str] = []
+    for line in response.iter_lines():
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+        elif not line.startswith(":"):
+            name, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if name == "event":
+                event = value
+            elif name == "data":
+                data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+
+def _succeeded(future: "Future[Any]") -> bool:
+    """Return True if a finished attempt got a non-retryable response."""
+    if future.exception() is not None:
+        return False
+    return future.result().status_code not in RETRY_STATUSES
+
+
+class ClientRegistry:
+    """Provider clients shared by everything in the process."""
+
+    def __init__(
+        self,
+        config: Optional[ClientConfig] = None,
+        providers: Optional[Dict[str, ClientConfig]] = None,
+    ) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            config: Settings of clients created from now on
+            providers: Settings overriding ``config`` for some providers
+        """
+        self.config = config or ClientConfig()
+        self.providers = dict(providers or {})
+        self._clients: Dict[str, ProviderClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> ProviderClient:
+        """Return a provider's client, creating it on first use."""
+        client = self._clients.get(name)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(name)
+                if client is None:
+                    config = self.providers.get(name, self.config)
+                    client = self._clients[name] = ProviderClient(name, config)
+        return client
+
+    def configure(
+        self,
+        config: Optional[ClientConfig] = None,
+        providers: Optional[Dict[str, ClientConfig]] = None,
+    ) -> None:
+        """Close every client so they are recreated with new settings.
+
+        Args:
+            config: Default settings (unchanged if None)
+            providers: Per-provider settings replacing the current ones
+        """
+        with self._lock:
+            if config is not None:
+                self.config = config
+            self.providers = dict(providers or {})
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.close()
+
+    def close(self) -> None:
+        """Close every client's connections."""
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            client.close()
+
+
+# Shared by the research CLI and the server so connections are reused
+_registry = ClientRegistry()
+
+
+def get_client(name: str) -> ProviderClient:
+    """Return the shared client of a provider."""
+    return _registry.get(name)
+
+
+def configure_clients(
+    config: Optional[ClientConfig] = None,
+    providers: Optional[Dict[str, ClientConfig]] = None,
+) -> None:
+    """Apply new settings to the shared clients.
+
+    Args:
+        config: Default settings (unchanged if None)
+        providers: Settings for individual providers, e.g. a longer read
+            timeout for a slow one
+    """
+    _registry.configure(config, providers)
+
+
+def close_clients() -> None:
+    """Close the shared clients' connections."""
+    _registry.close()
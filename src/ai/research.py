@@ -1,101 +1,401 @@
 """Deep research module for Anthropic, Perplexity, and Google APIs."""
 
+import json
 import os
-from typing import Optional, cast
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, Generator, Iterator, List, Optional, Tuple, cast
 
-import requests
 from dotenv import load_dotenv
 
+from .cache import cache_key, get_cache
+from .clients import get_client, iter_sse
+
 load_dotenv()
 
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 PERPLEXITY_API_KEY = os.environ.get("PERPLEXITY_API_KEY")
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
 
+# Seconds deep_research waits for all providers before returning what it has
+DEFAULT_DEADLINE_SECONDS = 60.0
+
+# Model each provider is queried with unless the caller picks another
+DEFAULT_MODELS = {
+    "anthropic": "claude-3-opus-20240229",
+    "perplexity": "pplx-70b-online",
+    "google": "text-bison-001",
+}
+DEFAULT_MAX_TOKENS = 512
+
+PERPLEXITY_PATH = "/v1/complete"  # Update if you have a different endpoint
+PERPLEXITY_UNAVAILABLE = (
+    "Perplexity public API not available. Check your access or endpoint."
+)
+
+
+def _cached_response(
+    use_cache: bool, provider: str, model: str, max_tokens: int, prompt: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """Look a query up in the response cache.
+
+    Returns:
+        The cached response, if any, and the key to store a fresh response
+        under, or None when caching is bypassed
+    """
+    cache = get_cache() if use_cache else None
+    if cache is None:
+        return None, None
+    key = cache_key(provider, model, max_tokens, prompt)
+    return cache.get(key), key
+
+
+def cached_answer(provider: str, prompt: str) -> Optional[str]:
+    """Return a provider's cached answer to a prompt, if there is one.
+
+    Looks up the answer a query with the provider's default model and
+    token limit would be served from the cache, without contacting the
+    provider.
+    """
+    cached, _ = _cached_response(
+        True, provider, DEFAULT_MODELS[provider], DEFAULT_MAX_TOKENS, prompt
+    )
+    return cached
+
+
+def _store_response(
+    key: Optional[str], provider: str, model: str, response: Optional[str]
+) -> Optional[str]:
+    """Cache a provider's answer and return it; empty answers are not cached."""
+    cache = get_cache()
+    if key is not None and response is not None and cache is not None:
+        cache.put(provider, model, key, response)
+    return response
+
+
+def _anthropic_headers() -> Dict[str, str]:
+    """Return the Anthropic request headers."""
+    return {
+        "x-api-key": cast(str, ANTHROPIC_API_KEY),
+        "anthropic-version": "2023-06-01",
+        "content-type": "application/json",
+    }
+
+
+def _perplexity_headers() -> Dict[str, str]:
+    """Return the Perplexity request headers."""
+    return {
+        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
+        "Content-Type": "application/json",
+    }
+
 
 def query_anthropic(
-    prompt: str, model: str = "claude-3-opus-20240229", max_tokens: int = 512
+    prompt: str,
+    model: str = DEFAULT_MODELS["anthropic"],
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
 ) -> Optional[str]:
     """Query the Anthropic Claude API (v1/messages endpoint)."""
     if not ANTHROPIC_API_KEY:
         raise ValueError("ANTHROPIC_API_KEY not set in environment.")
-    url = "https://api.anthropic.com/v1/messages"
-    headers = {
-        "x-api-key": ANTHROPIC_API_KEY,
-        "anthropic-version": "2023-06-01",
-        "content-type": "application/json",
-    }
+    cached, key = _cached_response(use_cache, "anthropic", model, max_tokens, prompt)
+    if cached is not None:
+        return cached
+    headers = _anthropic_headers()
     data = {
         "model": model,
         "max_tokens": max_tokens,
         "messages": [{"role": "user", "content": prompt}],
     }
-    response = requests.post(url, headers=headers, json=data)
+    response = get_client("anthropic").post(
+        "/v1/messages", headers=headers, json=data, timeout=timeout
+    )
     response.raise_for_status()
     result = response.json().get("content")
     # Anthropic returns a list of message parts
     if isinstance(result, list) and result:
-        return cast(Optional[str], result[0].get("text"))
+        text = cast(Optional[str], result[0].get("text"))
+        return _store_response(key, "anthropic", model, text)
     return None
 
 
 def query_perplexity(
-    prompt: str, model: str = "pplx-70b-online", max_tokens: int = 512
+    prompt: str,
+    model: str = DEFAULT_MODELS["perplexity"],
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
 ) -> Optional[str]:
     """Query the Perplexity API for a completion. NOTE: Public API may not be available for all users."""
     if not PERPLEXITY_API_KEY:
         raise ValueError("PERPLEXITY_API_KEY not set in environment.")
-    url = "https://api.perplexity.ai/v1/complete"  # Update if you have a different endpoint
-    headers = {
-        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-        "Content-Type": "application/json",
-    }
+    cached, key = _cached_response(use_cache, "perplexity", model, max_tokens, prompt)
+    if cached is not None:
+        return cached
     data = {"prompt": prompt, "model": model, "max_tokens": max_tokens}
-    response = requests.post(url, headers=headers, json=data)
+    response = get_client("perplexity").post(
+        PERPLEXITY_PATH, headers=_perplexity_headers(), json=data, timeout=timeout
+    )
     if response.status_code == 404:
-        return "Perplexity public API not available. Check your access or endpoint."
+        return PERPLEXITY_UNAVAILABLE
     response.raise_for_status()
     choices = response.json().get("choices", [{}])
     result = choices[0].get("text") if choices else None
-    return cast(Optional[str], result)
+    return _store_response(key, "perplexity", model, cast(Optional[str], result))
 
 
 def query_google(
-    prompt: str, model: str = "text-bison-001", max_tokens: int = 512
+    prompt: str,
+    model: str = DEFAULT_MODELS["google"],
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
 ) -> Optional[str]:
     """Query the Google PaLM API for a completion (Vertex AI Generative Language API)."""
     if not GOOGLE_API_KEY:
         raise ValueError("GOOGLE_API_KEY not set in environment.")
-    url = f"https://generativelanguage.googleapis.com/v1beta2/models/{model}:generateText?key={GOOGLE_API_KEY}"
+    cached, key = _cached_response(use_cache, "google", model, max_tokens, prompt)
+    if cached is not None:
+        return cached
+    path = f"/v1beta2/models/{model}:generateText?key={GOOGLE_API_KEY}"
     headers = {"Content-Type": "application/json"}
     data = {"prompt": {"text": prompt}, "maxOutputTokens": max_tokens}
-    response = requests.post(url, headers=headers, json=data)
+    response = get_client("google").post(
+        path, headers=headers, json=data, timeout=timeout
+    )
     if response.status_code == 403:
         return "Google API key forbidden or not enabled for Generative Language API."
     response.raise_for_status()
     candidates = response.json().get("candidates", [])
     result = candidates[0].get("output") if candidates else None
-    return cast(Optional[str], result)
+    return _store_response(key, "google", model, cast(Optional[str], result))
 
 
-def deep_research(prompt: str) -> dict:
-    """Perform deep research using Anthropic, Perplexity, and Google APIs."""
-    results = {}
-    try:
-        results["anthropic"] = query_anthropic(prompt)
-    except Exception as e:
-        results["anthropic_error"] = str(e)
-    try:
-        results["perplexity"] = query_perplexity(prompt)
-    except Exception as e:
-        results["perplexity_error"] = str(e)
+# Blocking query of each provider, in the order results are reported
+QUERIES: Dict[str, Callable[..., Optional[str]]] = {
+    "anthropic": query_anthropic,
+    "perplexity": query_perplexity,
+    "google": query_google,
+}
+
+
+def stream_anthropic(
+    prompt: str,
+    model: str = DEFAULT_MODELS["anthropic"],
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+) -> Generator[str, None, None]:
+    """Stream a Claude completion, yielding text as it is generated.
+
+    A cached answer is yielded whole; a completed stream is cached like a
+    ``query_anthropic`` answer.
+
+    Raises:
+        ValueError: If the API key is not set
+        RuntimeError: If the stream reports an error
+    """
+    if not ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY not set in environment.")
+    cached, key = _cached_response(use_cache, "anthropic", model, max_tokens, prompt)
+    if cached is not None:
+        yield cached
+        return
+    data = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "messages": [{"role": "user", "content": prompt}],
+        "stream": True,
+    }
+    chunks: List[str] = []
+    with get_client("anthropic").stream(
+        "/v1/messages", headers=_anthropic_headers(), json=data, timeout=timeout
+    ) as response:
+        response.raise_for_status()
+        for event, payload in iter_sse(response):
+            message = json.loads(payload)
+            if event == "error":
+                raise RuntimeError(message.get("error", {}).get("message", payload))
+            if event == "content_block_delta":
+                text = message.get("delta", {}).get("text")
+                if text:
+                    chunks.append(text)
+                    yield text
+    _store_response(key, "anthropic", model, "".join(chunks) or None)
+
+
+def stream_perplexity(
+    prompt: str,
+    model: str = DEFAULT_MODELS["perplexity"],
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+) -> Generator[str, None, None]:
+    """Stream a Perplexity completion, yielding text as it is generated.
+
+    Chunks are read from OpenAI-style ``choices[0].delta.content`` or
+    ``choices[0].text`` events until ``[DONE]``.
+
+    Raises:
+        ValueError: If the API key is not set
+    """
+    if not PERPLEXITY_API_KEY:
+        raise ValueError("PERPLEXITY_API_KEY not set in environment.")
+    cached, key = _cached_response(use_cache, "perplexity", model, max_tokens, prompt)
+    if cached is not None:
+        yield cached
+        return
+    data = {"prompt": prompt, "model": model, "max_tokens": max_tokens, "stream": True}
+    chunks: List[str] = []
+    with get_client("perplexity").stream(
+        PERPLEXITY_PATH, headers=_perplexity_headers(), json=data, timeout=timeout
+    ) as response:
+        if response.status_code == 404:
+            yield PERPLEXITY_UNAVAILABLE
+            return
+        response.raise_for_status()
+        for _, payload in iter_sse(response):
+            if payload == "[DONE]":
+                break
+            choices = json.loads(payload).get("choices") or [{}]
+            text = choices[0].get("delta", {}).get("content") or choices[0].get("text")
+            if text:
+                chunks.append(text)
+                yield text
+    _store_response(key, "perplexity", model, "".join(chunks) or None)
+
+
+def stream_google(
+    prompt: str,
+    model: str = DEFAULT_MODELS["google"],
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+) -> Generator[str, None, None]:
+    """Yield a Google PaLM completion.
+
+    The generateText endpoint has no streaming mode, so the answer arrives
+    as a single chunk once it is complete.
+    """
+    result = query_google(prompt, model, max_tokens, timeout, use_cache)
+    if result:
+        yield result
+
+
+def deep_research(
+    prompt: str, deadline: float = DEFAULT_DEADLINE_SECONDS, use_cache: bool = True
+) -> dict:
+    """Perform deep research using Anthropic, Perplexity, and Google APIs.
+
+    The providers are queried concurrently, so the wall time is that of the
+    slowest provider rather than the sum of all three. Providers that fail
+    or miss the deadline are reported under ``<provider>_error`` while the
+    others' answers are still returned. Answers to prompts asked before are
+    served from the response cache unless ``use_cache`` is False.
+
+    Args:
+        prompt: Research prompt
+        deadline: Seconds to wait for all providers; each request is also
+            given this as its timeout so no call outlives the deadline by long
+        use_cache: Serve and store answers through the response cache
+
+    Returns:
+        Each provider's answer, or its error under ``<provider>_error``
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=len(QUERIES), thread_name_prefix="research"
+    )
+    futures = {
+        name: executor.submit(query, prompt, timeout=deadline, use_cache=use_cache)
+        for name, query in QUERIES.items()
+    }
     try:
-        results["google"] = query_google(prompt)
-    except Exception as e:
-        results["google_error"] = str(e)
+        _, pending = wait(futures.values(), timeout=deadline)
+    finally:
+        # Return without waiting for providers that missed the deadline
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    results: Dict[str, Optional[str]] = {}
+    for name, future in futures.items():
+        if future in pending:
+            results[f"{name}_error"] = f"No response within {deadline:g}s"
+        elif future.exception() is not None:
+            results[f"{name}_error"] = str(future.exception())
+        else:
+            results[name] = future.result()
     return results
 
 
+def deep_research_stream(
+    prompt: str, deadline: float = DEFAULT_DEADLINE_SECONDS, use_cache: bool = True
+) -> Iterator[Tuple[str, str]]:
+    """Stream deep research from all providers, interleaving their chunks.
+
+    Each provider streams on its own thread and chunks are yielded in the
+    order they arrive, so the first text shows up as soon as any provider
+    produces it. Failures are yielded under ``<provider>_error`` like in
+    ``deep_research``, as are providers still streaming at the deadline.
+    Closing the generator early stops the remaining streams.
+
+    Args:
+        prompt: Research prompt
+        deadline: Seconds to wait for all providers to finish
+        use_cache: Serve and store answers through the response cache
+
+    Yields:
+        (provider, text chunk) or (``<provider>_error``, message) pairs
+    """
+    streams: Dict[str, Callable[..., Generator[str, None, None]]] = {
+        "anthropic": stream_anthropic,
+        "perplexity": stream_perplexity,
+        "google": stream_google,
+    }
+    # A None chunk marks the end of a provider's stream
+    chunks: "queue.Queue[Tuple[str, Optional[str]]]" = queue.Queue()
+    stop = threading.Event()
+
+    def pump(name: str, stream: Callable[..., Generator[str, None, None]]) -> None:
+        iterator = stream(prompt, timeout=deadline, use_cache=use_cache)
+        try:
+            for chunk in iterator:
+                if stop.is_set():
+                    break
+                chunks.put((name, chunk))
+        except Exception as e:
+            chunks.put((f"{name}_error", str(e)))
+        finally:
+            iterator.close()
+            chunks.put((name, None))
+
+    for name, stream in streams.items():
+        # Daemon threads: a stream stuck past the deadline is abandoned
+        threading.Thread(
+            target=pump, args=(name, stream), name=f"research-{name}", daemon=True
+        ).start()
+
+    running = set(streams)
+    ends = time.monotonic() + deadline
+    try:
+        while running:
+            try:
+                name, chunk = chunks.get(timeout=max(0.0, ends - time.monotonic()))
+            except queue.Empty:
+                break
+            if chunk is None:
+                running.discard(name)
+            else:
+                yield name, chunk
+        for name in streams:
+            if name in running:
+                yield f"{name}_error", f"No response within {deadline:g}s"
+    finally:
+        stop.set()
+
+
 if __name__ == "__main__":
     # Example usage
     test_prompt = "Explain the theory of relativity in simple terms."
@@ -0,0 +1,244 @@
+"""Batch scaffolding from a project manifest using a process pool."""
+
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .core.core_types import (
+    ExecutionContext,
+    ModuleResult,
+    ProjectType,
+    SystemConfig,
+)
+from .core.skeleton_cache import SkeletonCache
+from .core.template_engine import default_engine
+from .scaffold import ScaffoldOutcome, scaffold
+
+MANIFEST_SUFFIXES = (".toml", ".json", ".csv")
+
+# Skeleton cache and configuration of a batch worker process, set once by
+# _init_worker so they are not pickled with every task
+_worker_skeleton_cache: Optional[SkeletonCache] = None
+_worker_config: Optional[SystemConfig] = None
+
+
+@dataclass
+class BatchReport:
+    """Aggregated outcome of a batch scaffolding run."""
+
+    outcomes: List[ScaffoldOutcome] = field(default_factory=list)
+    wall_time: float = 0.0
+    workers: int = 1
+
+    @property
+    def succeeded(self) -> int:
+        """Return the number of projects created successfully."""
+        return sum(1 for outcome in self.outcomes if outcome.success)
+
+    @property
+    def failed(self) -> int:
+        """Return the number of projects that failed."""
+        return len(self.outcomes) - self.succeeded
+
+    @property
+    def throughput(self) -> float:
+        """Return projects completed per second of wall time."""
+        if self.wall_time <= 0:
+            return 0.0
+        return len(self.outcomes) / self.wall_time
+
+    def percentile(self, percent: float) -> float:
+        """Return the nearest-rank percentile of per-project latency.
+
+        Args:
+            percent: Percentile to compute, between 0 and 100
+
+        Returns:
+            Latency in seconds, or 0.0 if the batch was empty
+        """
+        latencies = sorted(outcome.elapsed for outcome in self.outcomes)
+        if not latencies:
+            return 0.0
+        rank = max(1, math.ceil(len(latencies) * percent / 100))
+        return latencies[min(rank, len(latencies)) - 1]
+
+    def summary(self) -> str:
+        """Return a one-line throughput summary."""
+        return (
+            f"{len(self.outcomes)} projects ({self.succeeded} succeeded, "
+            f"{self.failed} failed) in {self.wall_time:.2f}s with "
+            f"{self.workers} workers: {self.throughput:.1f} projects/sec, "
+            f"p50 {self.percentile(50) * 1000:.1f}ms, "
+            f"p95 {self.percentile(95) * 1000:.1f}ms per project"
+        )
+
+
+def _context_from_entry(
+    entry: Dict[str, Any], default_output: Optional[Path]
+) -> ExecutionContext:
+    """Build an execution context from a single manifest entry."""
+    name = str(entry.get("name") or "").strip()
+    if not name:
+        raise ValueError(f"Manifest entry is missing a project name: {entry}")
+
+    project_type = entry.get("type")
+    if project_type is None:
+        raise ValueError(f"Manifest entry '{name}' is missing a project type")
+
+    output = entry.get("output")
+    return ExecutionContext(
+        project_name=name,
+        project_type=ProjectType(str(project_type).strip()),
+        output_path=Path(output) if output else default_output,
+        advanced_mode=_as_bool(entry.get("advanced", False)),
+        github_integration=_as_bool(entry.get("github", False)),
+        skip_install=_as_bool(entry.get("skip_install", False)),
+        template_variant=str(entry.get("variant") or "default"),
+    )
+
+
+def _as_bool(value: Any) -> bool:
+    """Interpret manifest booleans, including CSV strings."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+def _check_unique_names(contexts: List[ExecutionContext]) -> None:
+    """Raise ValueError if two contexts share a project name."""
+    seen: Set[str] = set()
+    duplicates: List[str] = []
+    for context in contexts:
+        if context.project_name in seen and context.project_name not in duplicates:
+            duplicates.append(context.project_name)
+        seen.add(context.project_name)
+    if duplicates:
+        raise ValueError(
+            f"Manifest lists duplicate project names: {', '.join(duplicates)}"
+        )
+
+
+def _init_worker(
+    skeleton_cache: Optional[SkeletonCache], config: Optional[SystemConfig]
+) -> None:
+    """Store the batch's shared scaffold options in a worker process."""
+    global _worker_skeleton_cache, _worker_config
+    _worker_skeleton_cache = skeleton_cache
+    _worker_config = config
+
+
+def _scaffold_in_worker(context: ExecutionContext) -> ScaffoldOutcome:
+    """Scaffold a project with the options stored by _init_worker."""
+    return scaffold(
+        context, skeleton_cache=_worker_skeleton_cache, config=_worker_config
+    )
+
+
+def load_manifest(
+    path: Path, default_output: Optional[Path] = None
+) -> List[ExecutionContext]:
+    """Load execution contexts from a TOML, JSON or CSV manifest.
+
+    TOML and JSON manifests hold a ``projects`` list (JSON may also be a bare
+    list); CSV manifests need a header row. Each entry provides ``name`` and
+    ``type`` plus optional ``variant``, ``output``, ``advanced``, ``github``
+    and ``skip_install``.
+
+    Args:
+        path: Manifest file path
+        default_output: Output directory for entries without one
+
+    Returns:
+        One execution context per manifest entry
+    """
+    suffix = path.suffix.lower()
+    entries: List[Dict[str, Any]]
+
+    if suffix == ".toml":
+        import tomllib
+
+        with open(path, "rb") as f:
+            entries = tomllib.load(f).get("projects", [])
+    elif suffix == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        entries = data.get("projects", []) if isinstance(data, dict) else data
+    elif suffix == ".csv":
+        import csv
+
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            entries = list(csv.DictReader(f))
+    else:
+        raise ValueError(
+            f"Unsupported manifest format '{suffix}', "
+            f"expected one of {', '.join(MANIFEST_SUFFIXES)}"
+        )
+
+    return [_context_from_entry(entry, default_output) for entry in entries]
+
+
+def run_batch(
+    contexts: List[ExecutionContext],
+    workers: Optional[int] = None,
+    skeleton_cache: Optional[SkeletonCache] = None,
+    config: Optional[SystemConfig] = None,
+) -> BatchReport:
+    """Scaffold many projects in parallel on a bounded process pool.
+
+    Args:
+        contexts: Execution contexts to scaffold
+        workers: Maximum worker processes (defaults to the CPU count)
+        skeleton_cache: Optional cache of prebuilt project skeletons
+        config: System configuration whose timeout, retry and fail-fast
+            settings apply to every project
+
+    Returns:
+        Batch report with one outcome per context, in manifest order
+
+    Raises:
+        ValueError: If two contexts share a project name
+    """
+    _check_unique_names(contexts)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(contexts) or 1))
+    report = BatchReport(workers=workers)
+    outcomes: List[Optional[ScaffoldOutcome]] = [None] * len(contexts)
+
+    # Compile templates before forking so workers share the static chunks
+    default_engine().preload()
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(skeleton_cache, config),
+    ) as executor:
+        futures = {
+            executor.submit(_scaffold_in_worker, context): index
+            for index, context in enumerate(contexts)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                outcomes[index] = future.result()
+            except Exception as e:
+                context = contexts[index]
+                outcomes[index] = ScaffoldOutcome(
+                    project_name=context.project_name,
+                    project_root=context.project_root,
+                    results=[
+                        ModuleResult(
+                            module_name="batch",
+                            success=False,
+                            message=str(e),
+                            error=e,
+                        )
+                    ],
+                )
+    report.wall_time = time.perf_counter() - started
+    report.outcomes = [outcome for outcome in outcomes if outcome is not None]
+    return report
@@ -0,0 +1,325 @@
+"""Streaming zip and tar archives of a write plan."""
+
+import gzip
+import io
+import os
+import queue
+import tarfile
+import threading
+import time
+import zipfile
+from pathlib import PurePosixPath
+from typing import IO, Any, Callable, Iterator, List, Optional, Protocol, cast
+
+from .write_plan import FlushStats, WritePlan, _CopyOperation
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Archive format to the media type it is served with
+ARCHIVE_FORMATS = {
+    "tar": "application/x-tar",
+    "tar.gz": "application/gzip",
+    "tar.zst": "application/zstd",
+    "zip": "application/zip",
+}
+
+_SUFFIX_ALIASES = {".tgz": "tar.gz", ".tzst": "tar.zst"}
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Bytes handed from the archive writer to the consumer at a time, and how
+# many such chunks may be in flight; together they bound streaming memory
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_MAX_CHUNKS = 16
+
+# How often a blocked producer checks whether the consumer went away
+_CANCEL_POLL_SECONDS = 0.1
+
+_DONE = object()
+
+
+class WritableStream(Protocol):
+    """Binary stream an archive can be written to in one forward pass."""
+
+    def write(self, data: bytes, /) -> int:
+        """Write bytes and return how many were written."""
+
+    def flush(self) -> None:
+        """Push buffered bytes to the underlying sink."""
+
+    def close(self) -> None:
+        """Close the stream."""
+
+
+def available_formats() -> List[str]:
+    """Return the archive formats usable with the installed packages."""
+    return [fmt for fmt in ARCHIVE_FORMATS if fmt != "tar.zst" or zstandard]
+
+
+def check_format(archive_format: str) -> str:
+    """Validate an archive format name.
+
+    Args:
+        archive_format: One of ARCHIVE_FORMATS
+
+    Returns:
+        The format name
+
+    Raises:
+        ValueError: If the format is unknown or needs a missing package
+    """
+    if archive_format not in ARCHIVE_FORMATS:
+        choices = ", ".join(ARCHIVE_FORMATS)
+        raise ValueError(f"Unknown archive format {archive_format!r} ({choices})")
+    if archive_format not in available_formats():
+        raise ValueError(f"{archive_format} archives require the zstandard package")
+    return archive_format
+
+
+def format_for_path(path: str) -> str:
+    """Infer the archive format from a file name, e.g. out.tar.zst.
+
+    Raises:
+        ValueError: If the suffix names no supported format
+    """
+    name = path.lower()
+    for suffix, archive_format in _SUFFIX_ALIASES.items():
+        if name.endswith(suffix):
+            return check_format(archive_format)
+    for archive_format in sorted(ARCHIVE_FORMATS, key=len, reverse=True):
+        if name.endswith(f".{archive_format}"):
+            return check_format(archive_format)
+    raise ValueError(f"Cannot infer the archive format of {path}")
+
+
+def write_archive(
+    plan: WritePlan, fileobj: WritableStream, archive_format: str, prefix: str = ""
+) -> FlushStats:
+    """Serialize a write plan into an archive without touching the disk.
+
+    Entries are written in a single forward pass, so ``fileobj`` may be an
+    unseekable stream such as a pipe, a socket or an ArchiveStream; zip
+    entries then carry data descriptors instead of patched headers.
+
+    Args:
+        plan: Write plan to archive
+        fileobj: Binary stream the archive is written to; left open
+        archive_format: One of available_formats()
+        prefix: Directory every entry is placed under, e.g. the project name
+
+    Returns:
+        Statistics about the entries written; bytes are uncompressed
+
+    Raises:
+        ValueError: If the format is unknown or unavailable
+    """
+    check_format(archive_format)
+    root = PurePosixPath(prefix)
+    stats = FlushStats(collapsed_writes=plan.collapsed_writes)
+    directories = [root, *(root / path for path in plan.directories())]
+    directories = [path for path in directories if path.parts]
+    files = [(root / path, content) for path, content in plan.files()]
+
+    if archive_format == "zip":
+        _write_zip(directories, files, fileobj, stats)
+        return stats
+
+    compressed: Optional[Any] = None
+    if archive_format == "tar.gz":
+        compressed = gzip.GzipFile(
+            fileobj=fileobj, mode="wb", compresslevel=GZIP_LEVEL, mtime=0
+        )
+    elif archive_format == "tar.zst":
+        compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(
+            fileobj, closefd=False
+        )
+    try:
+        _write_tar(directories, files, compressed or fileobj, stats)
+    finally:
+        if compressed is not None:
+            compressed.close()
+    return stats
+
+
+def _write_tar(
+    directories: List[PurePosixPath],
+    files: List[Any],
+    fileobj: WritableStream,
+    stats: FlushStats,
+) -> None:
+    """Write archive entries as an uncompressed tar stream."""
+    mtime = int(time.time())
+    # Stream mode ("w|") only writes, though tarfile's stubs ask for a full file
+    stream = cast(IO[bytes], fileobj)
+    with tarfile.open(fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+        for directory in directories:
+            info = tarfile.TarInfo(directory.as_posix())
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            info.mtime = mtime
+            tar.addfile(info)
+            stats.directories += 1
+
+        for path, content in files:
+            info = tarfile.TarInfo(path.as_posix())
+            info.mode = 0o644
+            info.mtime = mtime
+            if isinstance(content, _CopyOperation):
+                with open(content.source, "rb") as source:
+                    status = os.fstat(source.fileno())
+                    info.size = status.st_size
+                    info.mode = status.st_mode & 0o777
+                    info.mtime = int(status.st_mtime)
+                    tar.addfile(info, source)
+            else:
+                data = content if isinstance(content, bytes) else b"".join(content)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+            stats.files += 1
+            stats.bytes_written += info.size
+
+
+def _write_zip(
+    directories: List[PurePosixPath],
+    files: List[Any],
+    fileobj: WritableStream,
+    stats: FlushStats,
+) -> None:
+    """Write archive entries as a deflated zip stream."""
+    date_time = time.localtime()[:6]
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for directory in directories:
+            info = zipfile.ZipInfo(f"{directory.as_posix()}/", date_time)
+            info.external_attr = (0o40755 << 16) | 0x10
+            archive.writestr(info, b"")
+            stats.directories += 1
+
+        for path, content in files:
+            if isinstance(content, _CopyOperation):
+                archive.write(content.source, path.as_posix())
+                stats.bytes_written += archive.getinfo(path.as_posix()).file_size
+            else:
+                info = zipfile.ZipInfo(path.as_posix(), date_time)
+                info.external_attr = 0o644 << 16
+                info.compress_type = zipfile.ZIP_DEFLATED
+                chunks = (content,) if isinstance(content, bytes) else content
+                with archive.open(info, "w") as entry:
+                    for chunk in chunks:
+                        entry.write(chunk)
+                stats.bytes_written += sum(len(chunk) for chunk in chunks)
+            stats.files += 1
+
+
+class ArchiveStream(io.RawIOBase):
+    """Write-only stream handing fixed-size chunks to a bounded queue.
+
+    The producer blocks once ``max_chunks`` chunks are waiting, so a slow
+    consumer throttles archive generation instead of letting it buffer the
+    whole archive. After ``cancel()`` every write raises BrokenPipeError.
+    """
+
+    def __init__(
+        self, max_chunks: int = STREAM_MAX_CHUNKS, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            max_chunks: Chunks allowed to wait for the consumer
+            chunk_size: Bytes per chunk
+        """
+        super().__init__()
+        self.chunks: "queue.Queue[Any]" = queue.Queue(maxsize=max_chunks)
+        self.chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._cancelled = threading.Event()
+
+    def writable(self) -> bool:
+        """Return True; the stream is write-only."""
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        """Buffer bytes and hand full chunks to the consumer."""
+        self._buffer += data
+        while len(self._buffer) >= self.chunk_size:
+            self.put(bytes(self._buffer[: self.chunk_size]))
+            del self._buffer[: self.chunk_size]
+        return len(data)
+
+    def flush(self) -> None:
+        """Hand any buffered bytes to the consumer."""
+        if self._buffer:
+            self.put(bytes(self._buffer))
+            self._buffer.clear()
+
+    def put(self, item: Any) -> None:
+        """Queue an item, waiting for room unless the stream is cancelled.
+
+        Raises:
+            BrokenPipeError: If the consumer cancelled the stream
+        """
+        while not self._cancelled.is_set():
+            try:
+                self.chunks.put(item, timeout=_CANCEL_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+        raise BrokenPipeError("Archive consumer went away")
+
+    def cancel(self) -> None:
+        """Stop the producer at its next write."""
+        self._cancelled.set()
+
+
+def stream_archive(
+    produce: Callable[[WritableStream], Any],
+    max_chunks: int = STREAM_MAX_CHUNKS,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Run an archive producer on a thread and yield the bytes it writes.
+
+    The producer starts on the first ``next()``, so bytes are yielded while
+    it is still writing and at most ``max_chunks * chunk_size`` bytes are
+    buffered. Closing the iterator early stops the producer.
+
+    Args:
+        produce: Callable writing an archive to the stream it is passed
+        max_chunks: Chunks allowed to wait for the consumer
+        chunk_size: Bytes per chunk
+
+    Returns:
+        Iterator over the archive bytes
+
+    Raises:
+        Exception: Whatever the producer raised, once its earlier output
+            has been yielded
+    """
+    stream = ArchiveStream(max_chunks, chunk_size)
+
+    def run() -> None:
+        result: Any = _DONE
+        try:
+            produce(stream)
+            stream.flush()
+        except BaseException as e:
+            result = e
+        try:
+            stream.put(result)
+        except BrokenPipeError:
+            pass
+
+    thread = threading.Thread(target=run, name="archive", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = stream.chunks.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stream.cancel()
@@ -4,7 +4,13 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from .profiling import Profiler
+from .write_plan import WritePlan
+
+if TYPE_CHECKING:
+    from .events import EventChannel
 
 
 class ProjectType(str, Enum):
@@ -69,6 +75,20 @@ class SystemConfig:
     retry_attempts: int = 3
     fail_fast: bool = True
 
+    # Web server settings
+    server_output_root: Path = field(default_factory=lambda: Path("projects"))
+    server_workers: int = 4
+    server_queue_size: int = 64
+    server_max_jobs: int = 1000
+
+    # Admission control for scaffold requests; a rate of 0 disables limiting
+    rate_limit_per_second: float = 2.0
+    rate_limit_burst: int = 10
+    rate_limit_clients: int = 10_000
+    max_concurrent_scaffolds: int = 8
+    admission_queue_size: int = 16
+    admission_timeout_seconds: float = 2.0
+
     def __post_init__(self) -> None:
         """Initialize directory paths."""
         self.core_dir = self.base_dir / "core"
@@ -96,9 +116,17 @@ class ExecutionContext:
     skip_install: bool = False
     template_variant: str = "default"
     config_override: Optional[Path] = None
+    # False when the plan is streamed into an archive instead of the disk
+    write_to_disk: bool = True
+    # Whether the global .env (with its secrets) is copied into the project
+    include_env_file: bool = True
 
     # Runtime state
     current_phase: Optional[ExecutionPhase] = None
+    write_plan: WritePlan = field(default_factory=WritePlan, repr=False)
+    skeleton_cached: bool = False
+    profiler: Profiler = field(default_factory=Profiler, repr=False)
+    events: Optional["EventChannel"] = field(default=None, repr=False)
 
     @property
     def project_root(self) -> Path:
@@ -107,6 +135,16 @@ class ExecutionContext:
             return self.output_path / self.project_name
         return Path(self.project_name)
 
+    def emit(self, kind: str, **data: Any) -> None:
+        """Publish a progress event if the context has an event channel.
+
+        Args:
+            kind: Event kind, e.g. module_started
+            **data: JSON-serializable event payload
+        """
+        if self.events is not None:
+            self.events.publish(kind, **data)
+
 
 @dataclass
 class ModuleResult:
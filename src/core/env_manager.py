@@ -1,24 +1,386 @@
 """Environment manager module for centralized environment configuration."""
 
+import contextlib
 import os
 import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
 
-from dotenv import load_dotenv
+from .file_lock import DEFAULT_LOCK_TIMEOUT, FileLock
+from .write_plan import WritePlan
+
+# Identifies one version of a file: (inode, size, mtime in nanoseconds)
+FileStamp = Tuple[int, int, int]
+
+# Seconds a cached file is trusted before lookups stat it again
+REVALIDATE_SECONDS = 0.5
+
+
+def stamp_of(status: os.stat_result) -> FileStamp:
+    """Return the stamp of a stat result."""
+    return status.st_ino, status.st_size, status.st_mtime_ns
+
+
+def file_stamp(path: Path) -> Optional[FileStamp]:
+    """Return the stamp of a file, or None if it does not exist."""
+    try:
+        return stamp_of(os.stat(path))
+    except FileNotFoundError:
+        return None
+
+
+def parse_env(text: str) -> Dict[str, str]:
+    """Parse the KEY=value entries of .env text."""
+    values = {}
+    for line in text.splitlines():
+        if "=" in line and not line.startswith("#"):
+            key, value = line.strip().split("=", 1)
+            values[key] = value
+    return values
+
+
+def apply_changes(text: str, changes: Mapping[str, Optional[str]]) -> str:
+    """Apply set and unset operations to .env text.
+
+    Comments, blank lines and the order of existing entries are kept;
+    changed entries are rewritten in place and new ones appended.
+
+    Args:
+        text: Current .env text
+        changes: New value per key, or None to remove the key
+
+    Returns:
+        The updated text
+    """
+    lines = []
+    written = set()
+    for line in text.splitlines(keepends=True):
+        if "=" in line and not line.startswith("#"):
+            key = line.strip().split("=", 1)[0]
+            if key in changes:
+                # Drop removed keys and duplicates of a rewritten key
+                if changes[key] is None or key in written:
+                    continue
+                written.add(key)
+                line = f"{key}={changes[key]}\n"
+        lines.append(line)
+
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    for key, value in changes.items():
+        if value is not None and key not in written:
+            lines.append(f"{key}={value}\n")
+    return "".join(lines)
+
+
+def write_text_atomic(path: Path, text: str) -> FileStamp:
+    """Replace a file's contents in one atomic, durable step.
+
+    The text is written to a synced temp file in the same directory that
+    then replaces the file, so readers see either the old or the new
+    contents. An existing file keeps its permissions; a new file is only
+    readable by its owner since .env files hold secrets.
+
+    Args:
+        path: File to replace
+        text: New contents
+
+    Returns:
+        Stamp of the new file version
+    """
+    fd, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            shutil.copymode(path, temp_name)
+        except FileNotFoundError:
+            pass
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_name)
+        raise
+    return stamp_of(os.stat(path))
+
+
+def render_example(text: str) -> str:
+    """Render .env text as a .env.example with placeholder values."""
+    lines = []
+    for line in text.splitlines(keepends=True):
+        if "=" in line and not line.startswith("#"):
+            key, _ = line.strip().split("=", 1)
+            lines.append(f"{key}=your_{key.lower()}_here\n")
+        else:
+            lines.append(line)
+    return "".join(lines)
+
+
+class ParsedEnv:
+    """Parsed contents of one version of a .env file."""
+
+    def __init__(self, stamp: FileStamp, text: str, values: Dict[str, str]) -> None:
+        """Initialize the parsed file.
+
+        Args:
+            stamp: Stamp of the file version the text was read from
+            text: File text
+            values: KEY=value entries of the text
+        """
+        self.stamp = stamp
+        self.text = text
+        self.values = values
+        self.checked = time.monotonic()
+
+    @cached_property
+    def example(self) -> str:
+        """Return the .env.example rendering, computed on first use."""
+        return render_example(self.text)
+
+
+class EnvFileCache:
+    """Parsed .env files, re-parsed only when their stamp changes.
+
+    A lookup trusts a cached file for ``max_age`` seconds and then stats it;
+    the file is read and parsed again only when its inode, size or
+    modification time differs from the cached version.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: Dict[Path, ParsedEnv] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, max_age: float = 0.0) -> Optional[ParsedEnv]:
+        """Return the parsed file, or None if it does not exist.
+
+        Args:
+            path: File to return
+            max_age: Seconds since the last check within which the cached
+                version is returned without a stat call
+        """
+        cached = self._entries.get(path)
+        if cached is not None and time.monotonic() - cached.checked < max_age:
+            return cached
+
+        stamp = file_stamp(path)
+        if stamp is None:
+            with self._lock:
+                self._entries.pop(path, None)
+            return None
+        if cached is not None and cached.stamp == stamp:
+            cached.checked = time.monotonic()
+            return cached
+
+        # Keyed by the stamp taken before reading, so a write racing the
+        # read changes the stamp and is parsed on the next lookup
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        parsed = ParsedEnv(stamp, text, parse_env(text))
+        with self._lock:
+            self._entries[path] = parsed
+        return parsed
+
+    def put(
+        self, path: Path, stamp: FileStamp, text: str, values: Dict[str, str]
+    ) -> None:
+        """Record the contents just written to a file, sparing a re-parse.
+
+        Args:
+            path: File that was written
+            stamp: Stamp of the file right after the write
+            text: Text written
+            values: KEY=value entries of the text
+        """
+        with self._lock:
+            self._entries[path] = ParsedEnv(stamp, text, values)
+
+
+# Shared so every EnvManager (one per module instance) reuses parsed files
+_env_files = EnvFileCache()
+
+
+@dataclass(frozen=True)
+class EnvLayer:
+    """One source of variables in a layered environment."""
+
+    name: str
+    # None for the process environment
+    path: Optional[Path] = None
+
+    def read(self) -> Tuple[Dict[str, str], Optional[FileStamp]]:
+        """Return the layer's variables and the stamp of the version read.
+
+        Missing files are an empty layer with no stamp.
+        """
+        if self.path is None:
+            return dict(os.environ), None
+        parsed = _env_files.get(self.path)
+        if parsed is None:
+            return {}, None
+        return parsed.values, parsed.stamp
+
+
+class EnvSnapshot(Mapping[str, str]):
+    """Immutable merged view of a stack of environment layers.
+
+    Layers are ordered from highest to lowest precedence and merged once
+    when the snapshot is built, so lookups are plain dictionary reads.
+    Every key records the layer it came from. The process environment is
+    captured at build time; file layers can be checked with ``is_stale()``
+    and rebuilt with ``refresh()``.
+    """
+
+    def __init__(self, layers: Tuple[EnvLayer, ...]) -> None:
+        """Read and merge the layers.
+
+        Args:
+            layers: Layers from highest to lowest precedence
+        """
+        self.layers = layers
+        layer_values = []
+        stamps = []
+        for layer in layers:
+            values, stamp = layer.read()
+            layer_values.append(values)
+            stamps.append(stamp)
+
+        merged: Dict[str, str] = {}
+        sources: Dict[str, EnvLayer] = {}
+        # Lowest precedence first so higher layers overwrite
+        for layer, values in zip(reversed(layers), reversed(layer_values)):
+            merged.update(values)
+            sources.update(dict.fromkeys(values, layer))
+
+        self._layer_values = tuple(layer_values)
+        self._stamps = tuple(stamps)
+        self._values = MappingProxyType(merged)
+        self._sources = MappingProxyType(sources)
+        self.built = time.time()
+
+    def __getitem__(self, key: str) -> str:
+        """Return the value of a key."""
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys."""
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a key is set in any layer."""
+        return key in self._values
+
+    def source(self, key: str) -> Optional[EnvLayer]:
+        """Return the layer a key's value comes from, or None if unset."""
+        return self._sources.get(key)
+
+    def definitions(self, key: str) -> List[Tuple[EnvLayer, str]]:
+        """Return every layer defining a key, highest precedence first.
+
+        Args:
+            key: Variable to look up
+
+        Returns:
+            (layer, value) pairs; the first one is the effective value
+        """
+        return [
+            (layer, values[key])
+            for layer, values in zip(self.layers, self._layer_values)
+            if key in values
+        ]
+
+    def is_stale(self) -> bool:
+        """Return whether a file layer changed on disk since the snapshot."""
+        return any(
+            layer.path is not None and file_stamp(layer.path) != stamp
+            for layer, stamp in zip(self.layers, self._stamps)
+        )
+
+    def refresh(self) -> "EnvSnapshot":
+        """Return this snapshot if its files are unchanged, else a rebuilt one.
+
+        The process environment is only captured again when a file changed.
+        """
+        return EnvSnapshot(self.layers) if self.is_stale() else self
+
+
+class EnvTransaction:
+    """Set and unset operations on the global .env, applied together.
+
+    Operations are only recorded in memory; ``commit()`` merges them into
+    the latest file contents under the cross-process lock and replaces the
+    file in one atomic step.
+    """
+
+    def __init__(self, manager: "EnvManager") -> None:
+        """Initialize an empty transaction.
+
+        Args:
+            manager: Environment manager owning the global .env
+        """
+        self.manager = manager
+        self.changes: Dict[str, Optional[str]] = {}
+
+    def set(self, key: str, value: str) -> None:
+        """Set a variable when the transaction commits."""
+        self.changes[key] = value
+
+    def unset(self, key: str) -> None:
+        """Remove a variable when the transaction commits."""
+        self.changes[key] = None
+
+    def update(self, env_vars: Mapping[str, str]) -> None:
+        """Set several variables when the transaction commits."""
+        self.changes.update(env_vars)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Return a variable as it will be after the commit."""
+        if key in self.changes:
+            value = self.changes[key]
+            return default if value is None else value
+        return self.manager.global_env().get(key, default)
+
+    def commit(self) -> None:
+        """Apply the recorded operations to the global .env file."""
+        if self.changes:
+            self.manager._apply_changes(self.changes)
+        self.changes = {}
 
 
 class EnvManager:
     """Manages environment configuration across projects."""
 
-    def __init__(self, base_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+    ) -> None:
         """Initialize environment manager.
 
         Args:
             base_dir: Base directory for environment files (defaults to user home)
+            lock_timeout: Seconds to wait for another process updating the
+                global .env
         """
         self.base_dir = base_dir or Path.home() / ".cursor" / "env"
         self.env_file = self.base_dir / ".env"
+        self.lock_file = self.base_dir / ".env.lock"
+        self.lock_timeout = lock_timeout
         self._ensure_base_dir()
 
     def _ensure_base_dir(self) -> None:
@@ -28,60 +390,171 @@ class EnvManager:
     def load_global_env(self) -> None:
         """Load global environment variables."""
         if self.env_file.exists():
+            # Deferred so creating projects does not pay for importing dotenv
+            from dotenv import load_dotenv
+
             load_dotenv(self.env_file)
 
+    def global_env(self) -> Dict[str, str]:
+        """Return the variables in the global .env file.
+
+        The file is parsed once and re-parsed only when it changes on disk,
+        which is checked at most every REVALIDATE_SECONDS; treat the
+        returned mapping as read-only.
+        """
+        parsed = _env_files.get(self.env_file, REVALIDATE_SECONDS)
+        return parsed.values if parsed is not None else {}
+
+    def parsed_global_env(self) -> Optional[ParsedEnv]:
+        """Return the parsed global .env, or None if it does not exist.
+
+        The file is stat'ed and re-parsed only if it changed since it was
+        last read; treat the result as read-only.
+        """
+        return _env_files.get(self.env_file)
+
+    @contextmanager
+    def transaction(self) -> Iterator[EnvTransaction]:
+        """Batch updates to the global .env into one atomic write.
+
+        The operations recorded inside the block are committed when it
+        exits normally and discarded if it raises::
+
+            with env_manager.transaction() as env:
+                env.set("API_URL", "https://example.com")
+                env.unset("LEGACY_TOKEN")
+
+        Yields:
+            The transaction recording the operations
+        """
+        transaction = EnvTransaction(self)
+        yield transaction
+        transaction.commit()
+
     def save_global_env(self, env_vars: Dict[str, str]) -> None:
         """Save environment variables to global .env file.
 
         Args:
             env_vars: Dictionary of environment variables to save
         """
-        # Read existing variables
-        existing_vars = {}
-        if self.env_file.exists():
-            with open(self.env_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if "=" in line and not line.startswith("#"):
-                        key, value = line.strip().split("=", 1)
-                        existing_vars[key] = value
+        with self.transaction() as transaction:
+            transaction.update(env_vars)
+
+    def _apply_changes(self, changes: Mapping[str, Optional[str]]) -> None:
+        """Merge changes into the latest global .env and replace it atomically.
 
-        # Update with new variables
-        existing_vars.update(env_vars)
+        Concurrent writers in other processes are serialized by an advisory
+        lock, and each merges into whatever the previous one wrote, so no
+        update is lost and readers never see a partially written file.
+        """
+        with FileLock(self.lock_file, self.lock_timeout):
+            # Re-parsed only if another writer changed the file
+            parsed = _env_files.get(self.env_file)
+            values = dict(parsed.values) if parsed is not None else {}
+            text = apply_changes(parsed.text if parsed is not None else "", changes)
+            for key, value in changes.items():
+                if value is None:
+                    values.pop(key, None)
+                else:
+                    values[key] = value
 
-        # Write back to file
-        with open(self.env_file, "w", encoding="utf-8") as f:
-            for key, value in existing_vars.items():
-                f.write(f"{key}={value}\n")
+            stamp = write_text_atomic(self.env_file, text)
+            _env_files.put(self.env_file, stamp, text, values)
 
-    def copy_to_project(self, project_dir: Path) -> None:
+    def copy_to_project(
+        self, project_dir: Path, plan: Optional[WritePlan] = None, copy_env: bool = True
+    ) -> None:
         """Copy global environment to project directory.
 
         Args:
             project_dir: Project directory to copy environment to
+            plan: Write plan to record the files in instead of writing them
+                immediately
+            copy_env: Copy the global .env itself, not just the .env.example
+                rendered from it
         """
-        if not self.env_file.exists():
+        parsed = self.parsed_global_env()
+        if parsed is None:
+            return
+
+        # .env.example with placeholder values, rendered once per file version
+        example_content = parsed.example
+
+        project_env = project_dir / ".env"
+        if plan is not None:
+            plan.write_text(".env.example", example_content)
+            if copy_env and not plan.has_file(".env") and not project_env.exists():
+                plan.copy_file(".env", self.env_file)
             return
 
         # Create .env.example in project
-        example_file = project_dir / ".env.example"
-        with open(self.env_file, "r", encoding="utf-8") as src, open(
-            example_file, "w", encoding="utf-8"
-        ) as dst:
-            for line in src:
-                if "=" in line and not line.startswith("#"):
-                    key, _ = line.strip().split("=", 1)
-                    dst.write(f"{key}=your_{key.lower()}_here\n")
-                else:
-                    dst.write(line)
+        with open(project_dir / ".env.example", "w", encoding="utf-8") as dst:
+            dst.write(example_content)
 
         # Copy actual .env if it doesn't exist
-        project_env = project_dir / ".env"
-        if not project_env.exists():
+        if copy_env and not project_env.exists():
             shutil.copy2(self.env_file, project_env)
 
+    def layers(
+        self,
+        project_dir: Optional[Path] = None,
+        environment: Optional[str] = None,
+        include_process: bool = True,
+    ) -> Tuple[EnvLayer, ...]:
+        """Return the environment layers, highest precedence first.
+
+        The stack is: process environment, the project's .env, the
+        project's .env.<environment> and the global .env.
+
+        Args:
+            project_dir: Project whose .env files are layered in
+            environment: Environment name, e.g. development for
+                .env.development
+            include_process: Layer the process environment on top
+
+        Returns:
+            The layers; files that do not exist resolve to empty layers
+        """
+        layers = []
+        if include_process:
+            layers.append(EnvLayer("process"))
+        if project_dir is not None:
+            layers.append(EnvLayer("project", project_dir / ".env"))
+            if environment:
+                layers.append(
+                    EnvLayer(environment, project_dir / f".env.{environment}")
+                )
+        layers.append(EnvLayer("global", self.env_file))
+        return tuple(layers)
+
+    def snapshot(
+        self,
+        project_dir: Optional[Path] = None,
+        environment: Optional[str] = None,
+        include_process: bool = True,
+    ) -> EnvSnapshot:
+        """Build a merged, immutable view of the environment layers.
+
+        Files are parsed through the shared cache, so building snapshots
+        of unchanged files does not read them again. Unlike
+        ``load_global_env`` the snapshot never modifies ``os.environ``.
+
+        Args:
+            project_dir: Project whose .env files are layered in
+            environment: Environment name, e.g. development for
+                .env.development
+            include_process: Layer the process environment on top
+
+        Returns:
+            The snapshot
+        """
+        return EnvSnapshot(self.layers(project_dir, environment, include_process))
+
     def get_env_value(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get environment variable value.
 
+        The process environment takes precedence over the global .env file.
+
         Args:
             key: Environment variable key
             default: Default value if not found
@@ -89,14 +562,33 @@ class EnvManager:
         Returns:
             Environment variable value or default
         """
-        return os.environ.get(key, default)
+        value = os.environ.get(key)
+        if value is None:
+            value = self.global_env().get(key, default)
+        return value
 
     def set_env_value(self, key: str, value: str) -> None:
         """Set environment variable value.
 
+        To set several variables, use ``set_env_values`` so the global .env
+        is rewritten once rather than once per key.
+
         Args:
             key: Environment variable key
             value: Environment variable value
         """
-        os.environ[key] = value
-        self.save_global_env({key: value})
+        self.set_env_values({key: value})
+
+    def set_env_values(self, env_vars: Mapping[str, str]) -> None:
+        """Set several environment variables in one write of the global .env.
+
+        The variables are also set in the process environment, like
+        ``set_env_value`` does.
+
+        Args:
+            env_vars: Dictionary of environment variables to set
+        """
+        if not env_vars:
+            return
+        self._apply_changes(env_vars)
+        os.environ.update(env_vars)
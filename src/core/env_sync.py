@@ -0,0 +1,243 @@
+"""Push the global .env to many generated projects in parallel."""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .env_manager import EnvManager, apply_changes, parse_env, write_text_atomic
+
+# Files that mark a directory as a generated project
+PROJECT_MARKERS = (".env", ".env.example")
+
+
+@dataclass
+class ProjectSync:
+    """Changes made to, or planned for, one project's env files."""
+
+    project_dir: Path
+    # File name to the keys added or updated in it
+    changed: Dict[str, List[str]] = field(default_factory=dict)
+    # Files that did not exist and were created
+    created: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class SyncReport:
+    """Aggregated outcome of syncing many projects."""
+
+    projects: List[ProjectSync] = field(default_factory=list)
+    wall_time: float = 0.0
+    workers: int = 1
+    dry_run: bool = False
+
+    @property
+    def changed(self) -> int:
+        """Return the number of projects with at least one changed file."""
+        return sum(1 for project in self.projects if project.changed)
+
+    @property
+    def failed(self) -> int:
+        """Return the number of projects that could not be synced."""
+        return sum(1 for project in self.projects if project.error)
+
+    @property
+    def files_written(self) -> int:
+        """Return the number of files rewritten or created."""
+        return sum(len(project.changed) for project in self.projects)
+
+    def summary(self) -> str:
+        """Return a one-line summary."""
+        verb = "would change" if self.dry_run else "changed"
+        return (
+            f"{len(self.projects)} projects synced in {self.wall_time:.2f}s with "
+            f"{self.workers} workers: {self.changed} {verb} "
+            f"({self.files_written} files), {self.failed} failed"
+        )
+
+
+def find_projects(root: Path) -> List[Path]:
+    """Return the root and its subdirectories that hold project env files.
+
+    Args:
+        root: Directory holding generated projects, or a single project
+
+    Returns:
+        Project directories, sorted
+    """
+    candidates = [root]
+    with os.scandir(root) as entries:
+        candidates.extend(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith(".")
+        )
+    return sorted(
+        candidate
+        for candidate in candidates
+        if any((candidate / marker).is_file() for marker in PROJECT_MARKERS)
+    )
+
+
+def load_project_index(path: Path) -> List[Path]:
+    """Return the project directories listed in an index file.
+
+    Scaffolding manifests (TOML, JSON or CSV) resolve to the project
+    directory of every entry; any other file lists one directory per line,
+    with blank lines and # comments ignored.
+
+    Args:
+        path: Index file
+
+    Returns:
+        Project directories in index order
+    """
+    # Deferred: importing the batch module pulls in the whole pipeline
+    from ..batch import MANIFEST_SUFFIXES, load_manifest
+
+    if path.suffix.lower() in MANIFEST_SUFFIXES:
+        return [context.project_root for context in load_manifest(path)]
+
+    with open(path, "r", encoding="utf-8") as f:
+        lines = (line.strip() for line in f)
+        return [Path(line) for line in lines if line and not line.startswith("#")]
+
+
+def _read_text(path: Path) -> Optional[str]:
+    """Return a file's text, or None if it does not exist."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+class EnvSync:
+    """Brings project env files up to date with the global .env.
+
+    The global file is parsed and its .env.example rendering computed once
+    for the whole run. Each project's files are diffed against it and only
+    files that differ are rewritten:
+
+    - ``.env`` gets every global value it lacks or holds an older value
+      for; keys only the project defines are left alone. Projects without
+      a ``.env`` are skipped, so secrets are never copied into a project
+      that did not already receive them.
+    - ``.env.example`` gets placeholders for global keys it does not list;
+      existing entries, which come from the project template, are kept.
+      A missing ``.env.example`` is created, since it holds no secrets.
+    """
+
+    def __init__(
+        self, env_manager: Optional[EnvManager] = None, dry_run: bool = False
+    ) -> None:
+        """Initialize the sync from the current global .env.
+
+        Args:
+            env_manager: Manager of the global .env (defaults to EnvManager())
+            dry_run: Report what would change without writing
+
+        Raises:
+            FileNotFoundError: If the global .env does not exist
+        """
+        manager = env_manager or EnvManager()
+        parsed = manager.parsed_global_env()
+        if parsed is None:
+            raise FileNotFoundError(f"Global env file not found: {manager.env_file}")
+        self.dry_run = dry_run
+        self.values = parsed.values
+        self.example = parsed.example
+        self.placeholders = parse_env(self.example)
+
+    def sync_project(self, project_dir: Path) -> ProjectSync:
+        """Sync one project's env files.
+
+        Args:
+            project_dir: Project directory
+
+        Returns:
+            The changes made, or the error that stopped the project
+        """
+        result = ProjectSync(project_dir)
+        try:
+            if not project_dir.is_dir():
+                raise FileNotFoundError(f"Project directory not found: {project_dir}")
+            self._sync_file(result, ".env", None, self.values, overwrite=True)
+            self._sync_file(
+                result, ".env.example", self.example, self.placeholders, overwrite=False
+            )
+        except OSError as e:
+            result.error = str(e)
+        return result
+
+    def _sync_file(
+        self,
+        result: ProjectSync,
+        name: str,
+        initial: Optional[str],
+        values: Dict[str, str],
+        overwrite: bool,
+    ) -> None:
+        """Diff one env file against the global values and rewrite it if needed.
+
+        Args:
+            result: Project result to record the change in
+            name: File name inside the project
+            initial: Contents of the file if it has to be created, or None
+                to leave a missing file missing
+            values: Global entries the file should hold
+            overwrite: Update entries whose value differs, not just add
+                missing ones
+        """
+        path = result.project_dir / name
+        text = _read_text(path)
+        if text is None:
+            if initial is None:
+                return
+            changes = dict(values)
+            new_text = initial
+            result.created.append(name)
+        else:
+            current = parse_env(text)
+            changes = {
+                key: value
+                for key, value in values.items()
+                if key not in current or (overwrite and current[key] != value)
+            }
+            if not changes:
+                return
+            new_text = apply_changes(text, changes)
+
+        result.changed[name] = list(changes)
+        if not self.dry_run:
+            write_text_atomic(path, new_text)
+
+    def run(
+        self, projects: Iterable[Path], workers: Optional[int] = None
+    ) -> SyncReport:
+        """Sync many projects on a thread pool.
+
+        Args:
+            projects: Project directories
+            workers: Maximum worker threads (defaults to the thread pool
+                default)
+
+        Returns:
+            Report with one result per project, in input order
+        """
+        projects = list(projects)
+        # The work is file I/O, so use more threads than cores
+        workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        workers = max(1, min(workers, len(projects) or 1))
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.sync_project, projects))
+        return SyncReport(
+            projects=results,
+            wall_time=time.perf_counter() - started,
+            workers=workers,
+            dry_run=self.dry_run,
+        )
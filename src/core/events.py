@@ -0,0 +1,277 @@
+"""Bounded, non-blocking in-process event bus for scaffold progress."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+# Events kept per topic for subscribers that connect late
+DEFAULT_HISTORY = 256
+
+# Events a subscriber may fall behind by before the oldest are dropped
+DEFAULT_MAX_PENDING = 1024
+
+
+@dataclass(frozen=True)
+class Event:
+    """A progress event published on a topic."""
+
+    topic: str
+    sequence: int
+    kind: str
+    data: Dict[str, Any]
+    timestamp: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the event as JSON-serializable data."""
+        return {
+            "topic": self.topic,
+            "sequence": self.sequence,
+            "kind": self.kind,
+            "data": self.data,
+            "timestamp": self.timestamp,
+        }
+
+
+class Subscription:
+    """Bounded queue of events delivered to one consumer.
+
+    Publishers never wait for a subscription: when it is full the oldest
+    event is dropped and counted instead. Events can be consumed from a
+    thread with ``get()`` or from asyncio with ``wait()`` and ``drain()``.
+    """
+
+    def __init__(self, bus: "EventBus", topic: str, max_pending: int) -> None:
+        """Initialize the subscription.
+
+        Args:
+            bus: Bus the subscription belongs to
+            topic: Topic the subscription receives
+            max_pending: Undelivered events kept before the oldest are dropped
+        """
+        self.bus = bus
+        self.topic = topic
+        self.closed = False
+        self._events: Deque[Event] = deque(maxlen=max_pending)
+        self._dropped = 0
+        self._condition = threading.Condition()
+        self._ready: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __enter__(self) -> "Subscription":
+        """Return the subscription."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Unsubscribe from the bus."""
+        self.bus.unsubscribe(self)
+
+    def _push(self, event: Event) -> None:
+        """Queue an event, dropping the oldest if the queue is full."""
+        with self._condition:
+            if len(self._events) == self._events.maxlen:
+                self._dropped += 1
+            self._events.append(event)
+            self._condition.notify_all()
+        self._wake()
+
+    def _close(self) -> None:
+        """Mark the topic as finished."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+        self._wake()
+
+    def _wake(self) -> None:
+        """Wake an asyncio consumer waiting in ``wait()``."""
+        ready, loop = self._ready, self._loop
+        if ready is not None and loop is not None:
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                pass  # The consumer's loop has already shut down
+
+    def drain(self) -> Tuple[List[Event], int]:
+        """Take every queued event without waiting.
+
+        Returns:
+            The queued events and how many were dropped since the last drain
+        """
+        with self._condition:
+            events = list(self._events)
+            self._events.clear()
+            dropped, self._dropped = self._dropped, 0
+        return events, dropped
+
+    def get(self, timeout: Optional[float] = None) -> Tuple[List[Event], int]:
+        """Wait for events or the end of the topic, then drain.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            The queued events and how many were dropped since the last drain
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._events or self.closed, timeout)
+        return self.drain()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait on the running event loop until events arrive or the topic ends.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            False if the timeout expired first
+        """
+        if self._ready is None:
+            self._ready = asyncio.Event()
+            self._loop = asyncio.get_running_loop()
+        self._ready.clear()
+        if self._events or self.closed:
+            return True
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+@dataclass
+class _Topic:
+    """History and subscribers of one topic."""
+
+    history: Deque[Event]
+    subscribers: Set[Subscription] = field(default_factory=set)
+    sequence: int = 0
+    closed: bool = False
+
+
+class EventBus:
+    """Publishes progress events to subscribers without ever blocking.
+
+    Each topic (e.g. a job id) keeps its most recent events so late
+    subscribers can catch up, and every subscriber has its own bounded
+    queue, so a slow consumer only loses its own oldest events and never
+    slows the publisher down.
+    """
+
+    def __init__(
+        self, history: int = DEFAULT_HISTORY, max_pending: int = DEFAULT_MAX_PENDING
+    ) -> None:
+        """Initialize the bus.
+
+        Args:
+            history: Events kept per topic for late subscribers
+            max_pending: Undelivered events kept per subscriber
+        """
+        self.history = history
+        self.max_pending = max_pending
+        self._topics: Dict[str, _Topic] = {}
+        self._lock = threading.Lock()
+
+    def _topic(self, topic: str) -> _Topic:
+        """Return a topic's state, creating it if needed; caller holds the lock."""
+        state = self._topics.get(topic)
+        if state is None:
+            state = self._topics[topic] = _Topic(history=deque(maxlen=self.history))
+        return state
+
+    def publish(self, topic: str, kind: str, **data: Any) -> Optional[Event]:
+        """Publish an event to a topic's subscribers.
+
+        Args:
+            topic: Topic to publish on
+            kind: Event kind, e.g. module_started
+            **data: JSON-serializable event payload
+
+        Returns:
+            The event, or None if the topic is closed
+        """
+        with self._lock:
+            state = self._topic(topic)
+            if state.closed:
+                return None
+            state.sequence += 1
+            event = Event(topic, state.sequence, kind, data, time.time())
+            state.history.append(event)
+            # Delivered under the lock so every subscriber sees topic order
+            for subscription in state.subscribers:
+                subscription._push(event)
+        return event
+
+    def subscribe(
+        self, topic: str, after: int = 0, max_pending: Optional[int] = None
+    ) -> Subscription:
+        """Subscribe to a topic, replaying the events still in its history.
+
+        Args:
+            topic: Topic to subscribe to
+            after: Only replay events with a higher sequence number, e.g. the
+                last one a reconnecting client saw
+            max_pending: Undelivered events kept before the oldest are
+                dropped (defaults to the bus setting)
+
+        Returns:
+            The subscription; use it as a context manager to unsubscribe
+        """
+        subscription = Subscription(self, topic, max_pending or self.max_pending)
+        with self._lock:
+            state = self._topic(topic)
+            for event in state.history:
+                if event.sequence > after:
+                    subscription._push(event)
+            if state.closed:
+                subscription._close()
+            else:
+                state.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering events to a subscription."""
+        with self._lock:
+            state = self._topics.get(subscription.topic)
+            if state is not None:
+                state.subscribers.discard(subscription)
+
+    def close(self, topic: str) -> None:
+        """Mark a topic as finished; its history is kept for late subscribers."""
+        with self._lock:
+            state = self._topic(topic)
+            state.closed = True
+            subscribers, state.subscribers = state.subscribers, set()
+            for subscription in subscribers:
+                subscription._close()
+
+    def discard(self, topic: str) -> None:
+        """Forget a topic and its history."""
+        with self._lock:
+            state = self._topics.pop(topic, None)
+        if state is not None:
+            for subscription in state.subscribers:
+                subscription._close()
+
+    def channel(self, topic: str) -> "EventChannel":
+        """Return a publisher bound to a topic."""
+        return EventChannel(self, topic)
+
+
+class EventChannel:
+    """Publishes events to one topic of a bus."""
+
+    def __init__(self, bus: EventBus, topic: str) -> None:
+        """Initialize the channel.
+
+        Args:
+            bus: Bus to publish on
+            topic: Topic every event is published to
+        """
+        self.bus = bus
+        self.topic = topic
+
+    def publish(self, kind: str, **data: Any) -> None:
+        """Publish an event to the channel's topic."""
+        self.bus.publish(self.topic, kind, **data)
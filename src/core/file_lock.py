@@ -0,0 +1,98 @@
+"""Advisory file locks shared between processes."""
+
+import os
+import sys
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Type
+
+if sys.platform == "win32":  # pragma: no cover - Windows
+    import msvcrt
+else:
+    import fcntl
+
+DEFAULT_LOCK_TIMEOUT = 30.0
+
+# Seconds between attempts while another process holds the lock
+_POLL_SECONDS = 0.01
+
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive lock on a file descriptor without blocking."""
+    try:
+        if sys.platform == "win32":  # pragma: no cover - Windows
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except (BlockingIOError, PermissionError):
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    """Release a lock taken with ``_try_lock``."""
+    if sys.platform == "win32":  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileLock:
+    """Exclusive advisory lock on a lock file.
+
+    The lock file is separate from the data it protects, so the data file
+    may be replaced atomically while the lock is held. Locks are advisory:
+    they only exclude other processes and threads that take the same lock.
+    """
+
+    def __init__(self, path: Path, timeout: float = DEFAULT_LOCK_TIMEOUT) -> None:
+        """Initialize the lock.
+
+        Args:
+            path: Lock file, created if missing
+            timeout: Seconds to wait for another holder before giving up
+        """
+        self.path = path
+        self.timeout = timeout
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        """Take the lock, waiting up to the timeout.
+
+        Raises:
+            TimeoutError: If the lock is still held by someone else
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        deadline = time.monotonic() + self.timeout
+        while not _try_lock(fd):
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                raise TimeoutError(f"Timed out waiting for lock {self.path}")
+            time.sleep(_POLL_SECONDS)
+        self._fd = fd
+
+    def release(self) -> None:
+        """Release the lock."""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            _unlock(fd)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> "FileLock":
+        """Take the lock."""
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Release the lock."""
+        self.release()
@@ -1,9 +1,12 @@
 """Module interface and base classes for the cursor development system."""
 
 import logging
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator, Tuple
 
-from .core_types import ExecutionContext, ModuleResult
+from .core_types import ExecutionContext, ExecutionPhase, ModuleResult
 
 
 class ModuleInterface(ABC):
@@ -26,7 +29,15 @@ class ModuleInterface(ABC):
 
 
 class BaseModule(ABC):
-    """Base class for all modules."""
+    """Base class for all modules.
+
+    Subclasses declare the phase they run in and the names of the modules
+    whose output they build on; the module runner uses both to schedule
+    independent modules concurrently.
+    """
+
+    phase: ExecutionPhase = ExecutionPhase.INFRASTRUCTURE
+    depends_on: Tuple[str, ...] = ()
 
     def __init__(self, name: str, description: str) -> None:
         """Initialize base module.
@@ -71,6 +82,24 @@ class BaseModule(ABC):
         """
         self.logger.debug(message)
 
+    @contextmanager
+    def timed(self, context: ExecutionContext, step: str) -> Iterator[None]:
+        """Time a step of this module in the context's profiler.
+
+        A step_completed event is published when the step succeeds.
+
+        Args:
+            context: Execution context
+            step: Step name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            context.profiler.record(step, self.name, start, duration)
+        context.emit("step_completed", module=self.name, step=step, duration=duration)
+
     def validate(self, context: ExecutionContext) -> bool:
         """Validate module can execute.
 
@@ -82,6 +111,17 @@ class BaseModule(ABC):
         """
         return True
 
+    def plan_skeleton(self, context: ExecutionContext) -> None:
+        """Plan output that does not depend on the project name.
+
+        Skeleton output is cached per project type and template variant and
+        cloned into new projects, so it must only depend on those two.
+
+        Args:
+            context: Execution context whose write plan receives the output
+        """
+        pass
+
     @abstractmethod
     def execute(self, context: ExecutionContext) -> ModuleResult:
         """Execute module.
@@ -0,0 +1,227 @@
+"""Deadlines and retries applied to module execution and plan flushes."""
+
+import errno
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
+
+from .core_types import SystemConfig
+
+logger = logging.getLogger("execution_policy")
+
+T = TypeVar("T")
+
+# Seconds an overrunning call is given to stop once it has been cancelled
+CANCEL_GRACE_SECONDS = 5.0
+
+# errno values worth retrying: the same call may succeed once the
+# filesystem or network mount behind the path recovers
+TRANSIENT_ERRNOS = frozenset(
+    code
+    for code in (
+        getattr(errno, name, None)
+        for name in (
+            "EAGAIN",
+            "EBUSY",
+            "EINTR",
+            "EIO",
+            "ESTALE",
+            "ETIMEDOUT",
+            "ECONNRESET",
+            "ENETDOWN",
+            "ENETUNREACH",
+            "EHOSTDOWN",
+            "EHOSTUNREACH",
+            "ETXTBSY",
+        )
+    )
+    if code is not None
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call does not finish before its deadline."""
+
+    def __init__(self, message: str, stopped: bool = False) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Description of the overrun
+            stopped: Whether the call has stopped running; if not, it may
+                still have side effects after the error is raised
+        """
+        super().__init__(message)
+        self.stopped = stopped
+
+
+def is_transient(error: Optional[BaseException]) -> bool:
+    """Return True if an error is a transient I/O failure worth retrying.
+
+    Args:
+        error: Exception raised by, or recorded for, a failed attempt
+
+    Returns:
+        True for OSErrors with a transient errno, False otherwise
+    """
+    if isinstance(error, DeadlineExceeded):
+        return False
+    return isinstance(error, OSError) and error.errno in TRANSIENT_ERRNOS
+
+
+def call_with_deadline(
+    func: Callable[[], T],
+    timeout: Optional[float],
+    cancel: Optional[threading.Event] = None,
+) -> T:
+    """Call a function, giving up once a deadline passes.
+
+    Threads cannot be interrupted, so the call runs on a daemon thread; a
+    stuck call can never keep the interpreter alive. If it overruns, the
+    ``cancel`` event is set and the call is given CANCEL_GRACE_SECONDS to
+    notice it and stop before it is abandoned.
+
+    Args:
+        func: Function to call
+        timeout: Seconds to wait, or None to wait indefinitely
+        cancel: Event the function checks to stop early
+
+    Returns:
+        The function's return value
+
+    Raises:
+        DeadlineExceeded: If the call is still running after the timeout
+    """
+    if timeout is None:
+        return func()
+
+    outcome: Dict[str, Any] = {}
+
+    def target() -> None:
+        try:
+            outcome["value"] = func()
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(
+        target=target, name=f"deadline-{threading.get_ident()}", daemon=True
+    )
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        if cancel is not None:
+            cancel.set()
+            thread.join(CANCEL_GRACE_SECONDS)
+        raise DeadlineExceeded(
+            f"Timed out after {timeout:g}s", stopped=not thread.is_alive()
+        )
+    if "error" in outcome:
+        raise outcome["error"]
+    return cast(T, outcome["value"])
+
+
+@dataclass
+class ExecutionPolicy:
+    """Deadline, retry and failure-handling settings for a run."""
+
+    timeout_seconds: Optional[float] = 300
+    retry_attempts: int = 3
+    fail_fast: bool = True
+    backoff_seconds: float = 0.1
+    max_backoff_seconds: float = 5.0
+
+    @classmethod
+    def from_config(cls, config: SystemConfig) -> "ExecutionPolicy":
+        """Create a policy from the system configuration.
+
+        Args:
+            config: System configuration
+
+        Returns:
+            Policy enforcing the configured timeout, retries and fail-fast
+        """
+        return cls(
+            timeout_seconds=config.timeout_seconds or None,
+            retry_attempts=config.retry_attempts,
+            fail_fast=config.fail_fast,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before retrying after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that failed, starting at 1
+
+        Returns:
+            Exponential backoff delay in seconds
+        """
+        delay: float = self.backoff_seconds * 2 ** (attempt - 1)
+        return min(delay, self.max_backoff_seconds)
+
+    def run(
+        self,
+        name: str,
+        func: Callable[[], T],
+        failed: Callable[[T], Optional[BaseException]],
+        events: List[Dict[str, Any]],
+        cancel: Optional[threading.Event] = None,
+    ) -> T:
+        """Call a function under this policy's deadline and retries.
+
+        The deadline applies to each attempt. Attempts that raise, or whose
+        result reports, a transient I/O error are retried with exponential
+        backoff up to ``retry_attempts`` times in total.
+
+        Args:
+            name: Name of the operation, used in log messages
+            func: Operation to run
+            failed: Returns the error recorded in a result, or None if it
+                succeeded
+            events: List receiving a dictionary per retry or timeout
+            cancel: Event set when an attempt overruns the deadline, for
+                ``func`` to check and stop early
+
+        Returns:
+            Result of the last attempt
+
+        Raises:
+            DeadlineExceeded: If an attempt overruns the deadline
+            Exception: Non-transient errors, or the last transient error
+        """
+        attempts = max(1, self.retry_attempts)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = call_with_deadline(func, self.timeout_seconds, cancel)
+                error = failed(result)
+            except DeadlineExceeded:
+                events.append(
+                    {
+                        "event": "timeout",
+                        "attempt": attempt,
+                        "timeout_seconds": self.timeout_seconds,
+                    }
+                )
+                logger.error(f"{name} timed out after {self.timeout_seconds:g}s")
+                raise
+            except Exception as e:
+                if attempt == attempts or not is_transient(e):
+                    raise
+                error = e
+            else:
+                if attempt == attempts or not is_transient(error):
+                    return result
+
+            delay = self.backoff(attempt)
+            events.append(
+                {
+                    "event": "retry",
+                    "attempt": attempt,
+                    "error": str(error),
+                    "delay_seconds": delay,
+                }
+            )
+            logger.warning(f"{name} failed ({error}), retrying in {delay:.2f}s")
+            time.sleep(delay)
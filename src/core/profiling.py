@@ -0,0 +1,143 @@
+"""Lightweight timing spans for modules, steps and disk flushes."""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class Span:
+    """A timed section of work."""
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    process_id: int
+    thread_id: int
+
+
+class Profiler:
+    """Thread-safe collector of timing spans.
+
+    Span start times come from ``time.perf_counter`` so spans recorded in
+    worker processes on the same machine line up on one timeline.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty profiler."""
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the lock so profilers can cross process boundaries."""
+        return {"_spans": self.spans()}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore spans with a fresh lock."""
+        self._spans = state["_spans"]
+        self._lock = threading.Lock()
+
+    def record(self, name: str, category: str, start: float, duration: float) -> None:
+        """Record a finished span.
+
+        Args:
+            name: Step name
+            category: Owner of the step, usually a module name
+            start: perf_counter value when the step started
+            duration: Step duration in seconds
+        """
+        span = Span(
+            name=name,
+            category=category,
+            start=start,
+            duration=duration,
+            process_id=os.getpid(),
+            thread_id=threading.get_ident(),
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, category: str) -> Iterator[None]:
+        """Time the enclosed block as a span.
+
+        Args:
+            name: Step name
+            category: Owner of the step, usually a module name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter() - start)
+
+    def spans(self, category: Optional[str] = None) -> List[Span]:
+        """Return recorded spans, optionally limited to one category."""
+        with self._lock:
+            return [s for s in self._spans if category in (None, s.category)]
+
+    def breakdown(self, category: str) -> Dict[str, float]:
+        """Return total seconds per step for one category."""
+        totals: Dict[str, float] = {}
+        for span in self.spans(category):
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration
+        return totals
+
+
+def format_breakdown(spans: Iterable[Span]) -> str:
+    """Format spans as a table of time per module and step.
+
+    Args:
+        spans: Spans to summarize, possibly from several projects
+
+    Returns:
+        Table sorted by total time, slowest step first
+    """
+    totals: Dict[Tuple[str, str], List[float]] = {}
+    for span in spans:
+        totals.setdefault((span.category, span.name), []).append(span.duration)
+
+    rows = sorted(totals.items(), key=lambda item: sum(item[1]), reverse=True)
+
+    header = f"{'module':<16} {'step':<28} {'count':>6} {'total ms':>10} {'mean ms':>9}"
+    lines = [header, "-" * len(header)]
+    for (category, name), durations in rows:
+        total = sum(durations)
+        lines.append(
+            f"{category:<16} {name:<28} {len(durations):>6} "
+            f"{total * 1000:>10.2f} {total / len(durations) * 1000:>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+def write_chrome_trace(spans: Iterable[Span], path: Path) -> None:
+    """Write spans as a Chrome trace-event file.
+
+    The file can be opened in chrome://tracing or Perfetto.
+
+    Args:
+        spans: Spans to export
+        path: Output JSON file
+    """
+    spans = list(spans)
+    origin = min((span.start for span in spans), default=0.0)
+    events = [
+        {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": (span.start - origin) * 1_000_000,
+            "dur": span.duration * 1_000_000,
+            "pid": span.process_id,
+            "tid": span.thread_id,
+        }
+        for span in spans
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,249 @@
+"""Dependency-aware module runner with concurrent execution."""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from .core_types import ExecutionContext, ExecutionPhase, ModuleResult
+from .module import BaseModule
+from .policy import DeadlineExceeded, ExecutionPolicy
+
+logger = logging.getLogger("module_runner")
+
+_PHASE_ORDER = {phase: index for index, phase in enumerate(ExecutionPhase)}
+
+
+class ModuleRunner:
+    """Runs modules as a DAG built from their phases and dependencies.
+
+    A module starts once every module it depends on has succeeded and every
+    module in an earlier phase has finished. Modules that become ready at
+    the same time run concurrently on a thread pool, each writing through
+    its own scoped view of the context's write plan so conflicting writes
+    resolve in declaration order.
+
+    Each module attempt runs under the execution policy's deadline, and
+    attempts failing with transient I/O errors are retried. With fail-fast
+    no new module starts after a failure; otherwise independent modules keep
+    running and dependents of failed modules are reported as skipped.
+    """
+
+    def __init__(
+        self,
+        modules: Sequence[BaseModule],
+        max_workers: Optional[int] = None,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> None:
+        """Initialize the runner and validate the module graph.
+
+        Args:
+            modules: Modules to run, in declaration order
+            max_workers: Maximum modules running at once (defaults to the
+                number of modules)
+            policy: Deadline, retry and fail-fast settings (defaults to
+                ExecutionPolicy())
+
+        Raises:
+            ValueError: If module names clash, a dependency is unknown or
+                runs in a later phase, or the dependencies form a cycle
+        """
+        self.modules: Dict[str, BaseModule] = {}
+        for module in modules:
+            if module.name in self.modules:
+                raise ValueError(f"Duplicate module name: {module.name}")
+            self.modules[module.name] = module
+
+        for module in modules:
+            for dependency in module.depends_on:
+                if dependency not in self.modules:
+                    raise ValueError(
+                        f"Module {module.name} depends on unknown module {dependency}"
+                    )
+                if (
+                    _PHASE_ORDER[self.modules[dependency].phase]
+                    > _PHASE_ORDER[module.phase]
+                ):
+                    raise ValueError(
+                        f"Module {module.name} depends on {dependency}, "
+                        "which runs in a later phase"
+                    )
+
+        self.order = self._topological_order()
+        self.max_workers = max_workers or max(1, len(self.modules))
+        self.policy = policy or ExecutionPolicy()
+
+    def _topological_order(self) -> List[str]:
+        """Return module names in a stable dependency and phase order."""
+        declared = list(self.modules)
+        ordered: List[str] = []
+        placed: Set[str] = set()
+        remaining = sorted(
+            declared,
+            key=lambda name: (
+                _PHASE_ORDER[self.modules[name].phase],
+                declared.index(name),
+            ),
+        )
+
+        while remaining:
+            for name in remaining:
+                if all(dep in placed for dep in self.modules[name].depends_on):
+                    ordered.append(name)
+                    placed.add(name)
+                    remaining.remove(name)
+                    break
+            else:
+                raise ValueError(f"Module dependency cycle among: {remaining}")
+        return ordered
+
+    def _is_ready(self, name: str, finished: Set[str], succeeded: Set[str]) -> bool:
+        """Return True if a module's dependencies and earlier phases are done."""
+        module = self.modules[name]
+        if not all(dep in succeeded for dep in module.depends_on):
+            return False
+        phase = _PHASE_ORDER[module.phase]
+        return all(
+            other in finished
+            for other in self.order
+            if _PHASE_ORDER[self.modules[other].phase] < phase
+        )
+
+    def _run_module(self, name: str, context: ExecutionContext) -> ModuleResult:
+        """Validate and execute one module against a scoped context."""
+        module = self.modules[name]
+        scoped = replace(
+            context, write_plan=context.write_plan.scoped(self.order.index(name))
+        )
+
+        events: List[Dict[str, Any]] = []
+        started = time.perf_counter()
+        context.emit("module_started", module=name, phase=module.phase.value)
+        try:
+            result = self.policy.run(
+                name,
+                lambda: self._validate_and_execute(module, scoped),
+                lambda result: None if result.success else result.error,
+                events,
+            )
+        except DeadlineExceeded as e:
+            result = ModuleResult(
+                module_name=name, success=False, message=str(e), error=e
+            )
+        result.execution_time = time.perf_counter() - started
+        result.data = {
+            **(result.data or {}),
+            "timings": context.profiler.breakdown(name),
+            "attempts": 1 + sum(event["event"] == "retry" for event in events),
+            "events": events,
+        }
+        context.emit(
+            "module_finished",
+            module=name,
+            success=result.success,
+            message=result.message,
+            execution_time=result.execution_time,
+        )
+        return result
+
+    def _validate_and_execute(
+        self, module: BaseModule, context: ExecutionContext
+    ) -> ModuleResult:
+        """Validate and execute a module, timing both stages."""
+        with module.timed(context, "validate"):
+            valid = module.validate(context)
+        if not valid:
+            return ModuleResult(
+                module_name=module.name, success=False, message="Validation failed"
+            )
+
+        try:
+            with module.timed(context, "execute"):
+                return module.execute(context)
+        except Exception as e:
+            module.log_error(f"Module failed: {e}")
+            return ModuleResult(
+                module_name=module.name, success=False, message=str(e), error=e
+            )
+
+    def run(self, context: ExecutionContext) -> List[ModuleResult]:
+        """Run every module against a context.
+
+        With fail-fast, no new modules are started once a module fails;
+        modules already running are allowed to finish. Otherwise every module
+        whose dependencies succeeded still runs, and the rest are reported
+        as skipped.
+
+        Args:
+            context: Execution context shared by all modules
+
+        Returns:
+            Results of the modules that ran or were skipped, in dependency
+            order
+        """
+        results: Dict[str, ModuleResult] = {}
+        finished: Set[str] = set()
+        succeeded: Set[str] = set()
+        pending = list(self.order)
+        running: Dict[Future, str] = {}
+        failed = False
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="module"
+        ) as executor:
+            while pending or running:
+                if failed and not self.policy.fail_fast:
+                    self._skip_blocked(context, pending, finished, succeeded, results)
+
+                if not failed or not self.policy.fail_fast:
+                    for name in [
+                        n for n in pending if self._is_ready(n, finished, succeeded)
+                    ]:
+                        pending.remove(name)
+                        context.current_phase = self.modules[name].phase
+                        logger.debug(f"Starting module {name}")
+                        running[executor.submit(self._run_module, name, context)] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result = future.result()
+                    results[name] = result
+                    finished.add(name)
+                    if result.success:
+                        succeeded.add(name)
+                    else:
+                        logger.error(f"{name} failed: {result.message}")
+                        failed = True
+
+        return [results[name] for name in self.order if name in results]
+
+    def _skip_blocked(
+        self,
+        context: ExecutionContext,
+        pending: List[str],
+        finished: Set[str],
+        succeeded: Set[str],
+        results: Dict[str, ModuleResult],
+    ) -> None:
+        """Mark pending modules with a failed or skipped dependency as skipped."""
+        for name in list(pending):
+            blocked = [
+                dep
+                for dep in self.modules[name].depends_on
+                if dep in finished and dep not in succeeded
+            ]
+            if blocked:
+                pending.remove(name)
+                finished.add(name)
+                results[name] = ModuleResult(
+                    module_name=name,
+                    success=False,
+                    message=f"Skipped: dependency {blocked[0]} did not succeed",
+                    data={"skipped": True},
+                )
+                context.emit("module_skipped", module=name, dependency=blocked[0])
@@ -0,0 +1,248 @@
+"""Prebuilt per-project-type skeletons materialized by cloning."""
+
+import errno
+import hashlib
+import inspect
+import logging
+import os
+import re
+import shutil
+import tarfile
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .. import __version__
+from .core_types import ExecutionContext
+from .module import BaseModule
+from .template_engine import default_engine
+from .write_plan import WritePlan
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger("skeleton_cache")
+
+# Linux FICLONE ioctl: share the source file's extents copy-on-write
+_FICLONE = 0x40049409
+
+_CLONE_UNSUPPORTED = {
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.EPERM,
+}
+
+_ARCHIVE_NAME = "skeleton.tar"
+_TREE_NAME = "tree"
+
+
+def _reflink(source: Path, target: Path) -> None:
+    """Clone a file copy-on-write, raising OSError if unsupported."""
+    if fcntl is None:
+        raise OSError(errno.ENOSYS, "reflink is not supported on this platform")
+
+    with open(source, "rb") as src:
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            fcntl.ioctl(fd, _FICLONE, src.fileno())
+        except OSError:
+            os.close(fd)
+            os.unlink(target)
+            raise
+        os.close(fd)
+
+
+class Skeleton:
+    """A cached skeleton tree with its tar fallback."""
+
+    def __init__(self, path: Path, allow_hardlinks: bool = False) -> None:
+        """Initialize a skeleton from its cache directory.
+
+        Args:
+            path: Cache directory holding the tree and archive
+            allow_hardlinks: Hardlink files when reflinks are unsupported
+        """
+        self.path = path
+        self.tree = path / _TREE_NAME
+        self.archive = path / _ARCHIVE_NAME
+        self.allow_hardlinks = allow_hardlinks
+        self._dirs, self._files = self._scan()
+
+    def _scan(self) -> Tuple[List[str], List[str]]:
+        """List the tree's directories and files relative to its root."""
+        dirs: List[str] = []
+        files: List[str] = []
+        for current, dir_names, file_names in os.walk(self.tree):
+            relative = os.path.relpath(current, self.tree)
+            dir_names.sort()
+            for name in dir_names:
+                dirs.append(os.path.normpath(os.path.join(relative, name)))
+            for name in sorted(file_names):
+                files.append(os.path.normpath(os.path.join(relative, name)))
+        return dirs, files
+
+    def materialize(self, root: Path) -> str:
+        """Clone the skeleton below a project root.
+
+        Files are reflinked where the filesystem supports it, hardlinked if
+        allowed, and otherwise extracted from the tar archive in one pass.
+
+        Args:
+            root: Project root directory
+
+        Returns:
+            Name of the strategy used: reflink, hardlink or tar
+        """
+        root.mkdir(parents=True, exist_ok=True)
+        for directory in self._dirs:
+            try:
+                os.mkdir(root / directory)
+            except FileExistsError:
+                pass
+
+        strategy = self._clone_files(root)
+        if strategy is None:
+            with tarfile.open(self.archive) as archive:
+                archive.extractall(root, filter="data")
+            strategy = "tar"
+        return strategy
+
+    def _clone_files(self, root: Path) -> Optional[str]:
+        """Clone every file by reflink or hardlink, or return None."""
+        if not self._files:
+            return "reflink"
+
+        strategies = ["reflink"]
+        if self.allow_hardlinks:
+            strategies.append("hardlink")
+
+        first, *rest = self._files
+        for strategy in strategies:
+            link = _reflink if strategy == "reflink" else os.link
+            try:
+                link(self.tree / first, root / first)
+            except OSError as e:
+                if e.errno not in _CLONE_UNSUPPORTED:
+                    raise
+                continue
+            for name in rest:
+                link(self.tree / name, root / name)
+            return strategy
+        return None
+
+
+class SkeletonCache:
+    """Builds and serves name-independent project skeletons.
+
+    Skeletons are keyed by project type, template variant and a digest of
+    the generator source, so editing a module invalidates its skeletons.
+    """
+
+    def __init__(
+        self, cache_dir: Optional[Path] = None, allow_hardlinks: bool = False
+    ) -> None:
+        """Initialize the skeleton cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to ~/.cursor/cache/skeletons)
+            allow_hardlinks: Hardlink skeleton files into projects when the
+                filesystem has no reflink support. Hardlinked files share
+                storage with the cache, so in-place edits affect both.
+        """
+        self.cache_dir = cache_dir or Path.home() / ".cursor" / "cache" / "skeletons"
+        self.allow_hardlinks = allow_hardlinks
+        self._skeletons: Dict[str, Skeleton] = {}
+        self._versions: Dict[Tuple[type, ...], str] = {}
+
+    def template_version(self, modules: Sequence[BaseModule]) -> str:
+        """Return a digest of the code that generates the skeleton.
+
+        Args:
+            modules: Modules contributing to the skeleton
+
+        Returns:
+            Hex digest that changes whenever the generator code changes
+        """
+        classes = tuple(type(module) for module in modules)
+        if classes not in self._versions:
+            digest = hashlib.sha256(__version__.encode("utf-8"))
+            sources = {inspect.getsourcefile(cls) for cls in classes}
+            sources.update({__file__, inspect.getsourcefile(WritePlan)})
+            sources.update(str(path) for path in default_engine().sources())
+            for source in sorted(path for path in sources if path):
+                digest.update(Path(source).read_bytes())
+            self._versions[classes] = digest.hexdigest()[:16]
+        return self._versions[classes]
+
+    def _prefix(self, context: ExecutionContext) -> str:
+        """Return the cache key prefix for a type and variant."""
+        variant = re.sub(r"[^A-Za-z0-9_.-]", "_", context.template_variant)
+        return f"{context.project_type.value}-{variant}-"
+
+    def key(self, context: ExecutionContext, modules: Sequence[BaseModule]) -> str:
+        """Return the cache key for a context's skeleton.
+
+        Args:
+            context: Execution context
+            modules: Modules contributing to the skeleton
+
+        Returns:
+            Cache key combining type, variant and template version
+        """
+        return self._prefix(context) + self.template_version(modules)
+
+    def get(self, context: ExecutionContext, modules: Sequence[BaseModule]) -> Skeleton:
+        """Return the skeleton for a context, building it on a cache miss.
+
+        Args:
+            context: Execution context
+            modules: Modules contributing to the skeleton
+
+        Returns:
+            The cached skeleton
+        """
+        key = self.key(context, modules)
+        if key not in self._skeletons:
+            path = self.cache_dir / key
+            if not (path / _ARCHIVE_NAME).exists():
+                self._build(context, modules, key)
+            self._skeletons[key] = Skeleton(path, self.allow_hardlinks)
+        return self._skeletons[key]
+
+    def _build(
+        self, context: ExecutionContext, modules: Sequence[BaseModule], key: str
+    ) -> None:
+        """Render a skeleton into the cache, replacing stale versions."""
+        logger.info(f"Building skeleton {key}")
+        skeleton_context = replace(
+            context, write_plan=WritePlan(), skeleton_cached=False
+        )
+        for module in modules:
+            module.plan_skeleton(skeleton_context)
+
+        # Build in a private staging directory so concurrent builders never
+        # observe a half-written skeleton
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        staging = self.cache_dir / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        tree = staging / _TREE_NAME
+        skeleton_context.write_plan.flush(tree)
+        with tarfile.open(staging / _ARCHIVE_NAME, "w") as archive:
+            for entry in sorted(tree.iterdir()):
+                archive.add(entry, arcname=entry.name)
+
+        try:
+            os.rename(staging, self.cache_dir / key)
+        except OSError:
+            # Another process published the same skeleton first
+            shutil.rmtree(staging, ignore_errors=True)
+
+        pattern = re.compile(re.escape(self._prefix(context)) + r"[0-9a-f]{16}")
+        for stale in self.cache_dir.iterdir():
+            if stale.name != key and pattern.fullmatch(stale.name):
+                shutil.rmtree(stale, ignore_errors=True)
@@ -0,0 +1,129 @@
+"""Compiled file templates with ``{{ slot }}`` substitutions."""
+
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .core_types import SystemConfig
+
+TEMPLATE_SUFFIX = ".tmpl"
+
+_SLOT = re.compile(rb"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+
+class CompiledTemplate:
+    """A template split into static byte chunks and substitution slots.
+
+    Static chunks are encoded once at compile time and reused by every
+    render, so rendering only encodes the slot values.
+    """
+
+    def __init__(self, name: str, source: bytes) -> None:
+        """Compile a template.
+
+        Args:
+            name: Template name, used in error messages
+            source: UTF-8 template source
+        """
+        self.name = name
+        parts = _SLOT.split(source)
+        # split() alternates static text and slot names: s0, n0, s1, n1, ..., sN
+        self.chunks: Tuple[bytes, ...] = tuple(parts[0::2])
+        self.slots: Tuple[str, ...] = tuple(part.decode() for part in parts[1::2])
+
+    def render(self, **values: str) -> List[bytes]:
+        """Render the template as a list of byte chunks.
+
+        Args:
+            **values: Value for every slot in the template
+
+        Returns:
+            Chunks whose concatenation is the rendered file
+
+        Raises:
+            KeyError: If a slot has no value
+        """
+        encoded: Dict[str, bytes] = {}
+        for slot in self.slots:
+            if slot not in encoded:
+                try:
+                    encoded[slot] = values[slot].encode("utf-8")
+                except KeyError:
+                    raise KeyError(
+                        f"Template {self.name} needs a value for {slot}"
+                    ) from None
+
+        rendered = [self.chunks[0]]
+        for slot, chunk in zip(self.slots, self.chunks[1:]):
+            rendered.append(encoded[slot])
+            rendered.append(chunk)
+        return [chunk for chunk in rendered if chunk]
+
+    def render_bytes(self, **values: str) -> bytes:
+        """Render the template into a single bytes object.
+
+        Args:
+            **values: Value for every slot in the template
+
+        Returns:
+            Rendered file content
+        """
+        return b"".join(self.render(**values))
+
+
+class TemplateEngine:
+    """Loads and caches compiled templates from a templates directory."""
+
+    def __init__(self, templates_dir: Optional[Path] = None) -> None:
+        """Initialize the template engine.
+
+        Args:
+            templates_dir: Directory of ``*.tmpl`` files (defaults to
+                SystemConfig.templates_dir)
+        """
+        self.templates_dir = templates_dir or SystemConfig().templates_dir
+        self._compiled: Dict[str, CompiledTemplate] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CompiledTemplate:
+        """Return a compiled template, compiling it on first use.
+
+        Args:
+            name: Template file name without the ``.tmpl`` suffix
+
+        Returns:
+            The compiled template
+        """
+        template = self._compiled.get(name)
+        if template is None:
+            source = (self.templates_dir / f"{name}{TEMPLATE_SUFFIX}").read_bytes()
+            with self._lock:
+                template = self._compiled.setdefault(
+                    name, CompiledTemplate(name, source)
+                )
+        return template
+
+    def sources(self) -> List[Path]:
+        """Return every template file in the templates directory."""
+        return sorted(self.templates_dir.glob(f"*{TEMPLATE_SUFFIX}"))
+
+    def preload(self) -> int:
+        """Compile every template in the templates directory.
+
+        Preloading before forking worker processes lets every worker share
+        the compiled chunks instead of compiling its own copy.
+
+        Returns:
+            Number of templates compiled
+        """
+        for path in self.sources():
+            self.get(path.name[: -len(TEMPLATE_SUFFIX)])
+        return len(self._compiled)
+
+
+@lru_cache(maxsize=None)
+def default_engine() -> TemplateEngine:
+    """Return the process-wide template engine for the bundled templates."""
+    return TemplateEngine()
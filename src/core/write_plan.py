@@ -0,0 +1,334 @@
+"""In-memory write plan collected by modules and flushed to disk in one pass."""
+
+import itertools
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .profiling import Profiler
+
+PlanPath = Union[str, PurePosixPath]
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Buffers passed to a single writev call, kept below the usual IOV_MAX
+_MAX_IOVECS = 1024
+
+
+@dataclass
+class FlushStats:
+    """Summary of the filesystem work done by a flush."""
+
+    directories: int = 0
+    files: int = 0
+    bytes_written: int = 0
+    collapsed_writes: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the stats as a plain dictionary."""
+        return {
+            "directories": self.directories,
+            "files": self.files,
+            "bytes_written": self.bytes_written,
+            "collapsed_writes": self.collapsed_writes,
+        }
+
+
+@dataclass
+class _CopyOperation:
+    """Deferred copy of an existing file into the plan."""
+
+    source: Path
+
+
+_FileContent = Union[bytes, Tuple[bytes, ...], _CopyOperation]
+
+
+class FlushCancelled(Exception):
+    """Raised when a flush is cancelled before it finished."""
+
+
+def _check_cancelled(cancel: Optional[threading.Event]) -> None:
+    """Raise FlushCancelled if the event is set."""
+    if cancel is not None and cancel.is_set():
+        raise FlushCancelled("Flush cancelled")
+
+
+def _write_chunks(fd: int, chunks: Sequence[bytes]) -> None:
+    """Write byte chunks to a file descriptor in as few calls as possible."""
+    if not hasattr(os, "writev"):  # pragma: no cover - Windows
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        return
+
+    pending = [memoryview(chunk) for chunk in chunks if chunk]
+    while pending:
+        written = os.writev(fd, pending[:_MAX_IOVECS])
+        # Drop fully written buffers and trim a partially written one
+        while written and written >= len(pending[0]):
+            written -= len(pending.pop(0))
+        if written:
+            pending[0] = pending[0][written:]
+
+
+class _PlanState:
+    """Shared, lock-protected storage behind a plan and its scoped views."""
+
+    def __init__(self) -> None:
+        """Initialize empty plan storage."""
+        self.dirs: Set[PurePosixPath] = set()
+        self.files: Dict[PurePosixPath, Tuple[Tuple[int, int], _FileContent]] = {}
+        self.collapsed = 0
+        self.lock = threading.Lock()
+        self.sequence = itertools.count()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the lock and counter so plans can cross process boundaries."""
+        return {"dirs": self.dirs, "files": self.files, "collapsed": self.collapsed}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore plan storage with a fresh lock and counter."""
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+        self.sequence = itertools.count(len(self.files))
+
+
+class WritePlan:
+    """Collects directory and file operations relative to a project root.
+
+    Writes to the same path replace each other, so only the last content for
+    a path is ever written. Directories are tracked as a set and reduced to
+    the distinct set of paths that actually need creating.
+
+    A plan may be shared by modules running on several threads. Each module
+    writes through a view from ``scoped(rank)``; when two views write the
+    same path the higher rank wins, so the result does not depend on thread
+    timing.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty write plan."""
+        self._state = _PlanState()
+        self._rank = 0
+
+    def scoped(self, rank: int) -> "WritePlan":
+        """Return a view of this plan whose writes carry a priority rank.
+
+        Args:
+            rank: Priority of the view's writes; higher ranks win conflicts
+
+        Returns:
+            A plan sharing this plan's storage
+        """
+        view = WritePlan.__new__(WritePlan)
+        view._state = self._state
+        view._rank = rank
+        return view
+
+    def _put(self, path: PurePosixPath, content: _FileContent) -> None:
+        """Record a file operation, keeping the highest-priority write."""
+        state = self._state
+        with state.lock:
+            order = (self._rank, next(state.sequence))
+            existing = state.files.get(path)
+            if existing is not None:
+                state.collapsed += 1
+                if existing[0] > order:
+                    return
+            state.files[path] = (order, content)
+
+    @staticmethod
+    def _normalize(path: PlanPath) -> PurePosixPath:
+        """Normalize a plan path and reject paths escaping the root."""
+        normalized = PurePosixPath(path)
+        if normalized.is_absolute() or ".." in normalized.parts:
+            raise ValueError(f"Plan paths must be relative to the root: {path}")
+        return normalized
+
+    def mkdir(self, path: PlanPath) -> None:
+        """Plan a directory, including any missing parents.
+
+        Args:
+            path: Directory path relative to the project root
+        """
+        normalized = self._normalize(path)
+        with self._state.lock:
+            self._state.dirs.add(normalized)
+
+    def write_bytes(self, path: PlanPath, content: bytes) -> None:
+        """Plan a binary file write, replacing earlier writes to the path.
+
+        Args:
+            path: File path relative to the project root
+            content: File content
+        """
+        self._put(self._normalize(path), content)
+
+    def write_text(self, path: PlanPath, content: str) -> None:
+        """Plan a UTF-8 text file write.
+
+        Args:
+            path: File path relative to the project root
+            content: File content
+        """
+        self.write_bytes(path, content.encode("utf-8"))
+
+    def write_json(self, path: PlanPath, data: Any) -> None:
+        """Plan a JSON file write with two-space indentation.
+
+        Args:
+            path: File path relative to the project root
+            data: JSON-serializable data
+        """
+        self.write_text(path, json.dumps(data, indent=2))
+
+    def write_chunks(self, path: PlanPath, chunks: Iterable[bytes]) -> None:
+        """Plan a file write from byte chunks written with one vectored write.
+
+        Args:
+            path: File path relative to the project root
+            chunks: File content split into chunks, e.g. a rendered template
+        """
+        self._put(self._normalize(path), tuple(chunks))
+
+    def copy_file(self, path: PlanPath, source: Path) -> None:
+        """Plan a copy of an existing file, preserving its metadata.
+
+        Args:
+            path: Destination path relative to the project root
+            source: Existing file to copy
+        """
+        self._put(self._normalize(path), _CopyOperation(source))
+
+    def has_dir(self, path: PlanPath) -> bool:
+        """Return True if the directory is planned, explicitly or as a parent."""
+        normalized = self._normalize(path)
+        with self._state.lock:
+            entries = (*self._state.dirs, *self._state.files)
+        return normalized in entries or any(
+            normalized in entry.parents for entry in entries
+        )
+
+    def has_file(self, path: PlanPath) -> bool:
+        """Return True if a write to the file is planned."""
+        return self._normalize(path) in self._state.files
+
+    def is_empty(self) -> bool:
+        """Return True if nothing has been planned."""
+        return not self._state.dirs and not self._state.files
+
+    @property
+    def collapsed_writes(self) -> int:
+        """Return how many writes were replaced by a later write."""
+        return self._state.collapsed
+
+    def files(self) -> List[Tuple[PurePosixPath, _FileContent]]:
+        """Return the planned file operations in path order."""
+        with self._state.lock:
+            items = list(self._state.files.items())
+        return sorted(
+            ((path, content) for path, (_, content) in items), key=lambda x: x[0]
+        )
+
+    def leaf_dirs(self) -> List[PurePosixPath]:
+        """Return planned directories that are not a parent of another entry."""
+        with self._state.lock:
+            dirs = set(self._state.dirs)
+            entries = (*dirs, *self._state.files)
+        parents: Set[PurePosixPath] = set()
+        for entry in entries:
+            parents.update(entry.parents)
+        return sorted(path for path in dirs if path not in parents and path.parts)
+
+    def directories(self) -> List[PurePosixPath]:
+        """Return every directory below the root that must exist, parents first."""
+        required: Set[PurePosixPath] = set()
+        file_parents = [path.parent for path, _ in self.files()]
+        for leaf in (*self.leaf_dirs(), *file_parents):
+            while leaf.parts and leaf not in required:
+                required.add(leaf)
+                leaf = leaf.parent
+        return sorted(required, key=lambda path: (len(path.parts), path))
+
+    def flush(
+        self,
+        root: Path,
+        profiler: Optional["Profiler"] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> FlushStats:
+        """Apply the plan below a root directory.
+
+        Each directory is created exactly once, parents before children, with
+        a single mkdir call and no existence probes. Each file is written
+        with one open/write/close sequence, using a vectored write for
+        chunked content.
+
+        Args:
+            root: Project root directory
+            profiler: Profiler recording directory and file write times
+            cancel: Event that stops the flush before the next directory or
+                file once it is set
+
+        Returns:
+            Statistics about the work done
+
+        Raises:
+            FlushCancelled: If ``cancel`` was set before the flush finished
+        """
+        stats = FlushStats(collapsed_writes=self.collapsed_writes)
+        started = time.perf_counter()
+        root.mkdir(parents=True, exist_ok=True)
+
+        for directory in self.directories():
+            _check_cancelled(cancel)
+            try:
+                os.mkdir(root / directory)
+                stats.directories += 1
+            except FileExistsError:
+                pass
+
+        written = time.perf_counter()
+        if profiler is not None:
+            profiler.record("directories", "write_plan", started, written - started)
+
+        for path, content in self.files():
+            _check_cancelled(cancel)
+            target = root / path
+            if isinstance(content, _CopyOperation):
+                shutil.copy2(content.source, target)
+                stats.bytes_written += target.stat().st_size
+            else:
+                chunks = (content,) if isinstance(content, bytes) else content
+                fd = os.open(target, _WRITE_FLAGS, 0o644)
+                try:
+                    _write_chunks(fd, chunks)
+                finally:
+                    os.close(fd)
+                stats.bytes_written += sum(len(chunk) for chunk in chunks)
+            stats.files += 1
+
+        if profiler is not None:
+            profiler.record(
+                "files", "write_plan", written, time.perf_counter() - written
+            )
+        return stats
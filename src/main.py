@@ -4,47 +4,30 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional, TextIO
 
-from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
+from .core.core_types import ExecutionContext, ProjectType, SystemConfig
+from .core.profiling import Span, format_breakdown, write_chrome_trace
+from .scaffold import ScaffoldOutcome, scaffold, scaffold_archive
 
-from .core.core_types import ExecutionContext, ProjectType
-from .modules.file_organizer import FileOrganizerModule
-from .modules.project_creator import ProjectCreatorModule
+# Batch mode, the skeleton cache and archive output pull in multiprocessing,
+# tarfile and hashlib; they are imported on first use to keep CLI startup
+# fast. The web server lives in src.web so creating a project never imports
+# FastAPI.
+if TYPE_CHECKING:
+    from .core.skeleton_cache import SkeletonCache
 
-app = FastAPI(title="Unified Web Application")
 
-# Mount the frontend static files
-app.mount("/static", StaticFiles(directory="dist"), name="static")
+def setup_logging(stream: TextIO = sys.stdout) -> None:
+    """Set up logging configuration.
 
-
-# API routes
-@app.get("/api/health")  # type: ignore[misc]
-async def health_check() -> dict:
-    """Return health status of the API."""
-    return {"status": "healthy"}
-
-
-# Serve the frontend for all other routes
-@app.get("/{path:path}")  # type: ignore[misc]
-async def serve_frontend(path: str, request: Request) -> FileResponse:
-    """Serve the frontend application."""
-    # If the path starts with /api, let FastAPI handle it
-    if path.startswith("api"):
-        return None
-
-    # Serve the frontend index.html for all other routes
-    return FileResponse("dist/index.html")
-
-
-def setup_logging() -> None:
-    """Set up logging configuration."""
+    Args:
+        stream: Stream log records are written to
+    """
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
+        handlers=[logging.StreamHandler(stream)],
     )
 
 
@@ -54,17 +37,30 @@ def parse_args() -> argparse.Namespace:
         description="Cursor Development System - Project Scaffolding Tool"
     )
 
-    parser.add_argument("project_name", help="Name of the project to create")
+    parser.add_argument("project_name", nargs="?", help="Name of the project to create")
 
     parser.add_argument(
         "--type",
         "-t",
         type=str,
         choices=[t.value for t in ProjectType],
-        required=True,
         help="Type of project to create",
     )
 
+    parser.add_argument(
+        "--manifest",
+        "-m",
+        type=str,
+        help="Create every project listed in a TOML, JSON or CSV manifest",
+    )
+
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="Parallel worker processes for --manifest (default: CPU count)",
+    )
+
     parser.add_argument(
         "--output", "-o", type=str, help="Output directory path (default: ./projects)"
     )
@@ -90,7 +86,101 @@ def parse_args() -> argparse.Namespace:
 
     parser.add_argument("--config", type=str, help="Path to custom configuration file")
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-module and per-step timing breakdown",
+    )
+
+    parser.add_argument(
+        "--profile-trace",
+        type=str,
+        help="Write a Chrome trace-event JSON file (implies --profile)",
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        help="Per-module deadline in seconds, 0 to disable (default: 300)",
+    )
+
+    parser.add_argument(
+        "--retries",
+        type=int,
+        help="Attempts per module on transient I/O errors (default: 3)",
+    )
+
+    parser.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="Keep running independent modules after a failure and report all",
+    )
+
+    parser.add_argument(
+        "--skeleton-cache",
+        action="store_true",
+        help="Clone name-independent files from a cached per-type skeleton",
+    )
+
+    parser.add_argument(
+        "--archive",
+        type=str,
+        metavar="PATH",
+        help="Write the project into a tar, tar.gz, tar.zst or zip archive "
+        "instead of a directory; - writes it to stdout",
+    )
+
+    parser.add_argument(
+        "--archive-format",
+        type=str,
+        choices=["tar", "tar.gz", "tar.zst", "zip"],
+        help="Archive format (default: inferred from PATH, tar.gz for stdout)",
+    )
+
+    args = parser.parse_args()
+    if not args.manifest and not (args.project_name and args.type):
+        parser.error("project_name and --type are required unless --manifest is used")
+    if args.archive and (args.manifest or args.skeleton_cache):
+        parser.error("--archive cannot be combined with --manifest or --skeleton-cache")
+    return args
+
+
+def get_skeleton_cache(args: argparse.Namespace) -> Optional["SkeletonCache"]:
+    """Return the skeleton cache if enabled on the command line."""
+    if not args.skeleton_cache:
+        return None
+
+    from .core.skeleton_cache import SkeletonCache
+
+    return SkeletonCache()
+
+
+def get_system_config(args: argparse.Namespace) -> SystemConfig:
+    """Return the system configuration with command line overrides applied."""
+    config = SystemConfig()
+    if args.timeout is not None:
+        config.timeout_seconds = args.timeout
+    if args.retries is not None:
+        config.retry_attempts = args.retries
+    if args.keep_going:
+        config.fail_fast = False
+    return config
+
+
+def report_profile(args: argparse.Namespace, spans: Iterable[Span]) -> None:
+    """Print the timing breakdown and write the trace file if requested.
+
+    The breakdown goes to stderr when an archive is streamed to stdout, so
+    it cannot corrupt the archive.
+    """
+    if not (args.profile or args.profile_trace):
+        return
+
+    spans = list(spans)
+    print(format_breakdown(spans), file=sys.stderr if args.archive == "-" else None)
+    if args.profile_trace:
+        write_chrome_trace(spans, Path(args.profile_trace))
+        logging.info(f"Chrome trace written to {args.profile_trace}")
 
 
 def create_project(args: argparse.Namespace) -> Optional[Path]:
@@ -108,52 +198,112 @@ def create_project(args: argparse.Namespace) -> Optional[Path]:
             config_override=Path(args.config) if args.config else None,
         )
 
-        # Initialize modules
-        project_creator = ProjectCreatorModule()
-        file_organizer = FileOrganizerModule()
-
-        # Execute project creation
-        if not project_creator.validate(context):
-            logging.error("Project creation validation failed")
-            return None
-
-        result = project_creator.execute(context)
-        if not result.success:
-            logging.error(f"Project creation failed: {result.message}")
-            return None
-
-        # Execute file organization
-        if not file_organizer.validate(context):
-            logging.error("File organization validation failed")
+        if args.archive:
+            outcome = create_archive(args, context)
+        else:
+            outcome = scaffold(
+                context, get_skeleton_cache(args), get_system_config(args)
+            )
+        report_profile(args, outcome.spans)
+        if not outcome.success:
+            for result in outcome.results:
+                if not result.success:
+                    logging.error(f"{result.module_name}: {result.message}")
+            logging.error(f"Project creation failed: {outcome.message}")
             return None
 
-        result = file_organizer.execute(context)
-        if not result.success:
-            logging.error(f"File organization failed: {result.message}")
-            return None
-
-        return context.project_root
+        return Path(args.archive) if args.archive else context.project_root
 
     except Exception as e:
         logging.error(f"Project creation failed: {str(e)}")
         return None
 
 
+def create_archive(
+    args: argparse.Namespace, context: ExecutionContext
+) -> ScaffoldOutcome:
+    """Scaffold a project straight into the archive named on the command line.
+
+    Raises:
+        ValueError: If the archive format cannot be determined or is
+            unavailable
+    """
+    from .core.archive import check_format, format_for_path
+
+    to_stdout = args.archive == "-"
+    if args.archive_format:
+        archive_format = check_format(args.archive_format)
+    else:
+        archive_format = "tar.gz" if to_stdout else format_for_path(args.archive)
+
+    if to_stdout:
+        outcome = scaffold_archive(
+            context, sys.stdout.buffer, archive_format, get_system_config(args)
+        )
+        sys.stdout.buffer.flush()
+        return outcome
+
+    path = Path(args.archive)
+    with open(path, "wb") as fileobj:
+        outcome = scaffold_archive(
+            context, fileobj, archive_format, get_system_config(args)
+        )
+    if not outcome.success:
+        path.unlink(missing_ok=True)
+    return outcome
+
+
+def create_projects_from_manifest(args: argparse.Namespace) -> bool:
+    """Create every project in a manifest and return True if all succeeded."""
+    from .batch import load_manifest, run_batch
+
+    contexts = load_manifest(
+        Path(args.manifest), Path(args.output) if args.output else None
+    )
+    if not contexts:
+        logging.error(f"No projects listed in manifest: {args.manifest}")
+        return False
+
+    report = run_batch(
+        contexts,
+        workers=args.workers,
+        skeleton_cache=get_skeleton_cache(args),
+        config=get_system_config(args),
+    )
+    for outcome in report.outcomes:
+        if outcome.success:
+            logging.info(
+                f"Created {outcome.project_root} in {outcome.elapsed * 1000:.1f}ms"
+            )
+        else:
+            logging.error(f"Failed {outcome.project_name}: {outcome.message}")
+
+    report_profile(args, (span for o in report.outcomes for span in o.spans))
+    logging.info(report.summary())
+    return report.failed == 0
+
+
 def main() -> None:
     """Run the main application entry point."""
     try:
-        # Set up logging
-        setup_logging()
-
         # Parse arguments
         args = parse_args()
 
+        # Set up logging; stdout is reserved for an archive streamed there
+        setup_logging(sys.stderr if args.archive == "-" else sys.stdout)
+
+        if args.manifest:
+            if not create_projects_from_manifest(args):
+                sys.exit(1)
+            return
+
         # Create project
         project_root = create_project(args)
         if not project_root:
             return
 
-        logging.info(f"Project created successfully at: {project_root}")
+        if args.archive != "-":
+            logging.info(f"Project created successfully at: {project_root}")
 
     except Exception as e:
         logging.error(f"Fatal error: {str(e)}")
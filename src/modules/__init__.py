@@ -1,6 +1,54 @@
 """Modules for the Cursor Development System."""
 
+from typing import Callable, List, TypeVar
+
+from ..core.module import BaseModule
+from .dev_tools import DevToolsModule
+from .environment import EnvironmentModule
 from .file_organizer import FileOrganizerModule
 from .project_creator import ProjectCreatorModule
 
-__all__ = ["FileOrganizerModule", "ProjectCreatorModule"]
+# Module factories (usually classes with a no-argument constructor)
+ModuleFactory = TypeVar("ModuleFactory", bound=Callable[[], BaseModule])
+
+# Modules run by the scaffolding pipeline, in declaration order
+MODULE_REGISTRY: List[Callable[[], BaseModule]] = [
+    ProjectCreatorModule,
+    FileOrganizerModule,
+    EnvironmentModule,
+    DevToolsModule,
+]
+
+
+def register_module(module_class: ModuleFactory) -> ModuleFactory:
+    """Add a module class to the scaffolding pipeline.
+
+    Can be used as a class decorator. The module's ``phase`` and
+    ``depends_on`` attributes decide where it runs.
+
+    Args:
+        module_class: Module class, or any callable returning a module,
+            to register
+
+    Returns:
+        The registered module class
+    """
+    if module_class not in MODULE_REGISTRY:
+        MODULE_REGISTRY.append(module_class)
+    return module_class
+
+
+def create_modules() -> List[BaseModule]:
+    """Instantiate every registered module."""
+    return [module_class() for module_class in MODULE_REGISTRY]
+
+
+__all__ = [
+    "DevToolsModule",
+    "EnvironmentModule",
+    "FileOrganizerModule",
+    "ProjectCreatorModule",
+    "MODULE_REGISTRY",
+    "create_modules",
+    "register_module",
+]
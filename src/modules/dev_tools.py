@@ -0,0 +1,189 @@
+"""Development tools module for generating project helper scripts."""
+
+from ..core.core_types import ExecutionContext, ExecutionPhase, ModuleResult
+from ..core.module import BaseModule
+
+
+class DevToolsModule(BaseModule):
+    """Creates development and validation scripts."""
+
+    phase = ExecutionPhase.TEMPLATES
+    depends_on = ("project_creator",)
+
+    def __init__(self) -> None:
+        """Initialize DevToolsModule."""
+        super().__init__("dev_tools", "Creates development tools and scripts")
+
+    def execute(self, context: ExecutionContext) -> ModuleResult:
+        """Execute development tool creation."""
+        try:
+            # Scripts do not depend on the project name
+            if not context.skeleton_cached:
+                self.plan_skeleton(context)
+
+            return ModuleResult(
+                module_name=self.name,
+                success=True,
+                message="Development tools created successfully",
+            )
+
+        except Exception as e:
+            self.log_error(f"Development tool creation failed: {e}")
+            return ModuleResult(
+                module_name=self.name, success=False, message=str(e), error=e
+            )
+
+    def plan_skeleton(self, context: ExecutionContext) -> None:
+        """Plan the development scripts shared by every project."""
+        with self.timed(context, "development_tools"):
+            self._create_development_tools(context)
+
+    def _create_development_tools(self, context: ExecutionContext) -> None:
+        """Create development tools and scripts."""
+        # Create scripts directory
+        context.write_plan.mkdir("scripts")
+
+        # Create dev.py
+        dev_script = '''#!/usr/bin/env python3
+"""
+Development environment setup and management script.
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+def setup_environment():
+    """Set up development environment."""
+    print("Setting up development environment...")
+
+    # Create virtual environment if it doesn't exist
+    if not Path(".venv").exists():
+        print("Creating virtual environment...")
+        subprocess.run([sys.executable, "-m", "venv", ".venv"])
+
+    # Activate virtual environment and install dependencies
+    if os.name == "nt":  # Windows
+        pip_path = ".venv/Scripts/pip"
+    else:  # Unix/Linux/MacOS
+        pip_path = ".venv/bin/pip"
+
+    # Install dependencies
+    print("Installing dependencies...")
+    subprocess.run([pip_path, "install", "-r", "requirements.txt"])
+
+    print("Development environment setup complete!")
+
+def run_tests():
+    """Run test suite."""
+    print("Running tests...")
+    subprocess.run(["pytest", "-v"])
+
+def run_linting():
+    """Run code linting."""
+    print("Running linting...")
+    subprocess.run(["flake8", "src"])
+    subprocess.run(["mypy", "src"])
+
+def run_consistency_check():
+    """Run codebase consistency validation."""
+    print("Running consistency validation...")
+    result = subprocess.run(
+        [sys.executable, "scripts/validate_consistency.py"]
+    )
+    if result.returncode != 0:
+        print("\\nConsistency validation failed!")
+        print("Please fix the issues before continuing.")
+        sys.exit(1)
+    print("Consistency validation passed!")
+
+def run_all_checks():
+    """Run all development checks."""
+    print("Running all development checks...")
+    run_consistency_check()
+    run_linting()
+    run_tests()
+    print("\\nAll checks completed successfully!")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(
+            "Usage: python scripts/dev.py "
+            "[setup|test|lint|consistency|all]"
+        )
+        sys.exit(1)
+
+    command = sys.argv[1]
+    if command == "setup":
+        setup_environment()
+    elif command == "test":
+        run_tests()
+    elif command == "lint":
+        run_linting()
+    elif command == "consistency":
+        run_consistency_check()
+    elif command == "all":
+        run_all_checks()
+    else:
+        print(f"Unknown command: {command}")
+        sys.exit(1)
+'''
+
+        context.write_plan.write_text("scripts/dev.py", dev_script)
+
+        # Create validate.py
+        validate_script = '''#!/usr/bin/env python3
+"""
+Project structure validation script.
+"""
+
+import os
+import sys
+from pathlib import Path
+import json
+
+def validate_structure():
+    """Validate project structure."""
+    print("Validating project structure...")
+
+    # Load project metadata
+    with open(".cursor/project.json", "r") as f:
+        metadata = json.load(f)
+
+    # Check required directories
+    required_dirs = [
+        "src",
+        "tests",
+        "docs",
+        "config",
+        ".cursor"
+    ]
+
+    for dir_name in required_dirs:
+        if not Path(dir_name).exists():
+            print(f"Error: Required directory '{dir_name}' is missing")
+            return False
+
+    # Check required files
+    required_files = [
+        "README.md",
+        ".gitignore",
+        ".env.example",
+        "requirements.txt"
+    ]
+
+    for file_name in required_files:
+        if not Path(file_name).exists():
+            print(f"Error: Required file '{file_name}' is missing")
+            return False
+
+    print("Project structure validation complete!")
+    return True
+
+if __name__ == "__main__":
+    if not validate_structure():
+        sys.exit(1)
+'''
+
+        context.write_plan.write_text("scripts/validate.py", validate_script)
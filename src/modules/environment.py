@@ -0,0 +1,63 @@
+"""Environment module for generating project environment files."""
+
+from ..core.core_types import ExecutionContext, ExecutionPhase, ModuleResult
+from ..core.env_manager import EnvManager
+from ..core.module import BaseModule
+from ..core.template_engine import default_engine
+
+
+class EnvironmentModule(BaseModule):
+    """Copies the global environment and creates environment templates."""
+
+    phase = ExecutionPhase.TEMPLATES
+    depends_on = ("project_creator",)
+
+    def __init__(self) -> None:
+        """Initialize EnvironmentModule."""
+        super().__init__("environment", "Creates project environment files")
+        self.env_manager = EnvManager()
+
+    def execute(self, context: ExecutionContext) -> ModuleResult:
+        """Execute environment file creation."""
+        try:
+            # Copy environment configuration
+            with self.timed(context, "copy_to_project"):
+                self.env_manager.copy_to_project(
+                    context.project_root,
+                    context.write_plan,
+                    copy_env=context.include_env_file,
+                )
+
+            # Create environment files
+            with self.timed(context, "environment_files"):
+                self._create_environment_files(context)
+
+            return ModuleResult(
+                module_name=self.name,
+                success=True,
+                message="Environment files created successfully",
+            )
+
+        except Exception as e:
+            self.log_error(f"Environment file creation failed: {e}")
+            return ModuleResult(
+                module_name=self.name, success=False, message=str(e), error=e
+            )
+
+    def _create_environment_files(self, context: ExecutionContext) -> None:
+        """Create comprehensive environment file structure."""
+        templates = default_engine()
+        values = {
+            "project_name": context.project_name,
+            "db_name": context.project_name.lower().replace(" ", "_"),
+        }
+
+        # Create .env.example
+        context.write_plan.write_chunks(
+            ".env.example", templates.get("env_example").render(**values)
+        )
+
+        # Create .env.development
+        context.write_plan.write_chunks(
+            ".env.development", templates.get("env_development").render(**values)
+        )
@@ -1,14 +1,21 @@
 """File organizer module for the cursor development system."""
 
-import json
-
-from ..core.core_types import ExecutionContext, ModuleResult, ProjectType
+from ..core.core_types import (
+    ExecutionContext,
+    ExecutionPhase,
+    ModuleResult,
+    ProjectType,
+)
 from ..core.module import BaseModule
+from ..core.template_engine import default_engine
 
 
 class FileOrganizerModule(BaseModule):
     """Organizes file layouts and creates configuration files."""
 
+    phase = ExecutionPhase.TEMPLATES
+    depends_on = ("project_creator",)
+
     def __init__(self) -> None:
         """Initialize FileOrganizerModule."""
         super().__init__("file_organizer", "Organizes files and creates configurations")
@@ -18,7 +25,10 @@ class FileOrganizerModule(BaseModule):
         if not super().validate(context):
             return False
 
-        if not context.project_root.exists():
+        if not (
+            context.write_plan.has_dir(".")
+            or (context.write_to_disk and context.project_root.exists())
+        ):
             self.log_error(f"Project directory does not exist: {context.project_root}")
             return False
 
@@ -29,20 +39,13 @@ class FileOrganizerModule(BaseModule):
         try:
             self.log_info(f"Organizing files for {context.project_type.value}")
 
-            # Create universal project structure
-            self._create_universal_structure(context)
-
-            # Create type-specific structure
-            self._create_type_specific_structure(context)
+            # Create name-independent layout unless cloned from a skeleton
+            if not context.skeleton_cached:
+                self.plan_skeleton(context)
 
             # Create configuration files
-            self._create_configuration_files(context)
-
-            # Create environment files
-            self._create_environment_files(context)
-
-            # Create development tools
-            self._create_development_tools(context)
+            with self.timed(context, "configuration_files"):
+                self._create_configuration_files(context)
 
             return ModuleResult(
                 module_name=self.name,
@@ -56,6 +59,20 @@ class FileOrganizerModule(BaseModule):
                 module_name=self.name, success=False, message=str(e), error=e
             )
 
+    def plan_skeleton(self, context: ExecutionContext) -> None:
+        """Plan the layout and static configs shared per project type."""
+        # Create universal project structure
+        with self.timed(context, "universal_structure"):
+            self._create_universal_structure(context)
+
+        # Create type-specific structure
+        with self.timed(context, "type_specific_structure"):
+            self._create_type_specific_structure(context)
+
+        # Create configuration files that do not depend on the project name
+        with self.timed(context, "static_configs"):
+            self._create_static_configs(context)
+
     def _create_universal_structure(self, context: ExecutionContext) -> None:
         """Create universal project structure."""
         universal_dirs = [
@@ -74,9 +91,8 @@ class FileOrganizerModule(BaseModule):
         ]
 
         for dir_name in universal_dirs:
-            dir_path = context.project_root / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
-            self.log_info(f"Created directory: {dir_path}")
+            context.write_plan.mkdir(dir_name)
+            self.log_debug(f"Planned directory: {dir_name}")
 
     def _create_type_specific_structure(self, context: ExecutionContext) -> None:
         """Create project-type specific structure."""
@@ -109,8 +125,7 @@ class FileOrganizerModule(BaseModule):
         ]
 
         for dir_name in web_dirs:
-            dir_path = context.project_root / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
+            context.write_plan.mkdir(dir_name)
 
     def _create_backend_structure(self, context: ExecutionContext) -> None:
         """Create backend/API structure."""
@@ -130,8 +145,7 @@ class FileOrganizerModule(BaseModule):
         ]
 
         for dir_name in backend_dirs:
-            dir_path = context.project_root / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
+            context.write_plan.mkdir(dir_name)
 
     def _create_windows_structure(self, context: ExecutionContext) -> None:
         """Create Windows automation structure."""
@@ -153,8 +167,7 @@ class FileOrganizerModule(BaseModule):
         ]
 
         for dir_name in windows_dirs:
-            dir_path = context.project_root / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
+            context.write_plan.mkdir(dir_name)
 
     def _create_cad_structure(self, context: ExecutionContext) -> None:
         """Create CAD automation structure."""
@@ -180,8 +193,7 @@ class FileOrganizerModule(BaseModule):
         ]
 
         for dir_name in cad_dirs:
-            dir_path = context.project_root / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
+            context.write_plan.mkdir(dir_name)
 
     def _create_desktop_structure(self, context: ExecutionContext) -> None:
         """Create desktop application structure."""
@@ -202,152 +214,30 @@ class FileOrganizerModule(BaseModule):
         ]
 
         for dir_name in desktop_dirs:
-            dir_path = context.project_root / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
+            context.write_plan.mkdir(dir_name)
 
     def _create_configuration_files(self, context: ExecutionContext) -> None:
         """Create project configuration files."""
         # Create .cursorrules with organization standards
-        cursorrules_content = f"""# {context.project_name} - Cursor AI Rules
-# Generated by Cursor Development System v2.0.0
-# Project Type: {context.project_type.value}
-
-## UNIVERSAL PROJECT STRUCTURE
-Adapt this structure based on project type. Always maintain consistent organization principles.
-
-```
-project-root/
-├── .cursor/                    # Cursor settings
-├── .github/                    # CI/CD workflows
-├── docs/                       # Documentation
-├── src/                        # Source code (main development)
-├── scripts/                    # Automation and build scripts
-├── config/                     # Configuration files
-├── tests/                      # Test files
-├── assets/                     # Static assets
-├── data/                       # Data files and databases
-├── output/                     # Generated/compiled files
-├── tools/                      # Development tools and utilities
-└── examples/                   # Usage examples
-```
-
-## FILE TYPE ORGANIZATION RULES
-
-### COMPONENTS AND UI ELEMENTS
-**Location:** `src/components/` or `src/ui/`
-**Naming:** PascalCase (Button.tsx, UserProfile.jsx, MainWindow.cs)
-**Structure:**
-```
-ComponentName/
-├── index.ts                   # Export file
-├── ComponentName.tsx          # Main component
-├── ComponentName.module.css   # Styles
-├── ComponentName.test.tsx     # Tests
-└── ComponentName.types.ts     # Types
-```
-
-### AUTOMATION SCRIPTS
-**Location:** `src/automation/` or `scripts/`
-**Naming:** kebab-case or camelCase depending on language
-- PowerShell: `Get-SystemInfo.ps1`
-- Python: `system_monitor.py`
-- Batch: `backup-files.bat`
-- VBScript: `AutoCAD_BatchProcess.vbs`
-
-### API AND SERVICE FILES
-**Location:** `src/services/` or `src/api/`
-**Naming:** camelCase with Service suffix
-- `userService.ts`
-- `authenticationService.py`
-- `windowsRegistryService.cs`
-
-### UTILITY FUNCTIONS
-**Location:** `src/utils/` or `src/helpers/`
-**Naming:** camelCase describing purpose
-- `dateUtils.ts`
-- `fileOperations.py`
-- `cadGeometry.js`
-- `registryHelper.ps1`
-
-### CONFIGURATION FILES
-**Location:** `config/` or `src/config/`
-**Naming:** Purpose-based naming
-- `database.config.js`
-- `api.settings.json`
-- `automation.config.xml`
-- `cad.standards.json`
-
-## LANGUAGE-SPECIFIC RULES
-
-### TYPESCRIPT/JAVASCRIPT
-- Components: PascalCase (.tsx, .jsx)
-- Utilities: camelCase (.ts, .js)
-- Types: camelCase with .types.ts suffix
-- Constants: SCREAMING_SNAKE_CASE or camelCase
-
-### PYTHON
-- Modules: snake_case (.py)
-- Classes: PascalCase
-- Functions: snake_case
-- Constants: SCREAMING_SNAKE_CASE
-
-### C#/.NET
-- Classes: PascalCase (.cs)
-- Interfaces: IPascalCase
-- Methods: PascalCase
-- Private fields: _camelCase
-
-### POWERSHELL
-- Scripts: Verb-Noun.ps1 (Get-SystemInfo.ps1)
-- Functions: Verb-Noun format
-- Variables: $camelCase
-
-## IMPORT AND REFERENCE RULES
-
-### ABSOLUTE IMPORTS (Use for):
-- Cross-feature references
-- Core utilities and services
-- Shared components
-- Configuration files
-
-### RELATIVE IMPORTS (Use for):
-- Files in same directory
-- Parent/child relationships
-- Feature-specific modules
-
-### IMPORT ORDER:
-1. External libraries/frameworks
-2. Internal absolute imports
-3. Relative imports (parent directories)
-4. Relative imports (same directory)
-5. Type imports (TypeScript)
-
-## QUALITY STANDARDS
-
-### Every file should have:
-1. **Clear purpose** - Single responsibility
-2. **Proper location** - Following organizational rules
-3. **Consistent naming** - Following language conventions
-4. **Appropriate imports** - Clean dependency management
-5. **Documentation** - Comments explaining purpose
-
-### Before creating any file:
-1. Check if similar functionality exists
-2. Determine the correct location using these rules
-3. Use appropriate naming convention
-4. Set up proper imports/exports
-5. Add basic documentation
-"""
-
-        cursorrules_file = context.project_root / ".cursorrules"
-        with open(cursorrules_file, "w", encoding="utf-8") as f:
-            f.write(cursorrules_content)
+        template = default_engine().get("cursorrules_organization")
+        cursorrules = template.render(
+            project_name=context.project_name,
+            project_type=context.project_type.value,
+        )
+        context.write_plan.write_chunks(".cursorrules", cursorrules)
 
         # Create type-specific configuration files
         if context.project_type == ProjectType.REACT_SPA:
             self._create_react_configs(context)
         elif context.project_type == ProjectType.FASTAPI_BACKEND:
             self._create_fastapi_configs(context)
+
+    def _create_static_configs(self, context: ExecutionContext) -> None:
+        """Create configuration files that do not depend on the project name."""
+        if context.project_type == ProjectType.REACT_SPA:
+            self._create_tsconfig(context)
+        elif context.project_type == ProjectType.FASTAPI_BACKEND:
+            self._create_fastapi_requirements(context)
         elif context.project_type == ProjectType.PYTHON_AUTOMATION:
             self._create_python_configs(context)
 
@@ -391,11 +281,10 @@ ComponentName/
             },
         }
 
-        package_file = context.project_root / "package.json"
-        with open(package_file, "w", encoding="utf-8") as f:
-            json.dump(package_json, f, indent=2)
+        context.write_plan.write_json("package.json", package_json)
 
-        # tsconfig.json
+    def _create_tsconfig(self, context: ExecutionContext) -> None:
+        """Create TypeScript configuration for React projects."""
         tsconfig = {
             "compilerOptions": {
                 "target": "ES2020",
@@ -425,13 +314,10 @@ ComponentName/
             "references": [{"path": "./tsconfig.node.json"}],
         }
 
-        tsconfig_file = context.project_root / "tsconfig.json"
-        with open(tsconfig_file, "w", encoding="utf-8") as f:
-            json.dump(tsconfig, f, indent=2)
+        context.write_plan.write_json("tsconfig.json", tsconfig)
 
-    def _create_fastapi_configs(self, context: ExecutionContext) -> None:
-        """Create FastAPI configuration files."""
-        # requirements.txt
+    def _create_fastapi_requirements(self, context: ExecutionContext) -> None:
+        """Create FastAPI requirements file."""
         requirements = [
             "fastapi[all]>=0.104.0",
             "uvicorn[standard]>=0.24.0",
@@ -449,52 +335,14 @@ ComponentName/
             "httpx>=0.25.0",
         ]
 
-        requirements_file = context.project_root / "requirements.txt"
-        with open(requirements_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(requirements))
+        context.write_plan.write_text("requirements.txt", "\n".join(requirements))
 
+    def _create_fastapi_configs(self, context: ExecutionContext) -> None:
+        """Create FastAPI configuration files."""
         # pyproject.toml
-        pyproject_content = f"""[build-system]
-requires = ["setuptools>=61.0", "wheel"]
-build-backend = "setuptools.build_meta"
-
-[project]
-name = "{context.project_name}"
-version = "1.0.0"
-description = "Generated by Cursor Development System"
-authors = [{{name = "Developer", email = "dev@example.com"}}]
-license = {{text = "MIT"}}
-requires-python = ">=3.11"
-
-[tool.black]
-line-length = 88
-target-version = ['py311']
-include = '\\.pyi?$'
-
-[tool.isort]
-profile = "black"
-multi_line_output = 3
-line_length = 88
-
-[tool.mypy]
-python_version = "3.11"
-warn_return_any = true
-warn_unused_configs = true
-disallow_untyped_defs = true
-
-[tool.pytest.ini_options]
-testpaths = ["tests"]
-python_files = ["test_*.py", "*_test.py"]
-addopts = "-v --tb=short --strict-markers"
-markers = [
-    "slow: marks tests as slow",
-    "integration: marks tests as integration tests"
-]
-"""
-
-        pyproject_file = context.project_root / "pyproject.toml"
-        with open(pyproject_file, "w", encoding="utf-8") as f:
-            f.write(pyproject_content)
+        template = default_engine().get("fastapi_pyproject.toml")
+        pyproject = template.render(project_name=context.project_name)
+        context.write_plan.write_chunks("pyproject.toml", pyproject)
 
     def _create_python_configs(self, context: ExecutionContext) -> None:
         """Create Python automation configuration files."""
@@ -512,264 +360,4 @@ markers = [
             "pytest-cov>=4.1.0",
         ]
 
-        requirements_file = context.project_root / "requirements.txt"
-        with open(requirements_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(requirements))
-
-    def _create_environment_files(self, context: ExecutionContext) -> None:
-        """Create comprehensive environment file structure."""
-        # Create .env.example
-        env_example_content = f"""# ================================================================
-# {context.project_name} - Environment Configuration Template
-# ================================================================
-# Copy this file to .env and configure your values
-
-# Application Settings
-APP_NAME={context.project_name}
-APP_ENV=development
-APP_DEBUG=true
-APP_URL=http://localhost:3000
-
-# Database Configuration
-DB_HOST=localhost
-DB_PORT=5432
-DB_NAME={context.project_name.lower().replace(' ', '_')}
-DB_USER=postgres
-DB_PASSWORD=your_password_here
-
-# API Configuration
-API_VERSION=v1
-API_PREFIX=/api
-API_RATE_LIMIT=100
-
-# Security
-JWT_SECRET=your_jwt_secret_here
-JWT_ALGORITHM=HS256
-JWT_EXPIRATION=3600
-
-# Logging
-LOG_LEVEL=INFO
-LOG_FORMAT=json
-LOG_FILE=logs/app.log
-
-# External Services
-REDIS_URL=redis://localhost:6379
-SMTP_HOST=smtp.gmail.com
-SMTP_PORT=587
-SMTP_USER=your_email@gmail.com
-SMTP_PASSWORD=your_app_password_here
-
-# Feature Flags
-ENABLE_CACHE=true
-ENABLE_RATE_LIMITING=true
-ENABLE_SWAGGER=true
-"""
-
-        env_example_file = context.project_root / ".env.example"
-        with open(env_example_file, "w", encoding="utf-8") as f:
-            f.write(env_example_content)
-
-        # Create .env.development
-        env_dev_content = f"""# ================================================================
-# {context.project_name} - Development Environment
-# ================================================================
-
-# Application Settings
-APP_NAME={context.project_name}
-APP_ENV=development
-APP_DEBUG=true
-APP_URL=http://localhost:3000
-
-# Database Configuration
-DB_HOST=localhost
-DB_PORT=5432
-DB_NAME={context.project_name.lower().replace(' ', '_')}_dev
-DB_USER=postgres
-DB_PASSWORD=postgres
-
-# API Configuration
-API_VERSION=v1
-API_PREFIX=/api
-API_RATE_LIMIT=1000
-
-# Security
-JWT_SECRET=dev_secret_key_change_in_production
-JWT_ALGORITHM=HS256
-JWT_EXPIRATION=3600
-
-# Logging
-LOG_LEVEL=DEBUG
-LOG_FORMAT=json
-LOG_FILE=logs/app.log
-
-# External Services
-REDIS_URL=redis://localhost:6379
-SMTP_HOST=smtp.gmail.com
-SMTP_PORT=587
-SMTP_USER=dev@example.com
-SMTP_PASSWORD=dev_password
-
-# Feature Flags
-ENABLE_CACHE=true
-ENABLE_RATE_LIMITING=false
-ENABLE_SWAGGER=true
-"""
-
-        env_dev_file = context.project_root / ".env.development"
-        with open(env_dev_file, "w", encoding="utf-8") as f:
-            f.write(env_dev_content)
-
-    def _create_development_tools(self, context: ExecutionContext) -> None:
-        """Create development tools and scripts."""
-        # Create scripts directory
-        scripts_dir = context.project_root / "scripts"
-        scripts_dir.mkdir(exist_ok=True)
-
-        # Create dev.py
-        dev_script = '''#!/usr/bin/env python3
-"""
-Development environment setup and management script.
-"""
-
-import os
-import sys
-import subprocess
-from pathlib import Path
-
-def setup_environment():
-    """Set up development environment."""
-    print("Setting up development environment...")
-
-    # Create virtual environment if it doesn't exist
-    if not Path(".venv").exists():
-        print("Creating virtual environment...")
-        subprocess.run([sys.executable, "-m", "venv", ".venv"])
-
-    # Activate virtual environment and install dependencies
-    if os.name == "nt":  # Windows
-        pip_path = ".venv/Scripts/pip"
-    else:  # Unix/Linux/MacOS
-        pip_path = ".venv/bin/pip"
-
-    # Install dependencies
-    print("Installing dependencies...")
-    subprocess.run([pip_path, "install", "-r", "requirements.txt"])
-
-    print("Development environment setup complete!")
-
-def run_tests():
-    """Run test suite."""
-    print("Running tests...")
-    subprocess.run(["pytest", "-v"])
-
-def run_linting():
-    """Run code linting."""
-    print("Running linting...")
-    subprocess.run(["flake8", "src"])
-    subprocess.run(["mypy", "src"])
-
-def run_consistency_check():
-    """Run codebase consistency validation."""
-    print("Running consistency validation...")
-    result = subprocess.run(
-        [sys.executable, "scripts/validate_consistency.py"]
-    )
-    if result.returncode != 0:
-        print("\\nConsistency validation failed!")
-        print("Please fix the issues before continuing.")
-        sys.exit(1)
-    print("Consistency validation passed!")
-
-def run_all_checks():
-    """Run all development checks."""
-    print("Running all development checks...")
-    run_consistency_check()
-    run_linting()
-    run_tests()
-    print("\\nAll checks completed successfully!")
-
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(
-            "Usage: python scripts/dev.py "
-            "[setup|test|lint|consistency|all]"
-        )
-        sys.exit(1)
-
-    command = sys.argv[1]
-    if command == "setup":
-        setup_environment()
-    elif command == "test":
-        run_tests()
-    elif command == "lint":
-        run_linting()
-    elif command == "consistency":
-        run_consistency_check()
-    elif command == "all":
-        run_all_checks()
-    else:
-        print(f"Unknown command: {command}")
-        sys.exit(1)
-'''
-
-        dev_file = scripts_dir / "dev.py"
-        with open(dev_file, "w", encoding="utf-8") as f:
-            f.write(dev_script)
-
-        # Create validate.py
-        validate_script = '''#!/usr/bin/env python3
-"""
-Project structure validation script.
-"""
-
-import os
-import sys
-from pathlib import Path
-import json
-
-def validate_structure():
-    """Validate project structure."""
-    print("Validating project structure...")
-
-    # Load project metadata
-    with open(".cursor/project.json", "r") as f:
-        metadata = json.load(f)
-
-    # Check required directories
-    required_dirs = [
-        "src",
-        "tests",
-        "docs",
-        "config",
-        ".cursor"
-    ]
-
-    for dir_name in required_dirs:
-        if not Path(dir_name).exists():
-            print(f"Error: Required directory '{dir_name}' is missing")
-            return False
-
-    # Check required files
-    required_files = [
-        "README.md",
-        ".gitignore",
-        ".env.example",
-        "requirements.txt"
-    ]
-
-    for file_name in required_files:
-        if not Path(file_name).exists():
-            print(f"Error: Required file '{file_name}' is missing")
-            return False
-
-    print("Project structure validation complete!")
-    return True
-
-if __name__ == "__main__":
-    if not validate_structure():
-        sys.exit(1)
-'''
-
-        validate_file = scripts_dir / "validate.py"
-        with open(validate_file, "w", encoding="utf-8") as f:
-            f.write(validate_script)
+        context.write_plan.write_text("requirements.txt", "\n".join(requirements))
@@ -1,27 +1,32 @@
 """Project creator module for generating new projects."""
 
-import json
 from datetime import datetime
 
-from ..core.core_types import ExecutionContext, ModuleResult, ProjectType
-from ..core.env_manager import EnvManager
+from ..core.core_types import (
+    ExecutionContext,
+    ExecutionPhase,
+    ModuleResult,
+    ProjectType,
+)
 from ..core.module import BaseModule
+from ..core.template_engine import default_engine
 
 
 class ProjectCreatorModule(BaseModule):
     """Module for creating new projects."""
 
+    phase = ExecutionPhase.INFRASTRUCTURE
+
     def __init__(self) -> None:
         """Initialize ProjectCreatorModule."""
         super().__init__("project_creator", "Creates project directory structure")
-        self.env_manager = EnvManager()
 
     def validate(self, context: ExecutionContext) -> bool:
         """Validate project creator can execute."""
         if not super().validate(context):
             return False
 
-        if context.project_root.exists():
+        if context.write_to_disk and context.project_root.exists():
             self.log_error(f"Project directory already exists: {context.project_root}")
             return False
 
@@ -34,17 +39,18 @@ class ProjectCreatorModule(BaseModule):
                 f"Creating {context.project_type.value} project: {context.project_name}"
             )
 
-            # Create project directory
-            context.project_root.mkdir(parents=True)
+            # Create name-independent structure unless cloned from a skeleton
+            if not context.skeleton_cached:
+                with self.timed(context, "skeleton"):
+                    self.plan_skeleton(context)
 
             # Create project metadata
-            self._create_project_metadata(context)
+            with self.timed(context, "project_metadata"):
+                self._create_project_metadata(context)
 
             # Create base files
-            self._create_base_files(context)
-
-            # Copy environment configuration
-            self.env_manager.copy_to_project(context.project_root)
+            with self.timed(context, "base_files"):
+                self._create_base_files(context)
 
             return ModuleResult(
                 module_name=self.name,
@@ -58,6 +64,11 @@ class ProjectCreatorModule(BaseModule):
                 module_name=self.name, success=False, message=str(e), error=e
             )
 
+    def plan_skeleton(self, context: ExecutionContext) -> None:
+        """Plan the directories and .gitignore shared by every project."""
+        self._create_base_structure(context)
+        self._create_gitignore(context)
+
     def _create_base_structure(self, context: ExecutionContext) -> None:
         """Create base directory structure."""
         base_dirs = [
@@ -71,9 +82,8 @@ class ProjectCreatorModule(BaseModule):
         ]
 
         for dir_name in base_dirs:
-            dir_path = context.project_root / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
-            self.log_info(f"Created directory: {dir_path}")
+            context.write_plan.mkdir(dir_name)
+            self.log_debug(f"Planned directory: {dir_name}")
 
         # Create project-type specific structure
         self._create_type_specific_structure(context)
@@ -124,8 +134,7 @@ class ProjectCreatorModule(BaseModule):
 
         dirs = type_structures.get(context.project_type, [])
         for dir_name in dirs:
-            dir_path = context.project_root / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
+            context.write_plan.mkdir(dir_name)
 
     def _create_project_metadata(self, context: ExecutionContext) -> None:
         """Create project metadata file."""
@@ -158,17 +167,12 @@ class ProjectCreatorModule(BaseModule):
             },
         }
 
-        metadata_file = context.project_root / ".cursor" / "project.json"
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
+        context.write_plan.write_json(".cursor/project.json", metadata)
 
         self.log_info("Project metadata created")
 
     def _create_base_files(self, context: ExecutionContext) -> None:
         """Create base project files."""
-        # Create .gitignore
-        self._create_gitignore(context)
-
         # Create README.md
         self._create_readme(context)
 
@@ -237,164 +241,23 @@ htmlcov/
 !.env.production
 """
 
-        gitignore_file = context.project_root / ".gitignore"
-        with open(gitignore_file, "w", encoding="utf-8") as f:
-            f.write(gitignore_content)
+        context.write_plan.write_text(".gitignore", gitignore_content)
 
     def _create_readme(self, context: ExecutionContext) -> None:
         """Create comprehensive README.md."""
-        readme_content = f"""# {context.project_name}
-
-**Project Type:** {context.project_type.value}
-**Created:** {datetime.now().strftime('%Y-%m-%d')}
-**Generated by:** Cursor Development System v2.0.0
-
-## 🏗️ Project Structure
-
-This project follows **complexity-based development** principles:
-
-### Development Phases:
-1. **Architecture Phase** - Core systems and database design
-2. **API Phase** - Backend services and data layer
-3. **UI Phase** - User interface and components
-4. **Polish Phase** - Optimization and deployment
-
-## 🚀 Quick Start
-
-```bash
-cd {context.project_name}
-# Follow the phase-based development approach
-# Start with the most complex components first
-```
-
-## 📁 Directory Structure
-
-```
-{context.project_name}/
-├── src/           # Source code
-├── tests/         # Test files
-├── docs/          # Documentation
-├── config/        # Configuration
-└── .cursor/       # AI configuration
-```
-
-## 🤖 Cursor AI Integration
-
-This project is optimized for Cursor AI with:
-- Smart .cursorrules for context-aware assistance
-- Modular architecture following best practices
-- Automated validation and consistency checking
-- Phase-based development workflow
-
-## 📚 Documentation
-
-- See `docs/` for detailed documentation
-- Check `.cursor/project.json` for project metadata
-- Review `.cursorrules` for AI configuration
-
-## 🔧 Available Scripts
-
-Run the development environment:
-```bash
-python scripts/dev.py
-```
-
-Validate project structure:
-```bash
-python scripts/validate.py
-```
-
-## 🎯 Development Workflow
-
-This project uses complexity-based development. Start with:
-1. Core architecture and database design
-2. API endpoints and business logic
-3. User interface components
-4. Styling and optimization
-"""
-
-        readme_file = context.project_root / "README.md"
-        with open(readme_file, "w", encoding="utf-8") as f:
-            f.write(readme_content)
+        template = default_engine().get("readme.md")
+        readme = template.render(
+            project_name=context.project_name,
+            project_type=context.project_type.value,
+            created=datetime.now().strftime("%Y-%m-%d"),
+        )
+        context.write_plan.write_chunks("README.md", readme)
 
     def _create_cursorrules(self, context: ExecutionContext) -> None:
         """Create basic .cursorrules file."""
-        cursorrules_content = f"""# {context.project_name} - Cursor AI Rules
-# Generated by Cursor Development System v2.0.0
-# Project Type: {context.project_type.value}
-
-## PROJECT OVERVIEW
-- **Name**: {context.project_name}
-- **Type**: {context.project_type.value}
-- **Architecture**: Modular with Separation of Concerns
-- **Development**: Complexity-based phased approach
-
-## DEVELOPMENT PHASES (Follow this order)
-
-### Phase 1: Architecture (Highest Complexity)
-- Database schema and core models
-- Authentication and security systems
-- Core business logic and algorithms
-- System architecture decisions
-
-### Phase 2: API Layer (High Complexity)
-- REST/GraphQL API endpoints
-- Data validation and serialization
-- Error handling and middleware
-- Service layer implementation
-
-### Phase 3: UI Layer (Medium Complexity)
-- User interface components
-- Forms and user interactions
-- Navigation and routing
-- State management
-
-### Phase 4: Polish (Low Complexity)
-- Styling and visual design
-- Performance optimization
-- Testing and documentation
-- Deployment configuration
-
-## CODING STANDARDS
-
-### Universal Rules:
-- Always use @codebase for cross-file changes
-- Maintain consistency across all files
-- Follow naming conventions strictly
-- Implement comprehensive error handling
-- Write self-documenting code
-
-### File Organization:
-- Group related functionality together
-- Use clear, descriptive file names
-- Maintain consistent directory structure
-- Keep modules focused and cohesive
-
-### Quality Gates:
-- No print/console.log statements in production
-- No hardcoded credentials or secrets
-- All functions must have error handling
-- Follow project-specific naming conventions
-
-## VALIDATION RULES
-
-Before saving any file:
-1. Check syntax and structure
-2. Verify naming conventions
-3. Ensure error handling exists
-4. Validate against project standards
-
-## CONSISTENCY ENFORCEMENT
-
-- Use @codebase when updating interfaces
-- Apply changes to ALL related files
-- Maintain uniform patterns across codebase
-- Update documentation with code changes
-
-This configuration ensures AI-assisted development follows
-best practices and maintains high code quality.
-"""
-
-        cursorrules_file = context.project_root / ".cursorrules"
-        with open(cursorrules_file, "w", encoding="utf-8") as f:
-            f.write(cursorrules_content)
+        template = default_engine().get("cursorrules")
+        cursorrules = template.render(
+            project_name=context.project_name,
+            project_type=context.project_type.value,
+        )
+        context.write_plan.write_chunks(".cursorrules", cursorrules)
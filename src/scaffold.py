@@ -0,0 +1,285 @@
+"""Scaffolding pipeline shared by the single-project CLI and batch mode."""
+
+import logging
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .core.core_types import ExecutionContext, ModuleResult, SystemConfig
+from .core.module import BaseModule
+from .core.policy import DeadlineExceeded, ExecutionPolicy
+from .core.profiling import Span
+from .core.runner import ModuleRunner
+from .modules import create_modules
+
+if TYPE_CHECKING:
+    from .core.archive import WritableStream
+    from .core.skeleton_cache import Skeleton, SkeletonCache
+
+
+@dataclass
+class ScaffoldOutcome:
+    """Aggregated result of scaffolding a single project."""
+
+    project_name: str
+    project_root: Path
+    results: List[ModuleResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    spans: List[Span] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """Return True if every module ran and succeeded."""
+        return bool(self.results) and all(result.success for result in self.results)
+
+    @property
+    def message(self) -> str:
+        """Return the message of the first failing module, if any."""
+        for result in self.results:
+            if not result.success:
+                return f"{result.module_name}: {result.message}"
+        return "Project created successfully"
+
+
+def flush_plan(
+    context: ExecutionContext,
+    skeleton: Optional["Skeleton"] = None,
+    policy: Optional[ExecutionPolicy] = None,
+) -> ModuleResult:
+    """Flush the context's write plan below the project root.
+
+    The flush runs under the policy's deadline, so a stalled target
+    directory fails the project instead of blocking it, and is retried on
+    transient I/O errors. Flushing is idempotent, so a retry simply
+    rewrites what the failed attempt left behind. If the flush fails for
+    good, the partly written project root is removed once the writer has
+    stopped; a writer that ignores cancellation is left to finish, along
+    with its files.
+
+    Args:
+        context: Execution context whose plan should be written
+        skeleton: Cached skeleton to clone before the plan is applied
+        policy: Deadline and retry settings (defaults to ExecutionPolicy())
+
+    Returns:
+        Result whose data holds the flush statistics
+    """
+    policy = policy or ExecutionPolicy()
+    profiler = context.profiler
+    events: List[Dict[str, Any]] = []
+    started = time.perf_counter()
+    cancel = threading.Event()
+    # Only a root the flush creates is removed when it fails
+    created_root = not context.project_root.exists()
+
+    def write() -> Any:
+        strategy = None
+        if skeleton is not None:
+            with profiler.span("materialize_skeleton", "write_plan"):
+                strategy = skeleton.materialize(context.project_root)
+        return strategy, context.write_plan.flush(
+            context.project_root, profiler, cancel
+        )
+
+    context.emit("write_started", target="disk")
+    try:
+        strategy, stats = policy.run(
+            "write_plan", write, lambda _: None, events, cancel
+        )
+    except Exception as e:
+        logging.error(f"Writing {context.project_root} failed: {e}")
+        if created_root:
+            _remove_partial_project(context.project_root, e)
+        context.emit("write_finished", target="disk", success=False, message=str(e))
+        return ModuleResult(
+            module_name="write_plan",
+            success=False,
+            message=str(e),
+            data={"events": events},
+            execution_time=time.perf_counter() - started,
+            error=e,
+        )
+
+    context.emit("write_finished", target="disk", success=True, **stats.as_dict())
+    data = {
+        **stats.as_dict(),
+        "skeleton": strategy,
+        "timings": profiler.breakdown("write_plan"),
+        "events": events,
+    }
+    return ModuleResult(
+        module_name="write_plan",
+        success=True,
+        message=f"Wrote {stats.files} files and {stats.directories} directories",
+        data=data,
+        execution_time=time.perf_counter() - started,
+    )
+
+
+def _remove_partial_project(project_root: Path, error: Exception) -> None:
+    """Remove a project root left behind by a failed flush.
+
+    Args:
+        project_root: Project root the flush created
+        error: Error the flush failed with
+    """
+    if isinstance(error, DeadlineExceeded) and not error.stopped:
+        logging.warning(
+            f"Leaving {project_root} in place: its writer did not stop in time"
+        )
+        return
+    shutil.rmtree(project_root, ignore_errors=True)
+
+
+def archive_plan(
+    context: ExecutionContext, fileobj: "WritableStream", archive_format: str
+) -> ModuleResult:
+    """Write the context's write plan into an archive below the project name.
+
+    Unlike a flush, the archive is not retried or bounded by the policy's
+    deadline: a partially written stream cannot be rewound, and a consumer
+    reading slowly is not a stalled write.
+
+    Args:
+        context: Execution context whose plan should be archived
+        fileobj: Binary stream the archive is written to
+        archive_format: One of the formats in src.core.archive
+
+    Returns:
+        Result whose data holds the archive statistics
+    """
+    from .core.archive import write_archive
+
+    started = time.perf_counter()
+    context.emit("write_started", target="archive")
+    try:
+        with context.profiler.span("archive", "write_plan"):
+            stats = write_archive(
+                context.write_plan, fileobj, archive_format, context.project_name
+            )
+    except Exception as e:
+        logging.error(f"Archiving {context.project_name} failed: {e}")
+        context.emit("write_finished", target="archive", success=False, message=str(e))
+        return ModuleResult(
+            module_name="archive",
+            success=False,
+            message=str(e),
+            execution_time=time.perf_counter() - started,
+            error=e,
+        )
+
+    context.emit("write_finished", target="archive", success=True, **stats.as_dict())
+    return ModuleResult(
+        module_name="archive",
+        success=True,
+        message=f"Archived {stats.files} files and {stats.directories} directories",
+        data={**stats.as_dict(), "format": archive_format},
+        execution_time=time.perf_counter() - started,
+    )
+
+
+def _run_pipeline(
+    context: ExecutionContext,
+    modules: List[BaseModule],
+    policy: ExecutionPolicy,
+    write: Callable[[], ModuleResult],
+    started: float,
+) -> ScaffoldOutcome:
+    """Run the modules and, if they all succeed, write their plan."""
+    outcome = ScaffoldOutcome(
+        project_name=context.project_name, project_root=context.project_root
+    )
+    outcome.results = ModuleRunner(modules, policy=policy).run(context)
+    if outcome.success:
+        outcome.results.append(write())
+
+    outcome.elapsed = time.perf_counter() - started
+    context.profiler.record("scaffold", "pipeline", started, outcome.elapsed)
+    outcome.spans = context.profiler.spans()
+    return outcome
+
+
+def scaffold(
+    context: ExecutionContext,
+    skeleton_cache: Optional["SkeletonCache"] = None,
+    config: Optional[SystemConfig] = None,
+) -> ScaffoldOutcome:
+    """Run the scaffolding modules for a single execution context.
+
+    Registered modules run on the module runner and record their output in
+    the context's write plan, under the timeout, retry and fail-fast
+    settings of the system configuration. The plan is flushed to disk in one
+    pass once every module has succeeded, so a failed module leaves nothing
+    behind, and a failed or overrunning flush removes what it wrote (see
+    ``flush_plan``).
+
+    With a skeleton cache, name-independent output is cloned from a prebuilt
+    skeleton and modules only render the name-dependent files.
+
+    Args:
+        context: Execution context describing the project to create
+        skeleton_cache: Optional cache of prebuilt project skeletons
+        config: System configuration (defaults to SystemConfig())
+
+    Returns:
+        Outcome holding one ModuleResult per module that ran
+    """
+    started = time.perf_counter()
+    policy = ExecutionPolicy.from_config(config or SystemConfig())
+    modules = create_modules()
+
+    skeleton = None
+    if skeleton_cache is not None:
+        try:
+            with context.profiler.span("lookup", "skeleton_cache"):
+                skeleton = skeleton_cache.get(context, modules)
+            context.skeleton_cached = True
+        except OSError as e:
+            logging.warning(f"Skeleton cache unavailable, generating in full: {e}")
+
+    return _run_pipeline(
+        context,
+        modules,
+        policy,
+        lambda: flush_plan(context, skeleton, policy),
+        started,
+    )
+
+
+def scaffold_archive(
+    context: ExecutionContext,
+    fileobj: "WritableStream",
+    archive_format: str,
+    config: Optional[SystemConfig] = None,
+) -> ScaffoldOutcome:
+    """Run the scaffolding modules and stream the project into an archive.
+
+    Nothing is written below the project root: modules skip their disk
+    checks and the write plan is serialized straight into ``fileobj``, with
+    every entry under a directory named after the project. The archive is
+    only started once every module has succeeded, so a failed scaffold
+    writes no bytes.
+
+    Args:
+        context: Execution context describing the project to create
+        fileobj: Binary stream the archive is written to, e.g. a pipe or an
+            ArchiveStream; it does not need to be seekable
+        archive_format: One of the formats in src.core.archive
+        config: System configuration (defaults to SystemConfig())
+
+    Returns:
+        Outcome holding one ModuleResult per module that ran
+    """
+    started = time.perf_counter()
+    policy = ExecutionPolicy.from_config(config or SystemConfig())
+    context.write_to_disk = False
+    return _run_pipeline(
+        context,
+        create_modules(),
+        policy,
+        lambda: archive_plan(context, fileobj, archive_format),
+        started,
+    )
@@ -0,0 +1,5 @@
+"""Web server for the cursor development system.
+
+The server lives apart from the scaffolding CLI so that creating a project
+never imports FastAPI; import ``src.web.app`` to build the ASGI app.
+"""
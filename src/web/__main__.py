@@ -0,0 +1,22 @@
+"""Run the web server with uvicorn."""
+
+import argparse
+
+
+def main() -> None:
+    """Parse arguments and serve the web application."""
+    parser = argparse.ArgumentParser(description="Cursor Development System server")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument(
+        "--reload", action="store_true", help="Reload when source files change"
+    )
+    args = parser.parse_args()
+
+    import uvicorn
+
+    uvicorn.run("src.web.app:app", host=args.host, port=args.port, reload=args.reload)
+
+
+if __name__ == "__main__":
+    main()
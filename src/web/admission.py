@@ -0,0 +1,314 @@
+"""Per-client rate limiting and a global concurrency cap for scaffolds."""
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Optional
+
+from ..core.core_types import SystemConfig
+
+# Seconds clients are asked to wait when every scaffold slot is taken
+OVERLOADED_RETRY_AFTER = 1
+
+
+class AdmissionError(Exception):
+    """Raised when a request is not admitted."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Reason the request was rejected
+            retry_after: Seconds the client should wait before retrying
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """Return the Retry-After header value in whole seconds."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class RateLimitedError(AdmissionError):
+    """Raised when a client exceeds its request rate."""
+
+
+class OverloadedError(AdmissionError):
+    """Raised when no scaffold slot frees up in time."""
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self, now: Optional[float] = None) -> float:
+        """Take a token if one is available.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available
+        """
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Token-bucket rate limits per client key.
+
+    Buckets are kept for the most recently seen ``max_clients`` keys; a
+    client evicted from the table starts again with a full bucket.
+    """
+
+    def __init__(self, rate: float, burst: int, max_clients: int = 10_000) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Requests per second each client may sustain; 0 disables
+                limiting
+            burst: Requests a client may make at once
+            max_clients: Client buckets kept in memory
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, key: str) -> None:
+        """Count a request against a client's bucket.
+
+        Args:
+            key: Client identity, e.g. an API key or IP address
+
+        Raises:
+            RateLimitedError: If the client has no tokens left
+        """
+        if self.rate <= 0:
+            return
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            wait = bucket.take()
+        if wait:
+            raise RateLimitedError("Rate limit exceeded", wait)
+
+
+class _Waiter:
+    """A thread or coroutine queued for a scaffold slot."""
+
+    def __init__(self, wake: Callable[[], None], bounded: bool) -> None:
+        """Initialize the waiter.
+
+        Args:
+            wake: Called without the limiter lock once a slot is handed over
+            bounded: Whether the waiter counts against the queue limit
+        """
+        self.wake = wake
+        self.bounded = bounded
+        self.granted = False
+
+
+class ConcurrencyLimiter:
+    """Caps scaffolds running at once, with a bounded wait queue.
+
+    A request takes a free slot immediately, waits up to ``timeout``
+    seconds if fewer than ``queue_size`` requests are already waiting, and
+    is rejected at once otherwise, so overload produces fast rejections
+    instead of an ever-growing latency tail. Background jobs, which were
+    admitted to their own queue already, wait for a slot without a limit.
+
+    Waiters are served first come, first served: a released slot is handed
+    straight to the oldest one, so newcomers cannot overtake them. Requests
+    wait on the event loop with ``acquire_async()`` and never hold a thread
+    while queued.
+    """
+
+    def __init__(self, limit: int, queue_size: int, timeout: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limit: Scaffolds allowed to run at once
+            queue_size: Requests allowed to wait for a slot
+            timeout: Seconds a request waits before it is rejected
+        """
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: SystemConfig) -> "ConcurrencyLimiter":
+        """Create a limiter from the system configuration.
+
+        Args:
+            config: System configuration
+
+        Returns:
+            Limiter enforcing max_concurrent_scaffolds and the admission
+            queue settings
+        """
+        return cls(
+            config.max_concurrent_scaffolds,
+            config.admission_queue_size,
+            config.admission_timeout_seconds,
+        )
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of requests and jobs waiting for a slot."""
+        return len(self._waiters)
+
+    def _enqueue(self, wake: Callable[[], None], bounded: bool) -> Optional[_Waiter]:
+        """Take a free slot, or queue a waiter for the next one.
+
+        Returns:
+            None if a slot was taken, else the queued waiter
+
+        Raises:
+            OverloadedError: If a bounded waiter finds the queue full
+        """
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return None
+            if bounded:
+                queued = sum(1 for waiter in self._waiters if waiter.bounded)
+                if queued >= self.queue_size:
+                    raise OverloadedError(
+                        f"{self.active} scaffolds running and {queued} waiting",
+                        OVERLOADED_RETRY_AFTER,
+                    )
+            waiter = _Waiter(wake, bounded)
+            self._waiters.append(waiter)
+            return waiter
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """Stop waiting for a slot.
+
+        Returns:
+            True if the slot was handed over meanwhile and is now held
+        """
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            return False
+
+    def _overloaded(self) -> OverloadedError:
+        """Return the error raised when no slot freed up in time."""
+        return OverloadedError(
+            f"No scaffold slot freed up within {self.timeout:g}s",
+            OVERLOADED_RETRY_AFTER,
+        )
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """Take a slot, blocking the calling thread until one is free.
+
+        Used by job workers; the wait does not count against the queue
+        limit.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Raises:
+            OverloadedError: If no slot freed up within the timeout
+        """
+        granted = threading.Event()
+        waiter = self._enqueue(granted.set, bounded=False)
+        if waiter is None:
+            return
+        if not granted.wait(timeout) and not self._abandon(waiter):
+            raise self._overloaded()
+
+    async def acquire_async(self) -> None:
+        """Take a slot, waiting on the running event loop if the queue has room.
+
+        Raises:
+            OverloadedError: If the queue is full or no slot freed up in time
+        """
+        loop = asyncio.get_running_loop()
+        granted = asyncio.Event()
+
+        def wake() -> None:
+            try:
+                loop.call_soon_threadsafe(granted.set)
+            except RuntimeError:
+                pass  # The loop has shut down; the waiter is abandoned below
+
+        waiter = self._enqueue(wake, bounded=True)
+        if waiter is None:
+            return
+        try:
+            await asyncio.wait_for(granted.wait(), self.timeout)
+        except asyncio.TimeoutError:
+            if not self._abandon(waiter):
+                raise self._overloaded() from None
+        except BaseException:
+            # Cancelled: give back a slot that was handed over meanwhile
+            if self._abandon(waiter):
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Return a slot, handing it to the oldest waiter if there is one."""
+        with self._lock:
+            if not self._waiters:
+                self.active -= 1
+                return
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+        waiter.wake()
+
+
+class Admission:
+    """Rate limits and concurrency cap built from the system configuration."""
+
+    def __init__(
+        self,
+        config: Optional[SystemConfig] = None,
+        concurrency: Optional[ConcurrencyLimiter] = None,
+    ) -> None:
+        """Initialize admission control.
+
+        Args:
+            config: System configuration holding the limits (defaults to
+                SystemConfig())
+            concurrency: Scaffold slots to admit requests to, e.g. those the
+                job manager's workers take (defaults to a limiter built
+                from the configuration)
+        """
+        config = config or SystemConfig()
+        self.rate_limiter = RateLimiter(
+            config.rate_limit_per_second,
+            config.rate_limit_burst,
+            config.rate_limit_clients,
+        )
+        self.concurrency = concurrency or ConcurrencyLimiter.from_config(config)
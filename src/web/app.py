@@ -0,0 +1,298 @@
+"""ASGI application serving the API and the built frontend."""
+
+import itertools
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterator, Optional
+from urllib.parse import quote
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import (
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
+from pydantic import BaseModel
+
+from ..core.archive import (
+    ARCHIVE_FORMATS,
+    WritableStream,
+    check_format,
+    stream_archive,
+)
+from ..core.core_types import ExecutionContext, ProjectType
+from ..scaffold import scaffold_archive
+from .admission import Admission, AdmissionError, RateLimitedError
+from .frontend import FrontendAssets
+from .jobs import JobConflictError, JobManager, QueueFullError, validate_project_name
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .progress import MEDIA_TYPE as EVENTS_MEDIA_TYPE
+from .progress import server_sent_events
+
+DEFAULT_STATIC_DIR = Path("dist")
+
+LOOPBACK_HOSTS = ("127.0.0.1", "::1")
+
+# Seconds clients are asked to wait before retrying a rejected submission
+QUEUE_FULL_RETRY_AFTER = 5
+
+
+class ProjectRequest(BaseModel):
+    """Execution context fields accepted by the project-creation API."""
+
+    project_name: str
+    project_type: ProjectType
+    output_path: Optional[str] = None
+    advanced_mode: bool = False
+    github_integration: bool = False
+    skip_install: bool = False
+    template_variant: str = "default"
+
+    def to_context(self) -> ExecutionContext:
+        """Build the execution context for this request."""
+        return ExecutionContext(
+            project_name=self.project_name,
+            project_type=self.project_type,
+            output_path=Path(self.output_path) if self.output_path else None,
+            advanced_mode=self.advanced_mode,
+            github_integration=self.github_integration,
+            skip_install=self.skip_install,
+            template_variant=self.template_variant,
+        )
+
+
+def client_key(request: Request) -> str:
+    """Return the identity rate limits are applied to.
+
+    Clients sending an X-API-Key header are limited per key, everyone else
+    per IP address.
+    """
+    api_key = request.headers.get("x-api-key")
+    if api_key:
+        return f"key:{api_key}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def _release_when_done(
+    chunks: Iterator[bytes], release: Callable[[], None]
+) -> Iterator[bytes]:
+    """Yield chunks, then release a slot however the iteration ends."""
+    try:
+        yield from chunks
+    finally:
+        release()
+
+
+def create_app(
+    static_dir: Optional[Path] = None,
+    jobs: Optional[JobManager] = None,
+    admission: Optional[Admission] = None,
+) -> FastAPI:
+    """Create the web application.
+
+    Args:
+        static_dir: Built frontend directory (defaults to ./dist), served
+            from memory; POST /api/frontend/reload picks up a new build
+        jobs: Job manager running project creation (defaults to one built
+            from SystemConfig)
+        admission: Rate limits and concurrency cap for scaffold requests
+            (defaults to the limits in the job manager's SystemConfig);
+            its concurrency cap is shared with the job manager's workers
+
+    Raises:
+        ValueError: If the job manager and admission control were given
+            different concurrency limiters
+
+    Returns:
+        The configured FastAPI application
+    """
+    frontend = FrontendAssets(static_dir or DEFAULT_STATIC_DIR)
+    if jobs is None:
+        jobs = JobManager(concurrency=admission.concurrency if admission else None)
+    admission = admission or Admission(jobs.config, jobs.concurrency)
+    if admission.concurrency is not jobs.concurrency:
+        raise ValueError("Jobs and admission control must share one scaffold cap")
+    concurrency = admission.concurrency
+    jobs.metrics.add_gauge(
+        "scaffold_slots_active",
+        "Scaffolds, from jobs or archive downloads, holding a concurrency slot.",
+        lambda: concurrency.active,
+    )
+    jobs.metrics.add_gauge(
+        "scaffold_slots_waiting",
+        "Scaffolds, from jobs or archive downloads, waiting for a concurrency slot.",
+        lambda: concurrency.waiting,
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        yield
+        jobs.shutdown(wait=False)
+
+    app = FastAPI(title="Unified Web Application", lifespan=lifespan)
+    app.state.jobs = jobs
+    app.state.frontend = frontend
+    app.state.admission = admission
+
+    @app.exception_handler(AdmissionError)  # type: ignore[misc]
+    async def reject(request: Request, error: AdmissionError) -> JSONResponse:
+        """Reject a request with 429 or 503 and a Retry-After header."""
+        limited = isinstance(error, RateLimitedError)
+        jobs.metrics.rejections.inc(reason="rate_limited" if limited else "overloaded")
+        return JSONResponse(
+            status_code=429 if limited else 503,
+            content={"detail": str(error)},
+            headers={"Retry-After": error.retry_after_header},
+        )
+
+    # API routes
+    @app.get("/api/health")  # type: ignore[misc]
+    async def health_check() -> dict:
+        """Return health status of the API."""
+        return {"status": "healthy"}
+
+    @app.get("/api/metrics")  # type: ignore[misc]
+    async def metrics() -> PlainTextResponse:
+        """Return scaffold and queue metrics in Prometheus text format."""
+        return PlainTextResponse(jobs.metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+    @app.post("/api/projects", status_code=202)  # type: ignore[misc]
+    async def create_project(project: ProjectRequest, request: Request) -> JSONResponse:
+        """Queue a project for creation and return its job id."""
+        admission.rate_limiter.check(client_key(request))
+        try:
+            job = jobs.submit(project.to_context())
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except JobConflictError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except QueueFullError as e:
+            jobs.metrics.rejections.inc(reason="queue_full")
+            raise HTTPException(
+                status_code=503,
+                detail=str(e),
+                headers={"Retry-After": str(QUEUE_FULL_RETRY_AFTER)},
+            )
+
+        return JSONResponse(
+            status_code=202,
+            content={
+                "id": job.id,
+                "status": job.status.value,
+                "url": f"/api/projects/{job.id}",
+            },
+            headers={"Location": f"/api/projects/{job.id}"},
+        )
+
+    @app.post("/api/projects/archive")  # type: ignore[misc]
+    async def download_project(
+        project: ProjectRequest,
+        request: Request,
+        archive_format: str = Query("zip", alias="format"),
+    ) -> StreamingResponse:
+        """Stream a generated project as an archive without writing to disk.
+
+        The global .env is left out so server secrets never reach clients.
+        The response starts once the modules have succeeded and the first
+        archive bytes exist; failures before that are reported as errors.
+        Each download holds a concurrency slot until its stream ends.
+        """
+        admission.rate_limiter.check(client_key(request))
+        try:
+            validate_project_name(project.project_name)
+            check_format(archive_format)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        context = project.to_context()
+        context.include_env_file = False
+
+        def produce(fileobj: WritableStream) -> None:
+            outcome = scaffold_archive(context, fileobj, archive_format, jobs.config)
+            jobs.metrics.observe_outcome(context.project_type, outcome)
+            if not outcome.success:
+                raise RuntimeError(outcome.message)
+
+        await concurrency.acquire_async()
+        # Starting the wrapper here guarantees the slot is released even if
+        # the response is never iterated
+        stream = _release_when_done(stream_archive(produce), concurrency.release)
+        try:
+            first = await run_in_threadpool(next, stream, b"")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+        filename = quote(f"{context.project_name}.{archive_format}")
+        return StreamingResponse(
+            itertools.chain([first], stream),
+            media_type=ARCHIVE_FORMATS[archive_format],
+            headers={"Content-Disposition": f"attachment; filename*=UTF-8''{filename}"},
+        )
+
+    @app.get("/api/projects/{job_id}")  # type: ignore[misc]
+    async def get_project_job(job_id: str) -> dict:
+        """Return the status and module results of a job."""
+        job = jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+        return job.as_dict()
+
+    @app.get("/api/projects/{job_id}/events")  # type: ignore[misc]
+    async def stream_project_events(job_id: str, request: Request) -> Response:
+        """Stream a job's progress as server-sent events.
+
+        Events already published are replayed first, or only those after
+        the Last-Event-ID header of a reconnecting client. The stream ends
+        once the job has finished.
+        """
+        if jobs.get(job_id) is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+        try:
+            after = int(request.headers.get("last-event-id", 0))
+        except ValueError:
+            after = 0
+
+        subscription = jobs.events.subscribe(job_id, after=after)
+        return StreamingResponse(
+            server_sent_events(subscription),
+            media_type=EVENTS_MEDIA_TYPE,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.post("/api/frontend/reload")  # type: ignore[misc]
+    async def reload_frontend(request: Request) -> dict:
+        """Reload the built frontend from disk; loopback clients only."""
+        client = request.client.host if request.client else None
+        if client not in LOOPBACK_HOSTS:
+            raise HTTPException(status_code=403)
+        return {"files": frontend.reload()}
+
+    # Serve the frontend static files
+    @app.get("/static/{path:path}")  # type: ignore[misc]
+    async def serve_static(path: str, request: Request) -> Response:
+        """Serve a file from the built frontend."""
+        response = frontend.respond(path, request.headers)
+        if response is None:
+            raise HTTPException(status_code=404)
+        return response
+
+    # Serve the frontend for all other routes
+    @app.get("/{path:path}")  # type: ignore[misc]
+    async def serve_frontend(path: str, request: Request) -> Response:
+        """Serve the frontend application."""
+        # Unknown API routes must not fall through to the frontend
+        if path.startswith("api"):
+            raise HTTPException(status_code=404)
+
+        # Serve built files directly and index.html for all other routes
+        response = frontend.respond(path, request.headers, fallback=True)
+        if response is None:
+            raise HTTPException(status_code=404)
+        return response
+
+    return app
+
+
+app = create_app()
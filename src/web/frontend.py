@@ -0,0 +1,249 @@
+"""In-memory, precompressed serving of the built frontend."""
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Dict, Mapping, Optional, Union
+
+from starlette.responses import FileResponse, Response
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger("frontend")
+
+INDEX_FILE = "index.html"
+
+# Files larger than this are streamed from disk instead of held in memory
+MAX_CACHED_BYTES = 8 * 1024 * 1024
+
+# Compressing tiny files costs more than it saves
+MIN_COMPRESS_BYTES = 256
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/wasm",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# Bundler output names carry a hex content hash, e.g. index-3f9a1c2b.js
+# (vite.config.ts pins this format); other names are revalidated
+_HASHED_NAME = re.compile(r"-[0-9a-f]{8,}\.[0-9A-Za-z]+$")
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+
+@dataclass
+class Variant:
+    """One encoding of an asset's body."""
+
+    body: bytes
+    etag: str
+
+
+@dataclass
+class Asset:
+    """A frontend file held in memory with its precompressed variants."""
+
+    path: Path
+    content_type: str
+    cache_control: str
+    variants: Dict[str, Variant] = field(default_factory=dict)
+
+
+def _content_type(path: Path) -> str:
+    """Return the Content-Type header value for a file."""
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type in (
+        "application/javascript",
+        "application/json",
+    ):
+        content_type += "; charset=utf-8"
+    return content_type
+
+
+def _compress(body: bytes, content_type: str) -> Dict[str, bytes]:
+    """Return the compressed encodings of a body worth serving."""
+    if len(body) < MIN_COMPRESS_BYTES or not content_type.startswith(
+        COMPRESSIBLE_TYPES
+    ):
+        return {}
+
+    encoded = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded["br"] = brotli.compress(body, quality=11)
+    return {name: data for name, data in encoded.items() if len(data) < len(body)}
+
+
+def load_asset(path: Path, relative: str) -> Asset:
+    """Read a file and precompute its encodings and ETags.
+
+    Args:
+        path: File to load
+        relative: Path relative to the frontend root
+
+    Returns:
+        The in-memory asset
+    """
+    body = path.read_bytes()
+    content_type = _content_type(path)
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    cache_control = (
+        IMMUTABLE_CACHE
+        if _HASHED_NAME.search(relative) and relative != INDEX_FILE
+        else REVALIDATE_CACHE
+    )
+
+    asset = Asset(path=path, content_type=content_type, cache_control=cache_control)
+    asset.variants["identity"] = Variant(body=body, etag=f'"{digest}"')
+    for encoding, data in _compress(body, content_type).items():
+        # Strong ETags must differ between encodings of the same resource
+        asset.variants[encoding] = Variant(body=data, etag=f'"{digest}-{encoding}"')
+    return asset
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into encoding quality values."""
+    accepted: Dict[str, float] = {}
+    for item in (header or "").split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def choose_encoding(asset: Asset, header: Optional[str]) -> str:
+    """Pick the precomputed encoding the client gives the highest quality.
+
+    Ties go to the smaller encoding, brotli before gzip. The uncompressed
+    body competes only when the header lists ``identity`` or ``*``, and is
+    the fallback when no compressed variant is acceptable.
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = "identity", accepted.get("identity", wildcard)
+    for encoding in ("gzip", "br"):
+        quality = accepted.get(encoding, wildcard)
+        if encoding in asset.variants and quality > 0 and quality >= best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    """Return True if If-None-Match matches an ETag (weak comparison)."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+class FrontendAssets:
+    """Serves a built frontend from memory with ETags and compression.
+
+    Every file below the root is loaded at startup with gzip (and brotli,
+    if installed) variants computed once. ``reload()`` rebuilds the cache
+    from disk and swaps it in atomically, so a new build can be picked up
+    without restarting the server.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize and load the frontend.
+
+        Args:
+            root: Built frontend directory, e.g. dist/
+        """
+        self.root = root
+        # Relative path to an in-memory asset, or to a file too large to cache
+        self._files: Dict[str, Union[Asset, Path]] = {}
+        self._reload_lock = threading.Lock()
+        self.reload()
+
+    def reload(self) -> int:
+        """Reload every file from disk.
+
+        Returns:
+            Number of files now served
+        """
+        with self._reload_lock:
+            files: Dict[str, Union[Asset, Path]] = {}
+            if self.root.is_dir():
+                for current, _, names in os.walk(self.root):
+                    for name in names:
+                        path = Path(current) / name
+                        relative = path.relative_to(self.root).as_posix()
+                        if path.stat().st_size > MAX_CACHED_BYTES:
+                            files[relative] = path
+                        else:
+                            files[relative] = load_asset(path, relative)
+
+            # Requests in flight keep using the old mapping until this swap
+            self._files = files
+            logger.info(f"Loaded {len(files)} files from {self.root}")
+            return len(files)
+
+    def respond(
+        self, path: str, headers: Mapping[str, str], fallback: bool = False
+    ) -> Optional[Response]:
+        """Build the response for a request path.
+
+        Args:
+            path: Request path relative to the frontend root
+            headers: Request headers
+            fallback: Serve index.html when the path is not a file, for
+                client-side routing
+
+        Returns:
+            The response, or None if nothing matches
+        """
+        files = self._files
+        asset = files.get(PurePosixPath(path.lstrip("/")).as_posix())
+        if asset is None and fallback:
+            asset = files.get(INDEX_FILE)
+        if isinstance(asset, Path):
+            return FileResponse(asset)
+        if asset is None:
+            return None
+
+        response_headers = {
+            "Cache-Control": asset.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        encoding = choose_encoding(asset, headers.get("accept-encoding"))
+        variant = asset.variants[encoding]
+        response_headers["ETag"] = variant.etag
+
+        if _etag_matches(headers.get("if-none-match"), variant.etag):
+            return Response(status_code=304, headers=response_headers)
+
+        if encoding != "identity":
+            response_headers["Content-Encoding"] = encoding
+        return Response(
+            content=variant.body,
+            headers=response_headers,
+            media_type=asset.content_type,
+        )
@@ -0,0 +1,302 @@
+"""Background project-creation jobs on a bounded worker pool."""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Optional, Set
+
+from ..core.core_types import ExecutionContext, ModuleResult, SystemConfig
+from ..core.events import EventBus
+from ..scaffold import ScaffoldOutcome, scaffold
+from .admission import ConcurrencyLimiter
+from .metrics import Counter, ScaffoldMetrics
+
+logger = logging.getLogger("jobs")
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a project-creation job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue is at capacity."""
+
+
+class JobConflictError(Exception):
+    """Raised when a job for the same project root is already in flight."""
+
+
+@dataclass
+class Job:
+    """A queued, running or finished project-creation job."""
+
+    id: str
+    context: ExecutionContext
+    status: JobStatus = JobStatus.QUEUED
+    created: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    outcome: Optional[ScaffoldOutcome] = None
+    error: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the job status as JSON-serializable data."""
+        results = self.outcome.results if self.outcome else []
+        return {
+            "id": self.id,
+            "status": self.status.value,
+            "project_name": self.context.project_name,
+            "project_type": self.context.project_type.value,
+            "project_root": str(self.context.project_root),
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "message": self.outcome.message if self.outcome else self.error,
+            "results": [result_as_dict(result) for result in results],
+        }
+
+
+def result_as_dict(result: ModuleResult) -> Dict[str, Any]:
+    """Return a module result as JSON-serializable data."""
+    return {
+        "module_name": result.module_name,
+        "success": result.success,
+        "message": result.message,
+        "data": result.data,
+        "execution_time": result.execution_time,
+        "error": repr(result.error) if result.error else None,
+    }
+
+
+def resolve_output_path(root: Path, output: Optional[str]) -> Path:
+    """Resolve a client-supplied output directory below the server root.
+
+    Args:
+        root: Directory every project must be created under
+        output: Relative output directory, or None for the root itself
+
+    Returns:
+        Output directory below the root
+
+    Raises:
+        ValueError: If the path is absolute or escapes the root
+    """
+    if not output:
+        return root
+    relative = PurePosixPath(output.replace("\\", "/"))
+    if relative.is_absolute() or ".." in relative.parts or ":" in output:
+        raise ValueError(f"Output path must be relative to the server root: {output}")
+    return root / relative
+
+
+def validate_project_name(name: str) -> None:
+    """Reject project names that are not a single path component.
+
+    Raises:
+        ValueError: If the name is empty or contains path separators
+    """
+    if not name or name in (".", "..") or any(c in name for c in "/\\:\0"):
+        raise ValueError(f"Invalid project name: {name!r}")
+
+
+class JobManager:
+    """Runs project-creation jobs on a bounded thread pool.
+
+    At most ``workers`` jobs run at once and at most ``queue_size`` more
+    wait; submissions beyond that fail immediately with QueueFullError so
+    bursts are rejected instead of piling up. Each worker also holds a slot
+    of the global scaffold cap while it scaffolds, so jobs and archive
+    downloads together never exceed max_concurrent_scaffolds. Finished jobs
+    are kept for status queries until ``max_jobs`` is exceeded, oldest first.
+    """
+
+    def __init__(
+        self,
+        output_root: Optional[Path] = None,
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        max_jobs: Optional[int] = None,
+        config: Optional[SystemConfig] = None,
+        metrics: Optional[ScaffoldMetrics] = None,
+        events: Optional[EventBus] = None,
+        concurrency: Optional[ConcurrencyLimiter] = None,
+    ) -> None:
+        """Initialize the job manager.
+
+        Args:
+            output_root: Directory all projects are created under
+            workers: Jobs running at once
+            queue_size: Jobs allowed to wait for a worker
+            max_jobs: Finished jobs kept for status queries
+            config: System configuration supplying defaults and the
+                execution policy
+            metrics: Metrics finished jobs and queue gauges are reported to
+                (defaults to a new ScaffoldMetrics)
+            events: Bus each job's progress events are published on, with
+                the job id as topic (defaults to a new EventBus)
+            concurrency: Global scaffold cap workers take a slot of
+                (defaults to a limiter built from the configuration)
+        """
+        self.config = config or SystemConfig()
+        self.output_root = output_root or self.config.server_output_root
+        self.workers = workers or self.config.server_workers
+        self.queue_size = (
+            self.config.server_queue_size if queue_size is None else queue_size
+        )
+        self.max_jobs = max_jobs or self.config.server_max_jobs
+        self.concurrency = concurrency or ConcurrencyLimiter.from_config(self.config)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="job"
+        )
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active_roots: Set[Path] = set()
+        self._pending = 0
+        self._running = 0
+        self._lock = threading.Lock()
+
+        self.events = events or EventBus()
+        self.metrics = metrics or ScaffoldMetrics()
+        self._busy_seconds = self.metrics.registry.register(
+            Counter(
+                "scaffold_worker_busy_seconds_total",
+                "Seconds job workers spent running jobs; divide its rate by "
+                "scaffold_workers for utilization.",
+            )
+        )
+        self.metrics.add_gauge(
+            "scaffold_workers", "Job worker threads.", lambda: self.workers
+        )
+        self.metrics.add_gauge(
+            "scaffold_jobs_running", "Jobs running on a worker.", lambda: self._running
+        )
+        self.metrics.add_gauge(
+            "scaffold_queue_depth",
+            "Jobs waiting for a worker.",
+            lambda: self._pending - self._running,
+        )
+        self.metrics.add_gauge(
+            "scaffold_worker_utilization",
+            "Fraction of job workers currently busy.",
+            lambda: self._running / self.workers,
+        )
+
+    @property
+    def pending(self) -> int:
+        """Return the number of queued and running jobs."""
+        return self._pending
+
+    def submit(self, context: ExecutionContext) -> Job:
+        """Queue a project for creation.
+
+        The context's output path is interpreted relative to the output
+        root.
+
+        Args:
+            context: Execution context describing the project
+
+        Returns:
+            The queued job
+
+        Raises:
+            ValueError: If the project name or output path is invalid
+            QueueFullError: If every worker is busy and the queue is full
+            JobConflictError: If the same project is already being created
+        """
+        validate_project_name(context.project_name)
+        output = context.output_path.as_posix() if context.output_path else None
+        job_id = uuid.uuid4().hex
+        context = replace(
+            context,
+            output_path=resolve_output_path(self.output_root, output),
+            events=self.events.channel(job_id),
+        )
+        root = context.project_root
+
+        with self._lock:
+            if self._pending >= self.workers + self.queue_size:
+                raise QueueFullError(
+                    f"{self._pending} jobs pending, queue limit reached"
+                )
+            if root in self._active_roots:
+                raise JobConflictError(f"{root} is already being created")
+
+            job = Job(id=job_id, context=context)
+            self._jobs[job.id] = job
+            self._active_roots.add(root)
+            self._pending += 1
+            self._evict_finished()
+
+        context.emit("status", status=job.status.value)
+        self._executor.submit(self._run, job)
+        logger.info(f"Queued job {job.id} for {root}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, or None if it is unknown or evicted."""
+        return self._jobs.get(job_id)
+
+    def _run(self, job: Job) -> None:
+        """Run a job on a worker thread once a scaffold slot is free."""
+        self.concurrency.acquire()
+        try:
+            self._execute(job)
+        finally:
+            self.concurrency.release()
+
+    def _execute(self, job: Job) -> None:
+        """Scaffold a job's project and record the outcome."""
+        job.status = JobStatus.RUNNING
+        job.started = time.time()
+        with self._lock:
+            self._running += 1
+        job.context.emit("status", status=job.status.value)
+        try:
+            job.outcome = scaffold(job.context, config=self.config)
+            job.status = (
+                JobStatus.SUCCEEDED if job.outcome.success else JobStatus.FAILED
+            )
+            self.metrics.observe_outcome(job.context.project_type, job.outcome)
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+            self.metrics.observe_error(job.context.project_type)
+        finally:
+            job.finished = time.time()
+            self._busy_seconds.inc(job.finished - job.started)
+            with self._lock:
+                self._active_roots.discard(job.context.project_root)
+                self._running -= 1
+                self._pending -= 1
+            message = job.outcome.message if job.outcome else job.error
+            job.context.emit("status", status=job.status.value, message=message)
+            self.events.close(job.id)
+
+    def _evict_finished(self) -> None:
+        """Drop the oldest finished jobs beyond the retention limit."""
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].finished is not None:
+                del self._jobs[job_id]
+                self.events.discard(job_id)
+                excess -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and optionally wait for running ones."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
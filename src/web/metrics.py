@@ -0,0 +1,347 @@
+"""Prometheus text-format metrics for the scaffolding server."""
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from ..core.core_types import ModuleResult, ProjectType
+from ..scaffold import ScaffoldOutcome
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; scaffolds are normally milliseconds, slow storage pushes them up
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# ModuleResult names of the steps that write a finished plan
+WRITE_TARGETS = {"write_plan": "disk", "archive": "archive"}
+
+LabelValues = Tuple[str, ...]
+
+MetricT = TypeVar("MetricT", bound="_Metric")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value as Prometheus expects."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set, e.g. {module="environment"}."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}"
+
+
+class _Metric(ABC):
+    """Labelled metric family rendered in the text exposition format."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        """Initialize the metric.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            labels: Label names, in the order values are passed
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Return the label values in declaration order."""
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}")
+        return tuple(str(labels[name]) for name in self.labels)
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Return the sample lines of the metric."""
+        pass
+
+    def render(self) -> str:
+        """Return the metric family in the text exposition format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        """Initialize the counter."""
+        super().__init__(name, documentation, labels)
+        # An unlabelled counter is exported as 0 before its first increment
+        self._values: Dict[LabelValues, float] = {} if self.labels else {(): 0.0}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current count for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        """Return one sample per label set."""
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Gauge(_Metric):
+    """Current value read from a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, read: Callable[[], float]
+    ) -> None:
+        """Initialize the gauge.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            read: Returns the current value
+        """
+        super().__init__(name, documentation)
+        self.read = read
+
+    def samples(self) -> List[str]:
+        """Return the current value."""
+        return [f"{self.name} {_format_value(self.read())}"]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            labels: Label names, in the order values are passed
+            buckets: Upper bounds of the buckets, ascending; +Inf is implied
+        """
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Label values to per-bucket counts (last is +Inf), sum and count
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(
+                key, ([0] * (len(self.buckets) + 1), [0.0])
+            )
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations for a label set."""
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> List[str]:
+        """Return the bucket, sum and count samples of every label set."""
+        with self._lock:
+            values = sorted(
+                (key, list(counts), total[0])
+                for key, (counts, total) in self._values.items()
+            )
+
+        lines = []
+        names = (*self.labels, "le")
+        for key, counts, total in values:
+            cumulative = 0
+            bounds = (*self.buckets, math.inf)
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                labels = _format_labels(names, (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Add a metric.
+
+        Raises:
+            ValueError: If a metric with the same name is registered
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Return every metric in the text exposition format."""
+        return "".join(f"{metric.render()}\n" for metric in self._metrics.values())
+
+
+class ScaffoldMetrics:
+    """Scaffold latency, module timings and write volume for the server.
+
+    Outcomes are fed in by whoever runs the scaffold (the job manager and
+    the archive endpoint); queue gauges are added by the job manager with
+    ``add_gauge``.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        """Initialize the scaffold metrics.
+
+        Args:
+            registry: Registry to add the metrics to (defaults to a new one)
+        """
+        self.registry = registry or MetricsRegistry()
+        register = self.registry.register
+        self.scaffold_seconds = register(
+            Histogram(
+                "scaffold_duration_seconds",
+                "End-to-end scaffold latency per project type.",
+                ("project_type",),
+            )
+        )
+        self.scaffolds = register(
+            Counter(
+                "scaffold_projects_total",
+                "Scaffolds finished per project type and status.",
+                ("project_type", "status"),
+            )
+        )
+        self.module_seconds = register(
+            Histogram(
+                "scaffold_module_duration_seconds",
+                "Execution time of each module, including retries.",
+                ("module",),
+            )
+        )
+        self.module_errors = register(
+            Counter(
+                "scaffold_module_errors_total",
+                "Modules that failed, excluding those skipped after a failure.",
+                ("module",),
+            )
+        )
+        self.rejections = register(
+            Counter(
+                "scaffold_requests_rejected_total",
+                "Scaffold requests rejected by rate limits or a full queue.",
+                ("reason",),
+            )
+        )
+        self.files_written = register(
+            Counter(
+                "scaffold_files_written_total",
+                "Files written to disk or into archives.",
+                ("target",),
+            )
+        )
+        self.bytes_written = register(
+            Counter(
+                "scaffold_bytes_written_total",
+                "Uncompressed bytes written to disk or into archives.",
+                ("target",),
+            )
+        )
+
+    def add_gauge(
+        self, name: str, documentation: str, read: Callable[[], float]
+    ) -> None:
+        """Register a gauge read at scrape time."""
+        self.registry.register(Gauge(name, documentation, read))
+
+    def observe_outcome(
+        self, project_type: ProjectType, outcome: ScaffoldOutcome
+    ) -> None:
+        """Record a finished scaffold and the results of its modules."""
+        status = "success" if outcome.success else "failure"
+        self.scaffold_seconds.observe(outcome.elapsed, project_type=project_type.value)
+        self.scaffolds.inc(project_type=project_type.value, status=status)
+        for result in outcome.results:
+            self.observe_result(result)
+
+    def observe_error(self, project_type: ProjectType) -> None:
+        """Record a scaffold that raised instead of returning an outcome."""
+        self.scaffolds.inc(project_type=project_type.value, status="error")
+
+    def observe_result(self, result: ModuleResult) -> None:
+        """Record the timing, failure and write volume of one module result."""
+        data = result.data or {}
+        if data.get("skipped"):
+            return
+
+        self.module_seconds.observe(result.execution_time, module=result.module_name)
+        if not result.success:
+            self.module_errors.inc(module=result.module_name)
+            return
+
+        target = WRITE_TARGETS.get(result.module_name)
+        if target is not None:
+            self.files_written.inc(data.get("files", 0), target=target)
+            self.bytes_written.inc(data.get("bytes_written", 0), target=target)
+
+    def render(self) -> str:
+        """Return every metric in the text exposition format."""
+        return self.registry.render()
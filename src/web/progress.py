@@ -0,0 +1,73 @@
+"""Server-sent-event streams of job progress."""
+
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+
+from ..core.events import Event, Subscription
+
+MEDIA_TYPE = "text/event-stream"
+
+# Comment lines sent while a job is quiet so proxies keep the stream open
+KEEPALIVE_SECONDS = 15.0
+
+
+def format_message(
+    kind: str, data: Dict[str, Any], event_id: Optional[int] = None
+) -> str:
+    """Format one server-sent event.
+
+    Args:
+        kind: Event name clients listen for
+        data: JSON-serializable payload
+        event_id: Event id clients send back as Last-Event-ID when reconnecting
+
+    Returns:
+        The event in the text/event-stream format
+    """
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines.append(f"event: {kind}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def format_event(event: Event) -> str:
+    """Format a bus event as a server-sent event."""
+    return format_message(
+        event.kind,
+        {**event.data, "timestamp": event.timestamp},
+        event_id=event.sequence,
+    )
+
+
+async def server_sent_events(
+    subscription: Subscription, keepalive: float = KEEPALIVE_SECONDS
+) -> AsyncIterator[str]:
+    """Stream a subscription's events until its topic is closed.
+
+    Events the subscriber fell behind on are reported as a single
+    ``dropped`` event with their count; the stream ends with an ``end``
+    event. The subscription is released when the stream ends or the client
+    disconnects.
+
+    Args:
+        subscription: Subscription to stream
+        keepalive: Seconds of silence before a keepalive comment is sent
+
+    Yields:
+        Server-sent events
+    """
+    with subscription:
+        while True:
+            # Read before draining: every event published before the close
+            # is then part of this drain
+            closed = subscription.closed
+            events, dropped = subscription.drain()
+            if dropped:
+                yield format_message("dropped", {"count": dropped})
+            for event in events:
+                yield format_event(event)
+            if closed:
+                yield format_message("end", {})
+                return
+            if not await subscription.wait(keepalive):
+                yield ": keepalive\n\n"
@@ -0,0 +1,84 @@
+"""Fixtures shared by the pytest-benchmark suites.
+
+Every benchmark is marked slow; run them with, e.g.:
+
+    pytest tests/benchmarks --benchmark-autosave
+    pytest tests/benchmarks --benchmark-compare --benchmark-compare-fail=median:10%
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+TMPFS_TYPES = {"tmpfs", "ramfs"}
+
+
+def filesystem_type(path: Path) -> str:
+    """Return the filesystem type of the mount holding a path."""
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            mounts = [line.split() for line in f]
+    except OSError:
+        return "unknown"
+
+    resolved = str(path.resolve())
+    best, fs_type = "", "unknown"
+    for mount in mounts:
+        point = mount[1]
+        if resolved == point or resolved.startswith(point.rstrip("/") + "/"):
+            if len(point) > len(best):
+                best, fs_type = point, mount[2]
+    return fs_type
+
+
+def scratch_parent(target: str) -> Path:
+    """Return the directory benchmarks write to on a tmpfs or regular disk.
+
+    Args:
+        target: "tmpfs" or "disk"
+
+    Returns:
+        Directory on the requested kind of filesystem
+    """
+    if target == "tmpfs":
+        shm = Path("/dev/shm")
+        if not shm.is_dir() or filesystem_type(shm) not in TMPFS_TYPES:
+            pytest.skip("no tmpfs mounted at /dev/shm")
+        return shm
+
+    disk = Path(tempfile.gettempdir())
+    if filesystem_type(disk) in TMPFS_TYPES:
+        disk = PROJECT_ROOT / ".benchmarks"
+    return disk
+
+
+@pytest.fixture
+def isolated_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point HOME at an empty directory so no real global .env is touched."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    return home
+
+
+@pytest.fixture(params=["tmpfs", "disk"])
+def scratch_dir(request: pytest.FixtureRequest) -> Iterator[Path]:
+    """Yield an empty directory on a tmpfs or on regular disk."""
+    parent = scratch_parent(request.param)
+    parent.mkdir(parents=True, exist_ok=True)
+    path = Path(tempfile.mkdtemp(prefix="bench-", dir=parent))
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def scratch_fs_type(scratch_dir: Path) -> str:
+    """Return the filesystem type of the scratch directory."""
+    return filesystem_type(scratch_dir)
@@ -0,0 +1,135 @@
+"""Benchmarks of research provider requests against a local mock provider.
+
+``test_clients_per_call`` sends each request with a bare ``requests.post``,
+which opens a new connection (and TLS session) every time, while
+``test_clients_pooled`` reuses the keep-alive connections of a
+``ProviderClient``. ``test_clients_tail`` sends requests to a provider with
+a slow tail, with and without hedging, and ``test_clients_first_token``
+times the first token of an answer generated token by token.
+"""
+
+import random
+import time
+from typing import Any, Iterator, List
+
+import pytest
+import requests
+
+from scripts.mock_provider import MockProviderServer, tls_available
+from src.ai.clients import ClientConfig, ProviderClient, iter_sse
+
+pytestmark = pytest.mark.slow
+
+ROUNDS = 5
+# Sequential requests per round
+REQUESTS = 50
+PAYLOAD = {"messages": [{"role": "user", "content": "benchmark"}]}
+
+# Mock provider latency for the hedging benchmark: a small share of slow
+# answers, as seen from overloaded provider replicas
+TAIL_REQUESTS = 100
+TAIL_FAST_SECONDS = 0.005
+TAIL_SLOW_SECONDS = 0.25
+TAIL_SLOW_SHARE = 0.02
+
+# Mock provider answer for the time-to-first-token benchmark
+STREAM_TOKENS = 20
+STREAM_TOKEN_SECONDS = 0.01
+
+
+@pytest.fixture(params=["http", "https"])
+def server(request: pytest.FixtureRequest) -> Iterator[MockProviderServer]:
+    """Yield a running mock provider over plain HTTP or HTTPS."""
+    if request.param == "https" and not tls_available():
+        pytest.skip("openssl is not available")
+    with MockProviderServer(tls=request.param == "https") as server:
+        yield server
+
+
+def test_clients_per_call(benchmark: Any, server: MockProviderServer) -> None:
+    url = f"{server.url}/v1/messages"
+    verify = server.cert_file or True
+
+    def per_call() -> None:
+        for _ in range(REQUESTS):
+            requests.post(url, json=PAYLOAD, timeout=10, verify=verify)
+
+    benchmark.extra_info["requests"] = REQUESTS
+    benchmark.pedantic(per_call, rounds=ROUNDS, warmup_rounds=1)
+
+
+def test_clients_pooled(benchmark: Any, server: MockProviderServer) -> None:
+    client = ProviderClient(
+        "mock", ClientConfig(ca_bundle=server.cert_file), base_url=server.url
+    )
+
+    def pooled() -> None:
+        for _ in range(REQUESTS):
+            client.post("/v1/messages", json=PAYLOAD, timeout=10)
+
+    benchmark.extra_info.update(requests=REQUESTS, http2=client.http2)
+    try:
+        benchmark.pedantic(pooled, rounds=ROUNDS, warmup_rounds=1)
+    finally:
+        client.close()
+
+
+@pytest.mark.parametrize("hedge", [False, True], ids=["unhedged", "hedged"])
+def test_clients_tail(benchmark: Any, hedge: bool) -> None:
+    rng = random.Random(0)
+
+    def tail_latency() -> float:
+        slow = rng.random() < TAIL_SLOW_SHARE
+        return TAIL_SLOW_SECONDS if slow else TAIL_FAST_SECONDS
+
+    latencies: List[float] = []
+    with MockProviderServer(latency=tail_latency) as server:
+        client = ProviderClient("mock", ClientConfig(hedge=hedge), base_url=server.url)
+
+        def send_tail() -> None:
+            for _ in range(TAIL_REQUESTS):
+                started = time.perf_counter()
+                client.post("/v1/messages", json=PAYLOAD, timeout=10)
+                latencies.append(time.perf_counter() - started)
+
+        try:
+            benchmark.pedantic(send_tail, rounds=ROUNDS, warmup_rounds=1)
+        finally:
+            client.close()
+
+    latencies.sort()
+    benchmark.extra_info.update(
+        requests=TAIL_REQUESTS,
+        p50_ms=latencies[len(latencies) // 2] * 1000,
+        p99_ms=latencies[int(len(latencies) * 0.99)] * 1000,
+        hedges=client.hedges,
+        sent=server.requests,
+    )
+
+
+@pytest.mark.parametrize("streaming", [False, True], ids=["blocking", "streaming"])
+def test_clients_first_token(benchmark: Any, streaming: bool) -> None:
+    with MockProviderServer(
+        tokens=STREAM_TOKENS, token_interval=STREAM_TOKEN_SECONDS
+    ) as server:
+        client = ProviderClient("mock", base_url=server.url)
+
+        def first_token_blocking() -> None:
+            client.post("/v1/messages", json=PAYLOAD, timeout=10).json()
+
+        def first_token_streaming() -> None:
+            streamed = dict(PAYLOAD, stream=True)
+            with client.stream("/v1/messages", json=streamed, timeout=10) as response:
+                for event, _ in iter_sse(response):
+                    if event == "content_block_delta":
+                        break
+
+        benchmark.extra_info["tokens"] = STREAM_TOKENS
+        try:
+            benchmark.pedantic(
+                first_token_streaming if streaming else first_token_blocking,
+                rounds=ROUNDS,
+                warmup_rounds=1,
+            )
+        finally:
+            client.close()
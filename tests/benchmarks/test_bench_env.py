@@ -0,0 +1,100 @@
+"""Benchmarks of saving, setting and looking up keys in large .env files.
+
+``test_env_save`` rewrites the file before every round, so it includes the
+parse of a changed file. The other benchmarks run against an unchanged file
+and measure the cached path; ``test_env_transaction`` sets the same keys as
+``test_env_set`` in one batched, atomic write.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+
+import pytest
+
+from src.core.env_manager import EnvManager
+
+pytestmark = [pytest.mark.slow, pytest.mark.parametrize("size", [100, 1_000, 10_000])]
+
+ROUNDS = 5
+# Keys set one at a time, and looked up, per round
+SET_KEYS = 100
+LOOKUPS = 10_000
+
+
+def write_env_file(path: Path, entries: int) -> None:
+    """Write a global .env file with the given number of entries."""
+    lines = ["# Benchmark environment\n"]
+    lines.extend(
+        f"BENCH_KEY_{i:06d}=value_{i:06d}_{'x' * 32}\n" for i in range(entries)
+    )
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+@pytest.fixture
+def manager(tmp_path: Path, size: int) -> Iterator[EnvManager]:
+    """Yield a manager of a global .env with ``size`` entries."""
+    manager = EnvManager(base_dir=tmp_path)
+    write_env_file(manager.env_file, size)
+    yield manager
+    # set_env_value also exports the keys it sets
+    for key in [key for key in os.environ if key.startswith("BENCH_")]:
+        del os.environ[key]
+
+
+def test_env_save(benchmark: Any, manager: EnvManager, size: int) -> None:
+    updates = {f"BENCH_KEY_{i:06d}": "updated" for i in range(0, size, 10)}
+    updates["BENCH_NEW_KEY"] = "new"
+
+    def rewrite() -> Tuple[Tuple[Dict[str, str]], Dict[str, Any]]:
+        write_env_file(manager.env_file, size)
+        return (updates,), {}
+
+    benchmark.pedantic(
+        manager.save_global_env, setup=rewrite, rounds=ROUNDS, warmup_rounds=1
+    )
+    assert manager.get_env_value("BENCH_NEW_KEY") == "new"
+
+
+def test_env_set(benchmark: Any, manager: EnvManager) -> None:
+    keys = [f"BENCH_SET_{i:04d}" for i in range(SET_KEYS)]
+
+    def set_values() -> None:
+        for key in keys:
+            manager.set_env_value(key, "set")
+
+    benchmark.pedantic(set_values, rounds=ROUNDS, warmup_rounds=1)
+    assert manager.get_env_value(keys[-1]) == "set"
+
+
+def test_env_transaction(benchmark: Any, manager: EnvManager) -> None:
+    keys = [f"BENCH_SET_{i:04d}" for i in range(SET_KEYS)]
+
+    def set_in_transaction() -> None:
+        with manager.transaction() as transaction:
+            for key in keys:
+                transaction.set(key, "batched")
+
+    benchmark.pedantic(set_in_transaction, rounds=ROUNDS, warmup_rounds=1)
+    assert manager.get_env_value(keys[-1]) == "batched"
+
+
+def test_env_lookup(benchmark: Any, manager: EnvManager, size: int) -> None:
+    keys = [f"BENCH_KEY_{i % size:06d}" for i in range(LOOKUPS)]
+
+    def look_up() -> None:
+        for key in keys:
+            manager.get_env_value(key)
+
+    benchmark(look_up)
+
+
+def test_env_snapshot_lookup(benchmark: Any, manager: EnvManager, size: int) -> None:
+    keys = [f"BENCH_KEY_{i % size:06d}" for i in range(LOOKUPS)]
+    snapshot = manager.snapshot()
+
+    def look_up() -> None:
+        for key in keys:
+            snapshot.get(key)
+
+    benchmark(look_up)
@@ -0,0 +1,44 @@
+"""Benchmarks of the full scaffolding pipeline for every project type."""
+
+import itertools
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import pytest
+
+from src.core.core_types import ExecutionContext, ProjectType
+from src.modules import create_modules
+from src.scaffold import scaffold
+
+pytestmark = pytest.mark.slow
+
+ROUNDS = 5
+
+
+@pytest.mark.parametrize("project_type", list(ProjectType), ids=lambda t: t.value)
+def test_scaffold(
+    benchmark: Any,
+    isolated_home: Path,
+    scratch_dir: Path,
+    scratch_fs_type: str,
+    project_type: ProjectType,
+) -> None:
+    counter = itertools.count()
+
+    def new_context() -> Tuple[Tuple[ExecutionContext], Dict[str, Any]]:
+        context = ExecutionContext(
+            project_name=f"project-{next(counter)}",
+            project_type=project_type,
+            output_path=scratch_dir,
+        )
+        return (context,), {}
+
+    benchmark.group = f"scaffold-{scratch_fs_type}"
+    benchmark.extra_info["filesystem"] = scratch_fs_type
+    outcome = benchmark.pedantic(
+        scaffold, setup=new_context, rounds=ROUNDS, warmup_rounds=1
+    )
+    assert outcome.success, outcome.message
+    # Every registered module ran, then the plan was written
+    ran = {result.module_name for result in outcome.results}
+    assert ran == {module.name for module in create_modules()} | {"write_plan"}
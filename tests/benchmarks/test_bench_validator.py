@@ -0,0 +1,71 @@
+"""Benchmarks of ConsistencyValidator.validate_all on synthetic source trees."""
+
+import contextlib
+import io
+from pathlib import Path
+from typing import Any, Tuple
+
+import pytest
+
+from scripts.validate_consistency import ConsistencyValidator
+
+pytestmark = pytest.mark.slow
+
+ROUNDS = 3
+
+# Synthetic tree layout: (directory, file name pattern, content)
+_TREE_FILES: Tuple[Tuple[str, str, str], ...] = (
+    (
+        "src/components",
+        "Component{index}.tsx",
+        "export const Component{index} = () => null;\n",
+    ),
+    (
+        "src/utils",
+        "helper{index}.ts",
+        "export function helper{index}(): number {{\n  return {index};\n}}\n",
+    ),
+    (
+        "src/api",
+        "endpoint_{index}.py",
+        '"""Endpoint {index}."""\n\n\ndef handler_{index}() -> int:\n'
+        '    """Handle the request."""\n    return {index}\n',
+    ),
+    (
+        "src/services",
+        "service_{index}.py",
+        '"""Service {index}."""\n\n\ndef run_{index}() -> None:\n'
+        '    """Run the service."""\n    pass\n',
+    ),
+)
+
+
+def build_tree(root: Path, files: int) -> None:
+    """Create a synthetic project tree with the given number of source files."""
+    for directory in ("tests", "docs", "config", ".cursor"):
+        (root / directory).mkdir(parents=True, exist_ok=True)
+    for name in ("README.md", ".gitignore", ".env.example", "requirements.txt"):
+        (root / name).write_text("\n", encoding="utf-8")
+
+    per_dir = 500
+    for index in range(files):
+        directory, pattern, content = _TREE_FILES[index % len(_TREE_FILES)]
+        target = root / directory / f"batch{index // per_dir:04d}"
+        target.mkdir(parents=True, exist_ok=True)
+        (target / pattern.format(index=index)).write_text(
+            content.format(index=index), encoding="utf-8"
+        )
+
+
+@pytest.mark.parametrize("size", [1_000, 10_000, 100_000])
+def test_validate_all(benchmark: Any, tmp_path: Path, size: int) -> None:
+    build_tree(tmp_path, size)
+
+    def validate() -> None:
+        validator = ConsistencyValidator()
+        validator.project_root = tmp_path
+        with contextlib.redirect_stdout(io.StringIO()):
+            validator.validate_all()
+
+    benchmark.extra_info["files"] = size
+    benchmark.pedantic(validate, rounds=ROUNDS, warmup_rounds=1)
@@ -0,0 +1,127 @@
+"""Tests for the global scaffold cap shared by jobs and archive requests."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.core.core_types import ExecutionContext, ProjectType
+from src.web.admission import Admission, ConcurrencyLimiter, OverloadedError
+from src.web.app import create_app
+from src.web.jobs import JobManager, JobStatus
+
+
+def test_release_hands_slots_to_waiters_in_order() -> None:
+    limiter = ConcurrencyLimiter(1, queue_size=0, timeout=1)
+    limiter.acquire()
+    order: List[int] = []
+
+    def work(index: int) -> None:
+        limiter.acquire()
+        order.append(index)
+        limiter.release()
+
+    threads = []
+    for index in range(3):
+        thread = threading.Thread(target=work, args=(index,))
+        thread.start()
+        threads.append(thread)
+        while limiter.waiting <= index:
+            time.sleep(0.001)
+
+    limiter.release()
+    for thread in threads:
+        thread.join()
+    assert order == [0, 1, 2]
+    assert limiter.active == 0
+    assert limiter.waiting == 0
+
+
+def test_async_waiters_are_bounded_and_time_out() -> None:
+    limiter = ConcurrencyLimiter(1, queue_size=1, timeout=0.05)
+
+    async def scenario() -> None:
+        await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+
+        with pytest.raises(OverloadedError):
+            await limiter.acquire_async()
+        with pytest.raises(OverloadedError):
+            await waiter
+        assert limiter.waiting == 0
+        limiter.release()
+
+    asyncio.run(scenario())
+    assert limiter.active == 0
+
+
+def test_async_wait_needs_no_thread() -> None:
+    limiter = ConcurrencyLimiter(1, queue_size=8, timeout=5)
+    limiter.acquire()
+
+    async def scenario() -> None:
+        threads = threading.active_count()
+        waiters = [asyncio.ensure_future(limiter.acquire_async()) for _ in range(8)]
+        await asyncio.sleep(0.01)
+        assert limiter.waiting == 8
+        assert threading.active_count() == threads
+
+        for _ in waiters:
+            threading.Thread(target=limiter.release).start()
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        await asyncio.gather(*waiters)
+
+    asyncio.run(scenario())
+    assert limiter.active == 1
+
+
+def test_cancelled_waiter_gives_slot_back() -> None:
+    limiter = ConcurrencyLimiter(1, queue_size=1, timeout=5)
+
+    async def scenario() -> None:
+        await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+
+    asyncio.run(scenario())
+    assert limiter.active == 0
+    assert limiter.waiting == 0
+
+
+def test_jobs_wait_for_a_shared_slot(tmp_path: Path) -> None:
+    limiter = ConcurrencyLimiter(1, queue_size=0, timeout=1)
+    jobs = JobManager(tmp_path, workers=2, concurrency=limiter)
+    limiter.acquire()
+    try:
+        job = jobs.submit(ExecutionContext("app", ProjectType.REACT_SPA))
+        while limiter.waiting == 0:
+            time.sleep(0.001)
+        assert job.status == JobStatus.QUEUED
+    finally:
+        limiter.release()
+    jobs.shutdown()
+    finished = jobs.get(job.id)
+    assert finished is not None and finished.status == JobStatus.SUCCEEDED
+    assert limiter.active == 0
+
+
+def test_app_shares_one_limiter_between_jobs_and_admission(tmp_path: Path) -> None:
+    admission = Admission()
+    create_app(admission=admission)
+
+    jobs = JobManager(tmp_path)
+    try:
+        with pytest.raises(ValueError):
+            create_app(jobs=jobs, admission=admission)
+        create_app(jobs=jobs)
+    finally:
+        jobs.shutdown()
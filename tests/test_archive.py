@@ -0,0 +1,137 @@
+"""Tests for streaming write plans into tar, tar.gz and zip archives."""
+
+import io
+import os
+import subprocess
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from src.core.archive import WritableStream, stream_archive, write_archive
+from src.core.write_plan import WritePlan
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class PipeSink:
+    """Write-only, unseekable sink, like stdout piped to another process."""
+
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+
+    def write(self, data: bytes, /) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def getvalue(self) -> bytes:
+        return b"".join(self.chunks)
+
+
+@pytest.fixture
+def plan(tmp_path: Path) -> WritePlan:
+    source = tmp_path / "logo.svg"
+    source.write_bytes(b"<svg/>")
+    plan = WritePlan()
+    plan.mkdir("public/empty")
+    plan.write_text("README.md", "# Demo\n")
+    plan.write_chunks("src/index.ts", [b"export ", b"{}\n"])
+    plan.copy_file("public/logo.svg", source)
+    return plan
+
+
+EXPECTED_FILES = {
+    "demo/README.md": b"# Demo\n",
+    "demo/src/index.ts": b"export {}\n",
+    "demo/public/logo.svg": b"<svg/>",
+}
+
+
+def read_back(data: bytes, archive_format: str) -> Dict[str, bytes]:
+    files = {}
+    if archive_format == "zip":
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert "demo/public/empty/" in archive.namelist()
+            for name in archive.namelist():
+                if not name.endswith("/"):
+                    files[name] = archive.read(name)
+        return files
+
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:*") as archive:
+        assert archive.getmember("demo/public/empty").isdir()
+        for member in archive.getmembers():
+            extracted = archive.extractfile(member) if member.isfile() else None
+            if extracted is not None:
+                files[member.name] = extracted.read()
+    return files
+
+
+@pytest.mark.parametrize("archive_format", ["tar", "tar.gz", "zip"])
+def test_write_archive_to_unseekable_stream(
+    plan: WritePlan, archive_format: str
+) -> None:
+    sink = PipeSink()
+    stats = write_archive(plan, sink, archive_format, prefix="demo")
+
+    assert read_back(sink.getvalue(), archive_format) == EXPECTED_FILES
+    assert stats.files == 3
+    assert stats.bytes_written == sum(len(data) for data in EXPECTED_FILES.values())
+
+
+@pytest.mark.parametrize("archive_format", ["tar", "tar.gz", "zip"])
+def test_stream_archive_yields_whole_archive(
+    plan: WritePlan, archive_format: str
+) -> None:
+    def produce(stream: WritableStream) -> None:
+        write_archive(plan, stream, archive_format, prefix="demo")
+
+    data = b"".join(stream_archive(produce, max_chunks=2, chunk_size=64))
+    assert read_back(data, archive_format) == EXPECTED_FILES
+
+
+def test_stream_archive_reraises_producer_error() -> None:
+    def produce(stream: WritableStream) -> None:
+        stream.write(b"partial")
+        raise RuntimeError("disk on fire")
+
+    chunks = stream_archive(produce, chunk_size=4)
+    with pytest.raises(RuntimeError, match="disk on fire"):
+        list(chunks)
+
+
+def test_unknown_format_is_rejected(plan: WritePlan) -> None:
+    with pytest.raises(ValueError):
+        write_archive(plan, PipeSink(), "rar")
+
+
+def test_cli_archive_on_stdout_keeps_profile_off_it(tmp_path: Path) -> None:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "src.main",
+            "demo",
+            "--type",
+            "react-spa",
+            "--archive",
+            "-",
+            "--profile",
+        ],
+        cwd=tmp_path,
+        env={**os.environ, "HOME": str(tmp_path), "PYTHONPATH": str(PROJECT_ROOT)},
+        capture_output=True,
+        timeout=120,
+        check=True,
+    )
+    with tarfile.open(fileobj=io.BytesIO(completed.stdout), mode="r:gz") as archive:
+        assert "demo/package.json" in archive.getnames()
+    assert b"total ms" in completed.stderr
@@ -0,0 +1,41 @@
+"""Tests for manifest loading and batch scaffolding on a process pool."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.batch import load_manifest, run_batch
+from src.core.skeleton_cache import SkeletonCache
+
+
+def write_manifest(path: Path, *names: str) -> Path:
+    projects = [
+        {"name": name, "type": "react-spa", "skip_install": True} for name in names
+    ]
+    path.write_text(json.dumps({"projects": projects}))
+    return path
+
+
+def test_duplicate_project_names_are_rejected(tmp_path: Path) -> None:
+    manifest = write_manifest(tmp_path / "projects.json", "web", "api", "web")
+    contexts = load_manifest(manifest, tmp_path / "out")
+    with pytest.raises(ValueError, match="duplicate project names: web"):
+        run_batch(contexts, workers=2)
+    assert not (tmp_path / "out").exists()
+
+
+def test_workers_share_the_skeleton_cache(tmp_path: Path) -> None:
+    manifest = write_manifest(tmp_path / "projects.json", "one", "two", "three")
+    contexts = load_manifest(manifest, tmp_path / "out")
+    cache = SkeletonCache(tmp_path / "skeletons")
+
+    report = run_batch(contexts, workers=2, skeleton_cache=cache)
+    assert [outcome.project_name for outcome in report.outcomes] == [
+        "one",
+        "two",
+        "three",
+    ]
+    assert report.failed == 0
+    assert all((tmp_path / "out" / name).is_dir() for name in ("one", "two", "three"))
+    assert any(cache.cache_dir.iterdir())
@@ -0,0 +1,75 @@
+"""Tests for the provider client helpers: SSE parsing, Retry-After, latencies."""
+
+import email.utils
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import pytest
+
+from src.ai.clients import LatencyTracker, iter_sse, retry_after_seconds
+
+
+class FakeResponse:
+    def __init__(
+        self,
+        lines: Sequence[Union[str, bytes]] = (),
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.lines = list(lines)
+        self.headers = headers or {}
+
+    def iter_lines(self) -> List[Union[str, bytes]]:
+        return self.lines
+
+
+def events(*lines: Union[str, bytes]) -> List[Tuple[str, str]]:
+    return list(iter_sse(FakeResponse(list(lines))))
+
+
+def test_sse_events_are_split_on_blank_lines() -> None:
+    assert events("data: one", "", "data: two", "") == [
+        ("message", "one"),
+        ("message", "two"),
+    ]
+
+
+def test_sse_named_events_and_multiline_data() -> None:
+    assert events(
+        b"event: content_block_delta",
+        b'data: {"a":',
+        b"data:1}",
+        b"",
+        b"data: tail",
+    ) == [("content_block_delta", '{"a":\n1}'), ("message", "tail")]
+
+
+def test_sse_comments_and_empty_events_are_skipped() -> None:
+    assert events(": keep-alive", "", "event: ping", "", "id: 3", "data:  x", "") == [
+        ("message", " x")
+    ]
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [(None, None), ("", None), ("2.5", 2.5), ("-1", 0.0), ("soon", None)],
+)
+def test_retry_after_seconds(header: Optional[str], expected: Optional[float]) -> None:
+    headers = {} if header is None else {"Retry-After": header}
+    assert retry_after_seconds(FakeResponse(headers=headers)) == expected
+
+
+def test_retry_after_http_date() -> None:
+    header = email.utils.formatdate(time.time() + 30, usegmt=True)
+    wait = retry_after_seconds(FakeResponse(headers={"Retry-After": header}))
+    assert wait is not None and 25 < wait <= 30
+
+
+def test_latency_quantile_over_sliding_window() -> None:
+    tracker = LatencyTracker(window=4)
+    assert tracker.quantile(0.5) is None
+    for seconds in (10.0, 1.0, 2.0, 3.0, 4.0):
+        tracker.record(seconds)
+    assert len(tracker) == 4
+    assert tracker.quantile(0.0) == 1.0
+    assert tracker.quantile(0.5) == 3.0
+    assert tracker.quantile(1.0) == 4.0
@@ -0,0 +1,129 @@
+"""Tests for the global .env cache, atomic writes, transactions and layers."""
+
+import os
+import stat
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+import pytest
+
+from src.core.env_manager import (
+    EnvFileCache,
+    EnvManager,
+    apply_changes,
+    write_text_atomic,
+)
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> EnvManager:
+    for key in ("API_URL", "TOKEN", "LEVEL"):
+        monkeypatch.delenv(key, raising=False)
+    return EnvManager(tmp_path / "global")
+
+
+def test_apply_changes_keeps_comments_and_order() -> None:
+    text = "# header\nA=1\n\nB=2\nA=dup\nC=3"
+    updated = apply_changes(text, {"A": "10", "C": None, "D": "4"})
+    assert updated == "# header\nA=10\n\nB=2\nD=4\n"
+
+
+def test_write_text_atomic_keeps_mode_of_existing_file(tmp_path: Path) -> None:
+    path = tmp_path / ".env"
+    write_text_atomic(path, "A=1\n")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    path.chmod(0o640)
+    write_text_atomic(path, "A=2\n")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+    assert path.read_text() == "A=2\n"
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]
+
+
+def test_cache_reparses_only_changed_files(tmp_path: Path) -> None:
+    path = tmp_path / ".env"
+    path.write_text("A=1\n")
+    cache = EnvFileCache()
+    first = cache.get(path)
+    assert first is not None and first.values == {"A": "1"}
+    assert cache.get(path) is first
+
+    path.write_text("A=22\n")
+    # Trusted without a stat while fresh, re-parsed once checked again
+    assert cache.get(path, max_age=60) is first
+    second = cache.get(path)
+    assert second is not None and second.values == {"A": "22"}
+
+    path.unlink()
+    assert cache.get(path) is None
+
+
+def test_set_env_values_writes_once(
+    manager: EnvManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager.save_global_env({"LEVEL": "debug"})
+    writes: List[Dict[str, Optional[str]]] = []
+    apply = manager._apply_changes
+
+    def record(changes: Mapping[str, Optional[str]]) -> None:
+        writes.append(dict(changes))
+        apply(changes)
+
+    monkeypatch.setattr(manager, "_apply_changes", record)
+
+    manager.set_env_values({"API_URL": "https://example.com", "TOKEN": "secret"})
+    assert writes == [{"API_URL": "https://example.com", "TOKEN": "secret"}]
+    assert manager.env_file.read_text() == (
+        "LEVEL=debug\nAPI_URL=https://example.com\nTOKEN=secret\n"
+    )
+    assert os.environ["TOKEN"] == "secret"
+    assert manager.get_env_value("LEVEL") == "debug"
+
+
+def test_transaction_commits_on_exit_and_discards_on_error(
+    manager: EnvManager,
+) -> None:
+    manager.save_global_env({"API_URL": "a", "TOKEN": "t"})
+    with manager.transaction() as env:
+        env.set("API_URL", "b")
+        env.unset("TOKEN")
+        assert env.get("API_URL") == "b"
+        assert env.get("TOKEN") is None
+        assert manager.global_env()["API_URL"] == "a"
+    assert manager.global_env() == {"API_URL": "b"}
+
+    with pytest.raises(RuntimeError):
+        with manager.transaction() as env:
+            env.set("API_URL", "c")
+            raise RuntimeError
+    assert manager.env_file.read_text() == "API_URL=b\n"
+
+
+def test_snapshot_layers_by_precedence(
+    manager: EnvManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager.save_global_env({"API_URL": "global", "TOKEN": "global", "LEVEL": "g"})
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / ".env").write_text("API_URL=project\nTOKEN=project\n")
+    (project / ".env.development").write_text("TOKEN=development\n")
+    monkeypatch.setenv("API_URL", "process")
+
+    snapshot = manager.snapshot(project, "development")
+    assert dict(snapshot) == {
+        **os.environ,
+        "API_URL": "process",
+        "TOKEN": "project",
+        "LEVEL": "g",
+    }
+    assert snapshot.source("TOKEN") == manager.layers(project, "development")[1]
+    assert [layer.name for layer, _ in snapshot.definitions("TOKEN")] == [
+        "project",
+        "development",
+        "global",
+    ]
+    assert not snapshot.is_stale()
+
+    (project / ".env").write_text("TOKEN=changed\n")
+    assert snapshot.is_stale()
+    assert snapshot.refresh()["TOKEN"] == "changed"
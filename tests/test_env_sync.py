@@ -0,0 +1,90 @@
+"""Tests for pushing the global .env to generated projects."""
+
+from pathlib import Path
+
+import pytest
+
+from src.core.env_manager import EnvManager
+from src.core.env_sync import EnvSync, find_projects
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> EnvManager:
+    manager = EnvManager(tmp_path / "global")
+    manager.save_global_env({"API_KEY": "new", "TOKEN": "secret"})
+    return manager
+
+
+def test_updates_existing_env_and_keeps_project_keys(
+    manager: EnvManager, tmp_path: Path
+) -> None:
+    project = tmp_path / "projects" / "app"
+    project.mkdir(parents=True)
+    (project / ".env").write_text("# app\nAPI_KEY=old\nLOCAL=1\n")
+    (project / ".env.example").write_text("API_KEY=your_api_key_here\n")
+
+    result = EnvSync(manager).sync_project(project)
+
+    assert result.error is None
+    assert result.changed == {".env": ["API_KEY", "TOKEN"], ".env.example": ["TOKEN"]}
+    assert result.created == []
+    assert (project / ".env").read_text() == (
+        "# app\nAPI_KEY=new\nLOCAL=1\nTOKEN=secret\n"
+    )
+    assert (project / ".env.example").read_text() == (
+        "API_KEY=your_api_key_here\nTOKEN=your_token_here\n"
+    )
+
+
+def test_does_not_create_env_in_projects_without_one(
+    manager: EnvManager, tmp_path: Path
+) -> None:
+    project = tmp_path / "app"
+    project.mkdir()
+    (project / ".env.example").write_text("OTHER=your_other_here\n")
+
+    result = EnvSync(manager).sync_project(project)
+
+    assert not (project / ".env").exists()
+    assert list(result.changed) == [".env.example"]
+
+
+def test_creates_missing_example(manager: EnvManager, tmp_path: Path) -> None:
+    project = tmp_path / "app"
+    project.mkdir()
+
+    result = EnvSync(manager).sync_project(project)
+
+    assert result.created == [".env.example"]
+    assert (project / ".env.example").read_text() == (
+        "API_KEY=your_api_key_here\nTOKEN=your_token_here\n"
+    )
+    assert not (project / ".env").exists()
+
+
+def test_dry_run_reports_without_writing(manager: EnvManager, tmp_path: Path) -> None:
+    root = tmp_path / "projects"
+    for name in ("a", "b"):
+        (root / name).mkdir(parents=True)
+        (root / name / ".env").write_text("API_KEY=old\n")
+    (root / "not-a-project").mkdir()
+
+    projects = find_projects(root)
+    report = EnvSync(manager, dry_run=True).run(projects, workers=2)
+
+    assert projects == [root / "a", root / "b"]
+    assert report.changed == 2
+    assert report.files_written == 4
+    assert (root / "a" / ".env").read_text() == "API_KEY=old\n"
+    assert not (root / "a" / ".env.example").exists()
+
+
+def test_missing_project_is_reported(manager: EnvManager, tmp_path: Path) -> None:
+    report = EnvSync(manager).run([tmp_path / "missing"])
+    assert report.failed == 1
+    assert report.projects[0].error is not None
+
+
+def test_requires_global_env(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        EnvSync(EnvManager(tmp_path / "empty"))
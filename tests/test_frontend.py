@@ -0,0 +1,71 @@
+"""Tests for the in-memory frontend asset cache headers and encodings."""
+
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+pytest.importorskip("starlette")
+
+from src.web.frontend import (  # noqa: E402
+    IMMUTABLE_CACHE,
+    REVALIDATE_CACHE,
+    Asset,
+    Variant,
+    choose_encoding,
+    load_asset,
+)
+
+
+@pytest.mark.parametrize(
+    "name, cache_control",
+    [
+        ("assets/index-3f9a1c2b.js", IMMUTABLE_CACHE),
+        ("assets/vendor-0123456789abcdef.css", IMMUTABLE_CACHE),
+        ("index.html", REVALIDATE_CACHE),
+        ("favicon.ico", REVALIDATE_CACHE),
+        ("logo.v12345678.png", REVALIDATE_CACHE),
+        ("assets/index-BhqmGq0p.js", REVALIDATE_CACHE),
+        ("robots-policy.txt", REVALIDATE_CACHE),
+    ],
+)
+def test_only_content_hashed_names_are_immutable(
+    tmp_path: Path, name: str, cache_control: str
+) -> None:
+    path = tmp_path / Path(name).name
+    path.write_bytes(b"body")
+    assert load_asset(path, name).cache_control == cache_control
+
+
+@pytest.fixture
+def asset() -> Asset:
+    asset = Asset(
+        path=Path("app.js"), content_type="application/javascript", cache_control=""
+    )
+    for encoding in ("identity", "gzip", "br"):
+        asset.variants[encoding] = Variant(body=b"", etag=f'"{encoding}"')
+    return asset
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, "identity"),
+        ("gzip, deflate, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0.1, gzip;q=0.8", "gzip"),
+        ("gzip;q=0.5, identity", "identity"),
+        ("br;q=0, *;q=0.3", "gzip"),
+        ("gzip;q=0, br;q=0", "identity"),
+        ("*", "br"),
+    ],
+)
+def test_choose_encoding_prefers_highest_quality(
+    asset: Asset, header: Optional[str], expected: str
+) -> None:
+    assert choose_encoding(asset, header) == expected
+
+
+def test_choose_encoding_skips_missing_variants(asset: Asset) -> None:
+    del asset.variants["br"]
+    assert choose_encoding(asset, "br;q=1, gzip;q=0.2") == "gzip"
@@ -0,0 +1,133 @@
+"""CLI startup import-time budget.
+
+Imports the CLI entry point under ``python -X importtime`` in a fresh
+interpreter and checks the cumulative import time against the budget, and
+that no module only the web server or batch mode needs is imported at
+startup.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+MODULE = "src.main"
+BUDGET_MS = 100.0
+# Imports measured; the fastest is compared with the budget
+RUNS = 5
+
+# Top-level packages the scaffolding CLI must never import at startup
+FORBIDDEN_PACKAGES = (
+    "fastapi",
+    "starlette",
+    "pydantic",
+    "uvicorn",
+    "httpx",
+    "requests",
+    "multiprocessing",
+    "tarfile",
+)
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def measure(module: str) -> List[ImportRecord]:
+    """Import a module in a fresh interpreter and parse its import times."""
+    env = dict(os.environ)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert completed.returncode == 0, f"Importing {module} failed:\n{completed.stderr}"
+
+    records = []
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            records.append(
+                ImportRecord(
+                    module=match.group(4),
+                    self_us=int(match.group(1)),
+                    cumulative_us=int(match.group(2)),
+                    depth=len(match.group(3)) // 2,
+                )
+            )
+    return records
+
+
+def module_time_ms(records: Sequence[ImportRecord], module: str) -> float:
+    """Return the cumulative import time of a module in milliseconds."""
+    for record in records:
+        if record.module == module and record.depth == 0:
+            return record.cumulative_us / 1000
+    raise AssertionError(f"{module} does not appear in the import time output")
+
+
+def imported_by(records: Sequence[ImportRecord], module: str) -> List[str]:
+    """Return the modules imported on behalf of a module.
+
+    Packages the interpreter loads at startup (e.g. from site-packages
+    ``.pth`` files) are not included.
+    """
+    # Children are printed before their parent, so everything between the
+    # previous top-level entry and the module's own entry belongs to it
+    start = 0
+    for index, record in enumerate(records):
+        if record.depth == 0 and record.module != module:
+            start = index + 1
+        elif record.depth == 0:
+            return [child.module for child in records[start:index]]
+    return []
+
+
+def slowest(records: Sequence[ImportRecord], count: int = 10) -> str:
+    """Return the imports with the highest self time, one per line."""
+    ranked = sorted(records, key=lambda record: record.self_us, reverse=True)
+    return "\n".join(
+        f"  {record.self_us / 1000:8.2f}ms  {record.module}"
+        for record in ranked[:count]
+    )
+
+
+@pytest.fixture(scope="module")
+def fastest_import() -> List[ImportRecord]:
+    """Return the import records of the fastest of RUNS imports."""
+    runs = [measure(MODULE) for _ in range(RUNS)]
+    return min(runs, key=lambda records: module_time_ms(records, MODULE))
+
+
+def test_cli_import_within_budget(fastest_import: List[ImportRecord]) -> None:
+    elapsed_ms = module_time_ms(fastest_import, MODULE)
+    assert elapsed_ms <= BUDGET_MS, (
+        f"import {MODULE} took {elapsed_ms:.1f}ms (budget {BUDGET_MS:g}ms); "
+        f"slowest imports:\n{slowest(fastest_import)}"
+    )
+
+
+def test_cli_does_not_import_server_packages(
+    fastest_import: List[ImportRecord],
+) -> None:
+    packages = {module.split(".")[0] for module in imported_by(fastest_import, MODULE)}
+    assert not packages & set(FORBIDDEN_PACKAGES)
@@ -0,0 +1,128 @@
+"""Tests for deadlines and retries around module execution and plan flushes."""
+
+import errno
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.core import policy
+from src.core.core_types import ExecutionContext, ProjectType
+from src.core.policy import (
+    DeadlineExceeded,
+    ExecutionPolicy,
+    call_with_deadline,
+    is_transient,
+)
+from src.scaffold import flush_plan
+
+
+def test_call_returns_value_or_raises_error() -> None:
+    assert call_with_deadline(lambda: 42, timeout=1) == 42
+
+    def fail() -> int:
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        call_with_deadline(fail, timeout=1)
+
+
+def test_overrunning_call_is_cancelled_and_stops() -> None:
+    cancel = threading.Event()
+    stopped = threading.Event()
+
+    def work() -> None:
+        while not cancel.wait(0.01):
+            pass
+        stopped.set()
+
+    with pytest.raises(DeadlineExceeded) as raised:
+        call_with_deadline(work, timeout=0.05, cancel=cancel)
+    assert raised.value.stopped
+    assert stopped.is_set()
+
+
+def test_call_ignoring_cancel_is_abandoned(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(policy, "CANCEL_GRACE_SECONDS", 0.01)
+    release = threading.Event()
+    try:
+        with pytest.raises(DeadlineExceeded) as raised:
+            call_with_deadline(release.wait, timeout=0.01, cancel=threading.Event())
+        assert not raised.value.stopped
+    finally:
+        release.set()
+
+
+def test_only_transient_os_errors_are_retryable() -> None:
+    assert is_transient(OSError(errno.EAGAIN, "busy"))
+    assert not is_transient(OSError(errno.ENOENT, "missing"))
+    assert not is_transient(ValueError("bad"))
+    assert not is_transient(DeadlineExceeded("late"))
+
+
+def test_transient_failures_are_retried_with_backoff(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: List[float] = []
+    monkeypatch.setattr(policy, "time", SimpleNamespace(sleep=sleeps.append))
+    attempts: List[int] = []
+
+    def flaky() -> str:
+        attempts.append(len(attempts) + 1)
+        if len(attempts) < 3:
+            raise OSError(errno.EIO, "I/O error")
+        return "ok"
+
+    events: List[Dict[str, Any]] = []
+    run_policy = ExecutionPolicy(retry_attempts=3, backoff_seconds=0.1)
+    assert run_policy.run("flush", flaky, lambda result: None, events) == "ok"
+    assert attempts == [1, 2, 3]
+    assert sleeps == [0.1, 0.2]
+    assert [event["event"] for event in events] == ["retry", "retry"]
+
+
+def test_failed_results_are_returned_after_the_last_attempt() -> None:
+    error = OSError(errno.EBUSY, "busy")
+    events: List[Dict[str, Any]] = []
+    run_policy = ExecutionPolicy(retry_attempts=2, backoff_seconds=0)
+
+    def failed(result: Optional[OSError]) -> Optional[BaseException]:
+        return result
+
+    assert run_policy.run("module", lambda: error, failed, events) is error
+    assert len(events) == 1
+
+
+def test_timeouts_are_not_retried() -> None:
+    events: List[Dict[str, Any]] = []
+    run_policy = ExecutionPolicy(timeout_seconds=0.01, retry_attempts=3)
+    with pytest.raises(DeadlineExceeded):
+        run_policy.run("module", lambda: time.sleep(0.2), lambda _: None, events)
+    assert events == [{"event": "timeout", "attempt": 1, "timeout_seconds": 0.01}]
+
+
+def plan_context(root: Path) -> ExecutionContext:
+    context = ExecutionContext("app", ProjectType.REACT_SPA, output_path=root)
+    for i in range(5000):
+        context.write_plan.write_text(f"src/file{i}.txt", "x")
+    return context
+
+
+def test_overrunning_flush_removes_partial_project(tmp_path: Path) -> None:
+    context = plan_context(tmp_path)
+    result = flush_plan(context, policy=ExecutionPolicy(timeout_seconds=0.001))
+    assert not result.success
+    assert isinstance(result.error, DeadlineExceeded)
+    assert not context.project_root.exists()
+
+
+def test_failed_flush_keeps_existing_project_root(tmp_path: Path) -> None:
+    context = plan_context(tmp_path)
+    context.project_root.mkdir()
+    (context.project_root / "notes.txt").write_text("mine")
+    result = flush_plan(context, policy=ExecutionPolicy(timeout_seconds=0.001))
+    assert not result.success
+    assert (context.project_root / "notes.txt").read_text() == "mine"
@@ -0,0 +1,140 @@
+"""Tests for batch research: AIMD rate limiting, resuming and caching."""
+
+import io
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from src.ai import batch
+from src.ai.batch import (
+    AdaptiveRateLimiter,
+    BatchResearch,
+    PromptJob,
+    ProviderLimits,
+    completed_lines,
+    read_prompts,
+)
+
+
+def test_rate_grows_additively_and_halves_once_per_burst() -> None:
+    limiter = AdaptiveRateLimiter(ProviderLimits(rate=2.0, increase=0.5))
+    sent = limiter.acquire()
+    limiter.record(sent, throttled=False)
+    assert limiter.rate == pytest.approx(2.25)
+
+    in_flight = [limiter.acquire() for _ in range(3)]
+    for sent in in_flight:
+        limiter.record(sent, throttled=True)
+    assert limiter.rate == pytest.approx(1.125)
+    assert limiter.decreases == 1
+    assert limiter.tokens == 0.0
+
+    # A request sent after the decrease can lower the rate again
+    limiter.tokens = 1.0
+    limiter.record(limiter.acquire(), throttled=True)
+    assert limiter.decreases == 2
+
+
+def test_rate_stays_within_bounds() -> None:
+    limits = ProviderLimits(rate=1.0, min_rate=0.5, max_rate=1.2, burst=100)
+    limiter = AdaptiveRateLimiter(limits)
+    for _ in range(10):
+        limiter.record(limiter.acquire(), throttled=False)
+    assert limiter.rate == 1.2
+    for _ in range(10):
+        limiter.tokens = 1.0
+        limiter.record(limiter.acquire(), throttled=True)
+    assert limiter.rate == 0.5
+
+
+def test_read_prompts_numbers_input_lines() -> None:
+    stream = io.StringIO('"first"\n\n{"prompt": "second", "id": 7}\n')
+    jobs = [(job.line, job.prompt, job.id) for job in read_prompts(stream)]
+    assert jobs == [(1, "first", None), (3, "second", 7)]
+
+    with pytest.raises(ValueError, match="Line 1"):
+        list(read_prompts(io.StringIO('{"id": 1}\n')))
+
+
+def test_resume_skips_answered_lines_and_truncates_partial_record(
+    tmp_path: Path,
+) -> None:
+    output = tmp_path / "results.jsonl"
+    records = [
+        {"line": 1, "results": {"anthropic": "a"}},
+        {"line": 2, "results": {"anthropic_error": "HTTP 500"}},
+        {"line": 3, "results": {"anthropic": "c"}},
+        # The retry of line 2 supersedes the failed record
+        {"line": 2, "results": {"anthropic": "b"}},
+        {"line": 4, "results": {"anthropic": "d", "google_error": "timeout"}},
+    ]
+    complete = "".join(json.dumps(record) + "\n" for record in records)
+    output.write_text(complete + '{"line": 5, "res')
+
+    assert completed_lines(output) == {1, 2, 3}
+    assert output.read_text() == complete
+    assert completed_lines(tmp_path / "missing.jsonl") == set()
+
+
+@pytest.fixture
+def answers(monkeypatch: pytest.MonkeyPatch) -> Dict[str, Optional[str]]:
+    cached: Dict[str, Optional[str]] = {}
+    monkeypatch.setattr(batch, "cached_answer", lambda name, prompt: cached.get(prompt))
+    return cached
+
+
+def test_cache_hits_take_no_rate_tokens(
+    monkeypatch: pytest.MonkeyPatch, answers: Dict[str, Optional[str]]
+) -> None:
+    queried: List[str] = []
+
+    def query(prompt: str, timeout: float, use_cache: bool) -> str:
+        queried.append(prompt)
+        return prompt.upper()
+
+    monkeypatch.setitem(batch.QUERIES, "anthropic", query)
+    runner = BatchResearch(
+        {"anthropic": ProviderLimits(rate=1.0, burst=1)}, providers=["anthropic"]
+    )
+    limiter = runner.limiters["anthropic"]
+    answers["cached"] = "from cache"
+
+    assert runner._query("anthropic", "cached") == {"anthropic": "from cache"}
+    assert queried == []
+    assert limiter.tokens == 1.0
+    assert limiter.rate == 1.0
+
+    assert runner._query("anthropic", "fresh") == {"anthropic": "FRESH"}
+    assert queried == ["fresh"]
+    assert limiter.tokens < 1.0
+    assert limiter.rate > 1.0
+
+
+def test_run_writes_records_and_reports_errors(
+    monkeypatch: pytest.MonkeyPatch, answers: Dict[str, Optional[str]]
+) -> None:
+    def query(prompt: str, timeout: float, use_cache: bool) -> str:
+        if prompt == "bad":
+            raise RuntimeError("provider down")
+        return prompt.upper()
+
+    monkeypatch.setitem(batch.QUERIES, "anthropic", query)
+    runner = BatchResearch(
+        {"anthropic": ProviderLimits(rate=1000.0, burst=10)}, providers=["anthropic"]
+    )
+    jobs = [PromptJob(1, "ok", id="a"), PromptJob(2, "bad"), PromptJob(3, "done")]
+    output = io.StringIO()
+
+    report = runner.run(jobs, output, skip={3})
+
+    records = sorted(
+        (json.loads(line) for line in output.getvalue().splitlines()),
+        key=lambda record: record["line"],
+    )
+    assert [(r["line"], r.get("id"), r["results"]) for r in records] == [
+        (1, "a", {"anthropic": "OK"}),
+        (2, None, {"anthropic_error": "provider down"}),
+    ]
+    assert (report.completed, report.failed, report.resumed) == (2, 1, 1)
@@ -0,0 +1,172 @@
+"""Tests for the disk-backed research response cache."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator, List
+
+import pytest
+
+from src.ai import cache as cache_module
+from src.ai.cache import ResponseCache, cache_key
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=clock))
+    return clock
+
+
+@pytest.fixture
+def caches() -> Iterator[List[ResponseCache]]:
+    opened: List[ResponseCache] = []
+    yield opened
+    for cache in opened:
+        cache.close()
+
+
+def open_cache(
+    caches: List[ResponseCache],
+    path: Path,
+    ttl_seconds: float = 3600,
+    max_entries: int = 100,
+    memory_entries: int = 10,
+) -> ResponseCache:
+    cache = ResponseCache(
+        path / "research.sqlite3", ttl_seconds, max_entries, memory_entries
+    )
+    caches.append(cache)
+    return cache
+
+
+def test_key_ignores_whitespace_but_not_query_settings() -> None:
+    key = cache_key("anthropic", "model", 512, "What is  WAL?\n")
+    assert key == cache_key("anthropic", "model", 512, " What is WAL? ")
+    assert key != cache_key("anthropic", "model", 1024, "What is WAL?")
+    assert key != cache_key("google", "model", 512, "What is WAL?")
+    assert key != cache_key("anthropic", "model", 512, "What is wal?")
+
+
+def test_responses_persist_across_instances(
+    tmp_path: Path, caches: List[ResponseCache]
+) -> None:
+    open_cache(caches, tmp_path).put("anthropic", "model", "k", "answer")
+    cache = open_cache(caches, tmp_path)
+    assert cache.get("k") == "answer"
+    assert cache.get("missing") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_entries_expire_after_ttl(
+    tmp_path: Path, caches: List[ResponseCache], clock: Clock
+) -> None:
+    cache = open_cache(caches, tmp_path, ttl_seconds=60)
+    cache.put("anthropic", "model", "k", "answer")
+    clock.now += 59
+    assert cache.get("k") == "answer"
+    clock.now += 1
+    # Expired both in memory and on disk
+    assert cache.get("k") is None
+    assert open_cache(caches, tmp_path, ttl_seconds=60).get("k") is None
+
+
+def test_database_evicts_least_recently_used(
+    tmp_path: Path, caches: List[ResponseCache], clock: Clock
+) -> None:
+    cache = open_cache(caches, tmp_path, max_entries=10, memory_entries=0)
+    for i in range(10):
+        clock.now += 1
+        cache.put("anthropic", "model", f"k{i}", str(i))
+    clock.now += 1
+    assert cache.get("k0") == "0"
+
+    clock.now += 1
+    cache.put("anthropic", "model", "k10", "10")
+
+    # Trimmed to 90% of max_entries, oldest accesses first
+    assert cache.stats()["entries"] == 9
+    assert cache.evictions == 2
+    assert cache.get("k1") is None
+    assert cache.get("k2") is None
+    assert cache.get("k0") == "0"
+    assert cache.get("k10") == "10"
+
+
+def test_hot_key_served_from_memory_survives_eviction(
+    tmp_path: Path, caches: List[ResponseCache], clock: Clock
+) -> None:
+    cache = open_cache(caches, tmp_path, max_entries=10, memory_entries=100)
+    cache.put("anthropic", "model", "hot", "answer")
+    for i in range(10):
+        clock.now += 0.01
+        cache.put("anthropic", "model", f"k{i}", str(i))
+        assert cache.get("hot") == "answer"
+
+    assert cache.memory_hits == 10
+    assert cache.evictions == 2
+    cache.close()
+    caches.remove(cache)
+    reopened = open_cache(caches, tmp_path)
+    assert reopened.get("hot") == "answer"
+    assert reopened.get("k0") is None
+
+
+def test_memory_hits_reach_the_database_after_an_interval(
+    tmp_path: Path, caches: List[ResponseCache], clock: Clock
+) -> None:
+    cache = open_cache(caches, tmp_path)
+    cache.put("anthropic", "model", "k", "answer")
+    stored = clock.now
+
+    def accessed() -> float:
+        (value,) = cache._db.execute(
+            "SELECT accessed FROM responses WHERE key = 'k'"
+        ).fetchone()
+        return float(value)
+
+    clock.now += 0.5
+    assert cache.get("k") == "answer"
+    assert accessed() == stored
+    clock.now += 0.5
+    assert cache.get("k") == "answer"
+    assert accessed() == clock.now
+
+
+def test_memory_front_is_bounded_lru(
+    tmp_path: Path, caches: List[ResponseCache]
+) -> None:
+    cache = open_cache(caches, tmp_path, memory_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put("anthropic", "model", key, key)
+    assert list(cache._memory) == ["b", "c"]
+
+    assert cache.get("a") == "a"
+    assert cache.memory_hits == 0
+    assert list(cache._memory) == ["c", "a"]
+    assert cache.get("c") == "c"
+    assert cache.memory_hits == 1
+
+
+def test_clear_and_disabled_cache(
+    tmp_path: Path, caches: List[ResponseCache], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = open_cache(caches, tmp_path)
+    cache.put("anthropic", "model", "k", "answer")
+    cache.clear()
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+    monkeypatch.setattr(cache_module, "_cache", cache)
+    monkeypatch.setattr(cache_module, "_cache_enabled", True)
+    assert cache_module.get_cache() is cache
+    cache_module.configure_cache(enabled=False)
+    assert cache_module.get_cache() is None
@@ -0,0 +1,66 @@
+"""Tests for streaming research answers from a local mock provider."""
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from scripts.mock_provider import TOKEN, MockProviderServer
+from src.ai import research
+from src.ai.cache import ResponseCache, configure_cache
+from src.ai.clients import ProviderClient
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Iterator[MockProviderServer]:
+    with MockProviderServer(tokens=3) as server:
+        client = ProviderClient("anthropic", base_url=server.url)
+        monkeypatch.setattr(research, "get_client", lambda name: client)
+        monkeypatch.setattr(research, "ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setattr(research, "PERPLEXITY_API_KEY", None)
+        monkeypatch.setattr(research, "GOOGLE_API_KEY", None)
+        yield server
+        client.close()
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[ResponseCache]:
+    cache = ResponseCache(tmp_path / "research.sqlite3")
+    configure_cache(cache)
+    yield cache
+    configure_cache()
+    cache.close()
+
+
+def test_stream_yields_tokens_then_serves_cache(
+    server: MockProviderServer, cache: ResponseCache
+) -> None:
+    chunks = list(research.stream_anthropic("Explain WAL"))
+    assert chunks == [TOKEN] * 3
+    assert server.requests == 1
+
+    assert list(research.stream_anthropic("Explain  WAL")) == [TOKEN * 3]
+    assert server.requests == 1
+
+
+def test_closed_stream_is_not_cached(
+    server: MockProviderServer, cache: ResponseCache
+) -> None:
+    stream = research.stream_anthropic("Explain WAL")
+    assert next(stream) == TOKEN
+    stream.close()
+
+    assert list(research.stream_anthropic("Explain WAL")) == [TOKEN] * 3
+    assert server.requests == 2
+
+
+def test_deep_research_stream_reports_failing_providers(
+    server: MockProviderServer, cache: ResponseCache
+) -> None:
+    events = list(research.deep_research_stream("Explain WAL", deadline=10))
+    answer = [chunk for name, chunk in events if name == "anthropic"]
+    errors = {name: message for name, message in events if name.endswith("_error")}
+
+    assert "".join(answer) == TOKEN * 3
+    assert set(errors) == {"perplexity_error", "google_error"}
+    assert "PERPLEXITY_API_KEY" in errors["perplexity_error"]
@@ -0,0 +1,81 @@
+"""Tests for keying, building and cloning cached project skeletons."""
+
+from pathlib import Path
+
+import pytest
+
+from src.core.core_types import ExecutionContext, ModuleResult, ProjectType
+from src.core.module import BaseModule
+from src.core.skeleton_cache import SkeletonCache
+
+
+class ConfigModule(BaseModule):
+    def __init__(self) -> None:
+        super().__init__("config", "Writes name-independent config")
+        self.builds = 0
+
+    def plan_skeleton(self, context: ExecutionContext) -> None:
+        self.builds += 1
+        context.write_plan.mkdir("src")
+        context.write_plan.write_text(
+            "tsconfig.json", f'{{"variant": "{context.template_variant}"}}'
+        )
+
+    def execute(self, context: ExecutionContext) -> ModuleResult:
+        return ModuleResult(self.name, True, "done")
+
+
+def context(name: str = "app", variant: str = "default") -> ExecutionContext:
+    return ExecutionContext(name, ProjectType.REACT_SPA, template_variant=variant)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> SkeletonCache:
+    return SkeletonCache(tmp_path / "skeletons")
+
+
+def test_key_depends_on_type_and_variant_not_name(cache: SkeletonCache) -> None:
+    modules = [ConfigModule()]
+    key = cache.key(context("one"), modules)
+    assert key == cache.key(context("two"), modules)
+    assert key.startswith("react-spa-default-")
+    assert key != cache.key(context(variant="minimal"), modules)
+    assert cache.key(context(variant="a/b c"), modules).startswith("react-spa-a_b_c-")
+
+    other = ExecutionContext("app", ProjectType.VUE_NUXT)
+    assert cache.key(other, modules) != key
+
+
+def test_skeleton_is_built_once_and_cloned(
+    cache: SkeletonCache, tmp_path: Path
+) -> None:
+    module = ConfigModule()
+    skeleton = cache.get(context(), [module])
+    assert cache.get(context("other"), [module]) is skeleton
+    # A new cache instance reuses the skeleton already on disk
+    SkeletonCache(cache.cache_dir).get(context(), [module])
+    assert module.builds == 1
+
+    root = tmp_path / "project"
+    assert skeleton.materialize(root) in {"reflink", "tar"}
+    assert (root / "src").is_dir()
+    assert (root / "tsconfig.json").read_text() == '{"variant": "default"}'
+
+
+def test_hardlinks_are_used_only_when_allowed(tmp_path: Path) -> None:
+    cache = SkeletonCache(tmp_path / "skeletons", allow_hardlinks=True)
+    skeleton = cache.get(context(), [ConfigModule()])
+    assert skeleton.materialize(tmp_path / "project") in {"reflink", "hardlink"}
+
+
+def test_new_template_version_replaces_stale_skeleton(
+    cache: SkeletonCache, tmp_path: Path
+) -> None:
+    module = ConfigModule()
+    old = cache.get(context(), [module])
+    cache._versions = {(ConfigModule,): "0" * 16}
+    new = cache.get(context(), [module])
+
+    assert new.path != old.path
+    assert not old.path.exists()
+    assert [path.name for path in cache.cache_dir.iterdir()] == [new.path.name]
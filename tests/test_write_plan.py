@@ -0,0 +1,89 @@
+"""Tests for planning scaffold writes in memory and flushing them in one pass."""
+
+import threading
+from pathlib import Path, PurePosixPath
+
+import pytest
+
+from src.core.write_plan import FlushCancelled, WritePlan
+
+
+def test_later_writes_replace_earlier_ones() -> None:
+    plan = WritePlan()
+    plan.write_text("README.md", "first")
+    plan.write_json("README.md", {"second": True})
+    assert plan.collapsed_writes == 1
+    assert plan.files() == [(PurePosixPath("README.md"), b'{\n  "second": true\n}')]
+
+
+def test_higher_rank_wins_regardless_of_order() -> None:
+    plan = WritePlan()
+    plan.scoped(2).write_text("config.json", "module 2")
+    plan.scoped(1).write_text("config.json", "module 1")
+    plan.scoped(2).write_text("other.txt", "module 2")
+    plan.scoped(2).write_text("other.txt", "module 2 again")
+    assert dict(plan.files()) == {
+        PurePosixPath("config.json"): b"module 2",
+        PurePosixPath("other.txt"): b"module 2 again",
+    }
+
+
+@pytest.mark.parametrize("path", ["/etc/passwd", "../outside", "src/../../x"])
+def test_paths_must_stay_below_the_root(path: str) -> None:
+    with pytest.raises(ValueError):
+        WritePlan().write_text(path, "")
+
+
+def test_directories_are_reduced_to_the_needed_set() -> None:
+    plan = WritePlan()
+    plan.mkdir("src")
+    plan.mkdir("src/components")
+    plan.mkdir("public")
+    plan.write_text("src/app/main.ts", "")
+    assert plan.leaf_dirs() == [
+        PurePosixPath("public"),
+        PurePosixPath("src/components"),
+    ]
+    assert [str(path) for path in plan.directories()] == [
+        "public",
+        "src",
+        "src/app",
+        "src/components",
+    ]
+    assert plan.has_dir("src/app")
+    assert not plan.has_dir("docs")
+
+
+def test_flush_writes_every_file_once(tmp_path: Path) -> None:
+    source = tmp_path / "source.txt"
+    source.write_text("copied")
+    plan = WritePlan()
+    plan.mkdir("empty")
+    plan.write_text("src/index.ts", "export {}\n")
+    plan.write_chunks("src/big.txt", [b"a" * 10, b"b" * 5])
+    plan.copy_file("copy.txt", source)
+
+    root = tmp_path / "project"
+    stats = plan.flush(root)
+
+    assert stats.as_dict() == {
+        "directories": 2,
+        "files": 3,
+        "bytes_written": 10 + 15 + 6,
+        "collapsed_writes": 0,
+    }
+    assert (root / "empty").is_dir()
+    assert (root / "src" / "big.txt").read_bytes() == b"a" * 10 + b"b" * 5
+    assert (root / "copy.txt").read_text() == "copied"
+
+
+def test_flush_stops_once_cancelled(tmp_path: Path) -> None:
+    plan = WritePlan()
+    for i in range(5):
+        plan.write_text(f"file{i}.txt", str(i))
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(FlushCancelled):
+        plan.flush(tmp_path / "project", cancel=cancel)
+    assert list((tmp_path / "project").iterdir()) == []
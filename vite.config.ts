@@ -15,6 +15,17 @@ export default defineConfig({
       },
     },
   },
+  build: {
+    rollupOptions: {
+      // src/web/frontend.py caches names of this form as immutable
+      output: {
+        entryFileNames: 'assets/[name]-[hash].js',
+        chunkFileNames: 'assets/[name]-[hash].js',
+        assetFileNames: 'assets/[name]-[hash][extname]',
+        hashCharacters: 'hex',
+      },
+    },
+  },
   resolve: {
     alias: {
       '@': path.resolve(__dirname, './src'),